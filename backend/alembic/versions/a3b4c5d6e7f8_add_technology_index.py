@@ -0,0 +1,87 @@
+"""Add technology dictionary and application links
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a3b4c5d6e7f8'
+down_revision: Union[str, Sequence[str], None] = 'f2a3b4c5d6e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table(
+        'technology',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('key'),
+    )
+    op.create_index(
+        'ix_technology_name_trgm',
+        'technology',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_table(
+        'applicationtechnology',
+        sa.Column('application_id', sa.UUID(), nullable=False),
+        sa.Column('technology_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(['application_id'], ['application.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['technology_id'], ['technology.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('application_id', 'technology_id'),
+    )
+    op.create_index(
+        'ix_applicationtechnology_user_id_technology_id',
+        'applicationtechnology',
+        ['user_id', 'technology_id'],
+    )
+
+    # Backfill from tech_stack; same tokenizing as app/core/technologies.parse()
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE tech_token ON COMMIT DROP AS
+        SELECT id AS application_id, user_id, lower(name) AS key, name
+        FROM (
+            SELECT a.id, a.user_id,
+                   regexp_replace(btrim(part), '\\s+', ' ', 'g') AS name
+            FROM application a,
+                 regexp_split_to_table(a.tech_stack, '[,/&]+|\\s+\\+\\s+') AS part
+            WHERE a.tech_stack IS NOT NULL
+        ) parts
+        WHERE length(name) > 1
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO technology (key, name)
+        SELECT DISTINCT ON (key) key, name FROM tech_token ORDER BY key, name
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO applicationtechnology (application_id, technology_id, user_id)
+        SELECT DISTINCT t.application_id, tech.id, t.user_id
+        FROM tech_token t JOIN technology tech ON tech.key = t.key
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applicationtechnology_user_id_technology_id', table_name='applicationtechnology')
+    op.drop_table('applicationtechnology')
+    op.drop_index('ix_technology_name_trgm', table_name='technology')
+    op.drop_table('technology')
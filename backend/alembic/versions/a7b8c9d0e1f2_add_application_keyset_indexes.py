@@ -0,0 +1,26 @@
+"""Add composite indexes for application keyset pagination
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, Sequence[str], None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_application_user_id_updated_at_id', 'application', ['user_id', 'updated_at', 'id'])
+    op.create_index('ix_application_user_id_status_updated_at', 'application', ['user_id', 'status', 'updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_user_id_status_updated_at', table_name='application')
+    op.drop_index('ix_application_user_id_updated_at_id', table_name='application')
@@ -0,0 +1,52 @@
+"""Add full-text search vectors to applications and contacts
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'b4c5d6e7f8a9'
+down_revision: Union[str, Sequence[str], None] = 'a3b4c5d6e7f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Weights and config must match app/core/search.py
+SEARCH_VECTORS = {
+    'application': """
+        setweight(to_tsvector('simple', coalesce(company_name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(position_title, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(tech_stack, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(notes, '')), 'D')
+    """,
+    'networkcontact': """
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(company, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(notes, '')), 'D')
+    """,
+}
+
+
+def upgrade() -> None:
+    # Generated columns are filled for existing rows when added
+    for table, expression in SEARCH_VECTORS.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        op.create_index(
+            f'ix_{table}_search_vector', table, ['search_vector'], postgresql_using='gin',
+        )
+    # GET /search filters contacts by owner before ranking
+    op.create_index('ix_networkcontact_user_id', 'networkcontact', ['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_networkcontact_user_id', table_name='networkcontact')
+    for table in SEARCH_VECTORS:
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,131 @@
+"""Add duplicate detection keys to applications
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+import hashlib
+import re
+import unicodedata
+from typing import Optional, Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c5d6e7f8a9b0'
+down_revision: Union[str, Sequence[str], None] = 'b4c5d6e7f8a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Frozen copy of app/core/duplicates.py as of this revision, so later changes
+# to the live normalizer don't change what this migration writes
+_ID_PARAMS = {"jk", "vjk", "currentjobid", "jobid", "job_id", "jl", "gh_jid", "id"}
+_LISTING_PATH = re.compile(r"^(/jobs(/(search|collections)(/.*)?)?|/search(/.*)?)$", re.IGNORECASE)
+_LINKEDIN_JOB_PATH = re.compile(r"^/jobs/view/(?:[^/]*-)?(\d+)$")
+_LEGAL_SUFFIXES = {
+    "ag", "bv", "co", "company", "corp", "corporation", "gmbh", "inc", "kg", "llc", "ltd",
+    "limited", "plc", "sa", "se",
+}
+_TITLE_NOISE = {"all", "gender", "genders", "gn", "mwd", "wmd", "mfd", "fmd", "mfx", "fmx"}
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _normalize_url(url: str) -> Optional[str]:
+    url = url.strip()
+    if "//" not in url:
+        url = "//" + url
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if not host:
+        return None
+    path = parts.path.rstrip("/")
+    query = sorted(
+        (name.lower(), value) for name, value in parse_qsl(parts.query) if name.lower() in _ID_PARAMS
+    )
+    if host.endswith("linkedin.com"):
+        job_id = dict(query).get("currentjobid")
+        match = _LINKEDIN_JOB_PATH.match(path)
+        if job_id or match:
+            return f"linkedin.com/jobs/view/{job_id or match.group(1)}"
+    if not query and _LISTING_PATH.match(path or "/"):
+        return None
+    return urlunsplit(("", host, path, urlencode(query), "")).removeprefix("//")
+
+
+def _words(text: str) -> list[str]:
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return _NON_WORD.sub(" ", text.lower()).split()
+
+
+def _keys(company_name: str, position_title: str, job_url: Optional[str]) -> dict:
+    normalized = _normalize_url(job_url) if job_url else None
+    company = [w for w in _words(company_name) if w not in _LEGAL_SUFFIXES]
+    title = [w for w in _words(position_title) if len(w) > 1 and w not in _TITLE_NOISE]
+    return {
+        "job_url_hash": hashlib.sha256(normalized.encode()).hexdigest() if normalized else None,
+        "dedupe_key": f"{' '.join(company)}|{' '.join(title)}",
+    }
+
+
+def upgrade() -> None:
+    op.add_column('application', sa.Column('job_url_hash', sa.String(length=64), nullable=True))
+    op.add_column('application', sa.Column('dedupe_key', sa.String(), nullable=True))
+
+    # Backfill with the same normalization the API uses. Where a user already
+    # saved a posting more than once, only the oldest keeps its URL hash so
+    # the unique index can be built; the copies stay visible for cleanup.
+    application = sa.table(
+        'application',
+        sa.column('id'), sa.column('user_id'), sa.column('company_name'), sa.column('position_title'),
+        sa.column('job_url'), sa.column('created_at'),
+        sa.column('job_url_hash'), sa.column('dedupe_key'),
+    )
+    bind = op.get_bind()
+    # Server-side (named) cursor: rows arrive BATCH_SIZE at a time instead of
+    # all at once; the updates run alongside it in the same transaction
+    rows = bind.execution_options(stream_results=True, yield_per=BATCH_SIZE).execute(
+        sa.select(
+            application.c.id, application.c.user_id, application.c.company_name,
+            application.c.position_title, application.c.job_url,
+        ).order_by(application.c.created_at, application.c.id)
+    )
+    update = (
+        application.update()
+        .where(application.c.id == sa.bindparam('_id'))
+        .values(job_url_hash=sa.bindparam('job_url_hash'), dedupe_key=sa.bindparam('dedupe_key'))
+    )
+    seen = set()
+    batch = []
+    for row in rows:
+        keys = _keys(row.company_name, row.position_title, row.job_url)
+        if (row.user_id, keys['job_url_hash']) in seen:
+            keys['job_url_hash'] = None
+        elif keys['job_url_hash']:
+            seen.add((row.user_id, keys['job_url_hash']))
+        batch.append({'_id': row.id, **keys})
+        if len(batch) == BATCH_SIZE:
+            bind.execute(update, batch)
+            batch = []
+    if batch:
+        bind.execute(update, batch)
+
+    op.create_index(
+        'ix_application_user_id_job_url_hash',
+        'application',
+        ['user_id', 'job_url_hash'],
+        unique=True,
+        postgresql_where=sa.text('job_url_hash IS NOT NULL'),
+    )
+    op.create_index('ix_application_user_id_dedupe_key', 'application', ['user_id', 'dedupe_key'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_user_id_dedupe_key', table_name='application')
+    op.drop_index('ix_application_user_id_job_url_hash', table_name='application')
+    op.drop_column('application', 'dedupe_key')
+    op.drop_column('application', 'job_url_hash')
@@ -0,0 +1,45 @@
+"""Add application_count and last_milestone to user
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, Sequence[str], None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user', sa.Column('application_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('user', sa.Column('last_milestone', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill the counter, and mark milestones already passed (with the
+    # default 10/25/50/100) as notified so nobody gets a late email
+    op.execute(
+        """
+        UPDATE "user" u
+        SET application_count = c.total,
+            last_milestone = CASE
+                WHEN c.total >= 100 THEN 100
+                WHEN c.total >= 50 THEN 50
+                WHEN c.total >= 25 THEN 25
+                WHEN c.total >= 10 THEN 10
+                ELSE 0
+            END
+        FROM (SELECT user_id, COUNT(*) AS total FROM application GROUP BY user_id) c
+        WHERE c.user_id = u.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('user', 'last_milestone')
+    op.drop_column('user', 'application_count')
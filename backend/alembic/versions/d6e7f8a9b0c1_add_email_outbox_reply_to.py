@@ -0,0 +1,25 @@
+"""Add reply_to to the email outbox
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd6e7f8a9b0c1'
+down_revision: Union[str, Sequence[str], None] = 'c5d6e7f8a9b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('emailoutbox', sa.Column('reply_to', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('emailoutbox', 'reply_to')
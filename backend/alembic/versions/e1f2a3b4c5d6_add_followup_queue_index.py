@@ -0,0 +1,30 @@
+"""Add partial index for the followup queue
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e1f2a3b4c5d6'
+down_revision: Union[str, Sequence[str], None] = 'd0e1f2a3b4c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_application_followup_queue',
+        'application',
+        ['user_id', 'followed_up_at', 'updated_at'],
+        postgresql_where=sa.text("status NOT IN ('GHOSTED', 'REJECTED')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_followup_queue', table_name='application')
@@ -0,0 +1,33 @@
+"""Add denormalized points total to user
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user', sa.Column('points', sa.Integer(), nullable=False, server_default='0'))
+    # Backfill from the ledger
+    op.execute(
+        """
+        UPDATE "user" SET points = COALESCE(
+            (SELECT SUM(ph.points) FROM pointhistory ph WHERE ph.user_id = "user".id), 0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('user', 'points')
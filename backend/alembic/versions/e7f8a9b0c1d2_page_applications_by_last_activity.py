@@ -0,0 +1,32 @@
+"""Page applications by last activity
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e7f8a9b0c1d2'
+down_revision: Union[str, Sequence[str], None] = 'd6e7f8a9b0c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # updated_at is nullable; the list endpoint falls back to created_at
+    op.create_index(
+        'ix_application_user_id_activity_id',
+        'application',
+        ['user_id', sa.text('coalesce(updated_at, created_at)'), 'id'],
+    )
+    op.drop_index('ix_application_user_id_updated_at_id', table_name='application')
+
+
+def downgrade() -> None:
+    op.create_index('ix_application_user_id_updated_at_id', 'application', ['user_id', 'updated_at', 'id'])
+    op.drop_index('ix_application_user_id_activity_id', table_name='application')
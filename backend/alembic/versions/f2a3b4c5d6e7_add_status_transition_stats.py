@@ -0,0 +1,91 @@
+"""Add status transition and dwell-time tables
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'f2a3b4c5d6e7'
+down_revision: Union[str, Sequence[str], None] = 'e1f2a3b4c5d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The type already exists (application.status)
+application_status = postgresql.ENUM(name='applicationstatus', create_type=False)
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_applicationhistory_application_id_changed_at',
+        'applicationhistory',
+        ['application_id', 'changed_at'],
+    )
+    op.create_table(
+        'statustransition',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('old_status', application_status, nullable=False),
+        sa.Column('new_status', application_status, nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'old_status', 'new_status'),
+    )
+    op.create_table(
+        'statusdwell',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('status', application_status, nullable=False),
+        sa.Column('bucket', sa.Integer(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'status', 'bucket'),
+    )
+
+    # Backfill from history; same rules as app/core/status_stats.py
+    # (rebuild_status_stats.py recomputes both tables at any time)
+    op.execute(
+        """
+        INSERT INTO statustransition (user_id, old_status, new_status, count)
+        SELECT a.user_id, COALESCE(h.old_status, 'APPLIED'), h.new_status, COUNT(*)
+        FROM applicationhistory h JOIN application a ON a.id = h.application_id
+        GROUP BY 1, 2, 3
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO statusdwell (user_id, status, bucket, count)
+        SELECT user_id, status,
+            CASE
+                WHEN dwell < INTERVAL '1 day' THEN 0
+                WHEN dwell < INTERVAL '3 days' THEN 1
+                WHEN dwell < INTERVAL '7 days' THEN 2
+                WHEN dwell < INTERVAL '14 days' THEN 3
+                WHEN dwell < INTERVAL '30 days' THEN 4
+                WHEN dwell < INTERVAL '60 days' THEN 5
+                ELSE 6
+            END,
+            COUNT(*)
+        FROM (
+            SELECT a.user_id,
+                COALESCE(h.old_status, 'APPLIED') AS status,
+                h.changed_at - COALESCE(
+                    LAG(h.changed_at) OVER (PARTITION BY h.application_id ORDER BY h.changed_at),
+                    a.created_at
+                ) AS dwell
+            FROM applicationhistory h JOIN application a ON a.id = h.application_id
+        ) steps
+        WHERE dwell IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('statusdwell')
+    op.drop_table('statustransition')
+    op.drop_index('ix_applicationhistory_application_id_changed_at', table_name='applicationhistory')
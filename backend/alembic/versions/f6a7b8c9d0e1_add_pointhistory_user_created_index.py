@@ -0,0 +1,24 @@
+"""Index point history by user and creation time
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_pointhistory_user_id_created_at', 'pointhistory', ['user_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pointhistory_user_id_created_at', table_name='pointhistory')
@@ -1,38 +1,106 @@
-from typing import Generator
+from typing import AsyncGenerator, Callable, TypeVar
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from app.db import session as db_session
 from app.models.user import User
-from app.core import security
+from app.schemas import user as user_schema
+from app.core import principals, security
 from app.core.config import settings
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"/api/v1/access-token"
 )
 
-def get_db() -> Generator:
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
+T = TypeVar("T")
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> User:
+
+class Database:
+    """
+    Request-scoped handle for running ORM work.
+
+    Endpoint logic is written against a plain sync Session and handed to run().
+    With DB_ASYNC it executes on the AsyncSession's greenlet over asyncpg, so no
+    worker thread is held while waiting on Postgres; otherwise it runs on the
+    threadpool as before.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        if isinstance(self.session, Session):
+            return await run_in_threadpool(fn, self.session, *args, **kwargs)
+        return await self.session.run_sync(fn, *args, **kwargs)
+
+
+async def get_db() -> AsyncGenerator[Database, None]:
+    if db_session.AsyncSessionLocal is not None:
+        async with db_session.AsyncSessionLocal() as session:
+            yield Database(session)
+    else:
+        db = db_session.SessionLocal()
+        try:
+            yield Database(db)
+        finally:
+            db.close()
+
+
+def _token_subject(token: str) -> UUID:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
         )
-        token_data = payload.get("sub")
-    except (JWTError, ValueError):
+        return UUID(payload.get("sub"))
+    except (JWTError, ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = db.query(User).filter(User.id == token_data).first()
+
+
+async def get_current_principal(
+    db: Database = Depends(get_db), token: str = Depends(reusable_oauth2)
+) -> user_schema.User:
+    """
+    The authenticated user as a read-only snapshot, served from the principal
+    cache when possible. Use get_current_user when the endpoint writes to the user.
+    """
+    user_id = _token_subject(token)
+    principal = principals.get(user_id)
+    if principal is None:
+        def load(session: Session):
+            user = session.get(User, user_id)
+            return principals.remember(user) if user else None
+
+        principal = await db.run(load)
+        if principal is None:
+            raise HTTPException(status_code=404, detail="User not found")
+    return principal
+
+
+async def get_current_user_id(
+    principal: user_schema.User = Depends(get_current_principal),
+) -> UUID:
+    return principal.id
+
+
+async def get_current_user(
+    db: Database = Depends(get_db), token: str = Depends(reusable_oauth2)
+) -> User:
+    """The authenticated user loaded into the request session, for endpoints that modify it."""
+    user_id = _token_subject(token)
+
+    def load(session: Session):
+        user = session.get(User, user_id)
+        if user:
+            principals.remember(user)
+        return user
+
+    user = await db.run(load)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
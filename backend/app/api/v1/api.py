@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import user, applications, network, login, share
+from app.api.v1.endpoints import user, applications, network, login, share, metrics, analytics, search
 
 api_router = APIRouter()
 api_router.include_router(user.router, prefix="/user", tags=["user"])
@@ -7,3 +7,6 @@ api_router.include_router(applications.router, prefix="/applications", tags=["ap
 api_router.include_router(network.router, prefix="/network", tags=["network"])
 api_router.include_router(login.router, tags=["login"])
 api_router.include_router(share.router, prefix="/share", tags=["share"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
@@ -0,0 +1,192 @@
+from datetime import date
+from typing import Any, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.api import deps
+from app.core import analytics, technologies
+
+router = APIRouter()
+
+
+@router.get("/summary")
+async def read_summary(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    since: Optional[date] = None,
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Funnel and key metric counts, plus applications per status.
+    `since` limits every figure to applications applied on or after that date.
+    """
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("summary", since),
+            lambda: analytics.summary(session, current_user_id, since),
+        )
+
+    return await db.run(work)
+
+
+@router.get("/transitions")
+async def read_transitions(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    since: Optional[date] = None,
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Status transition counts (source, target, count) from the application
+    history, and the number of applications without any history.
+    """
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("transitions", since),
+            lambda: analytics.transitions(session, current_user_id, since),
+        )
+
+    return await db.run(work)
+
+
+@router.get("/dwell")
+async def read_dwell(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Time spent in each status before the next change, as a histogram per
+    status over the `buckets` labels.
+    """
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("dwell",),
+            lambda: analytics.dwell(session, current_user_id),
+        )
+
+    return await db.run(work)
+
+
+@router.get("/timeline")
+async def read_timeline(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    weeks: int = Query(default=26, ge=1, le=104),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Applications and responses per week for the last `weeks` weeks, oldest first.
+    """
+    today = date.today()
+
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("timeline", today, weeks),
+            lambda: analytics.timeline(session, current_user_id, today, weeks),
+        )
+
+    return await db.run(work)
+
+
+@router.get("/top")
+async def read_top(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    dimension: analytics.Dimension = "company",
+    limit: int = Query(default=10, ge=1, le=50),
+    since: Optional[date] = None,
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Most frequent companies, job boards, locations or technologies, with
+    response and offer counts.
+    """
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("top", dimension, limit, since),
+            lambda: analytics.top(session, current_user_id, dimension, limit, since),
+        )
+
+    return await db.run(work)
+
+
+@router.get("/industries")
+async def read_industries(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    since: Optional[date] = None,
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Applications grouped into industries by company name, with the number of
+    companies, responses and offers in each.
+    """
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("industries", since),
+            lambda: analytics.industries(session, current_user_id, since),
+        )
+
+    return await db.run(work)
+
+
+@router.get("/locations")
+async def read_locations(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    since: Optional[date] = None,
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Applications per location with a count per status, for the map.
+    """
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("locations", since),
+            lambda: analytics.locations(session, current_user_id, since),
+        )
+
+    return await db.run(work)
+
+
+@router.get("/technologies")
+async def read_technologies(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    q: str = Query(default="", max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Technologies in the user's applications whose name contains `q`, with
+    how many applications mention each, most used first.
+    """
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("technologies", q, limit),
+            lambda: technologies.search(session, current_user_id, q, limit),
+        )
+
+    return await db.run(work)
+
+
+@router.get("/technologies/cooccurrence")
+async def read_cooccurrence(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    technology: str,
+    limit: int = Query(default=10, ge=1, le=50),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Technologies that appear in the same applications as `technology`, with
+    how many applications they share.
+    """
+    def work(session: Session):
+        return analytics.cached(
+            session, current_user_id, ("cooccurrence", technologies.normalize(technology), limit),
+            lambda: technologies.co_occurrence(session, current_user_id, technology, limit),
+        )
+
+    return await db.run(work)
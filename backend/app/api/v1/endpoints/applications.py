@@ -1,8 +1,18 @@
-from typing import Any, List
-from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Body
-from sqlalchemy.orm import Session
+import base64
+import csv
+import io
+from typing import Any, List, Optional
+from datetime import date, datetime, time, timedelta
+from uuid import UUID, uuid4
+from fastapi import APIRouter, Depends, HTTPException, Body, Query, Request, Response
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import func, insert, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 from app.api import deps
+from app.core import duplicates, followup, milestones, status_stats, technologies
+from app.core.working_days import berlin_today
+from app.db.data_version import bump_data_version
 from app.models import application as application_model
 from app.models import user as user_model
 from app.schemas import application as application_schema
@@ -10,81 +20,337 @@ from app.models.application import ApplicationStatus
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Upper bound on rows accepted by POST /bulk
+BULK_MAX_ROWS = 1000
+
+
+# Sort key of GET /applications/: last update, or creation for rows never
+# updated (updated_at is nullable); matches ix_application_user_id_activity_id
+_LAST_ACTIVITY = func.coalesce(application_model.Application.updated_at, application_model.Application.created_at)
+
+
+def _encode_cursor(application: application_model.Application) -> str:
+    last_activity = application.updated_at or application.created_at
+    raw = f"{last_activity.isoformat()}|{application.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        last_activity, id_ = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(last_activity), UUID(id_)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/", response_model=List[application_schema.Application])
-def read_applications(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(deps.get_db),
-    current_user: user_model.User = Depends(deps.get_current_user),
+async def read_applications(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
+    status: Optional[List[ApplicationStatus]] = Query(default=None),
+    company: Optional[str] = None,
+    source: Optional[str] = None,
+    min_priority: Optional[int] = None,
+    applied_from: Optional[date] = None,
+    applied_to: Optional[date] = None,
+    updated_from: Optional[date] = None,
+    updated_to: Optional[date] = None,
+    followup_class: Optional[followup.FollowupClass] = Query(default=None, alias="followup"),
+    technology: Optional[str] = None,
+    db: deps.Database = Depends(deps.get_db),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
 ) -> Any:
     """
-    Retrieve applications.
+    Retrieve applications, most recently updated first.
+    Pages with a cursor: pass the X-Next-Cursor response header back as `cursor`.
     """
-    applications = db.query(application_model.Application).filter(application_model.Application.user_id == current_user.id).offset(skip).limit(limit).all()
+    Application = application_model.Application
+    after = _decode_cursor(cursor) if cursor else None
+
+    def fetch(session: Session):
+        query = (
+            session.query(Application)
+            .options(selectinload(Application.history))
+            .filter(Application.user_id == current_user_id)
+        )
+
+        if status:
+            query = query.filter(Application.status.in_(status))
+        if company:
+            query = query.filter(Application.company_name.ilike(f"%{company}%"))
+        if source:
+            query = query.filter(Application.job_board_source == source)
+        if min_priority is not None:
+            query = query.filter(Application.priority_stars >= min_priority)
+        if applied_from:
+            query = query.filter(Application.applied_date >= applied_from)
+        if applied_to:
+            query = query.filter(Application.applied_date <= applied_to)
+        if updated_from:
+            query = query.filter(Application.updated_at >= datetime.combine(updated_from, time.min))
+        if updated_to:
+            query = query.filter(Application.updated_at < datetime.combine(updated_to + timedelta(days=1), time.min))
+        if followup_class:
+            query = query.filter(followup.followup_clause(followup_class, berlin_today()))
+        if technology:
+            query = query.filter(Application.id.in_(technologies.application_ids_with(current_user_id, technology)))
+        if after:
+            query = query.filter(tuple_(_LAST_ACTIVITY, Application.id) < after)
+
+        applications = (
+            query.order_by(_LAST_ACTIVITY.desc(), Application.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        next_cursor = None
+        if len(applications) > limit:
+            applications = applications[:limit]
+            next_cursor = _encode_cursor(applications[-1])
+        return [application_schema.Application.model_validate(a) for a in applications], next_cursor
+
+    applications, next_cursor = await db.run(fetch)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return applications
 
+def _duplicate_error(existing: application_model.Application, match: duplicates.Match) -> HTTPException:
+    return HTTPException(status_code=409, detail={
+        "message": "This job is already in your applications",
+        "match": match,
+        "application": application_schema.Application.model_validate(existing).model_dump(mode="json"),
+    })
+
 @router.post("/", response_model=application_schema.Application)
-def create_application(
+async def create_application(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     application_in: application_schema.ApplicationCreate,
+    check_similar: bool = False,
     current_user: user_model.User = Depends(deps.get_current_user),
 ) -> Any:
     """
     Create new application.
+    Saving a job URL that is already in the list is refused with 409 and the
+    existing application. With `check_similar`, so is the same company and
+    title (the browser extension sets it).
     """
-    application = application_model.Application(
-        **application_in.dict(),
-        user_id=current_user.id
-    )
-    db.add(application)
-    db.flush()  # Get the application ID
-    
-    # Update gamification stats (2 points)
-    from app.core import gamification
-    gamification.add_points(
-        db=db,
-        user=current_user,
-        points=2,
-        reason="Created new application",
-        reference_type="application",
-        reference_id=application.id
+    def create(session: Session):
+        keys = duplicates.keys(application_in.company_name, application_in.position_title, application_in.job_url)
+        found = duplicates.find(session, current_user.id, keys, similar=check_similar)
+        if found:
+            raise _duplicate_error(*found)
+
+        application = application_model.Application(
+            **application_in.dict(),
+            **keys,
+            user_id=current_user.id
+        )
+        session.add(application)
+        try:
+            session.flush()  # Get the application ID
+        except IntegrityError:
+            # The same posting was saved concurrently; the unique index kept one
+            session.rollback()
+            found = duplicates.find(session, current_user.id, keys)
+            if not found:
+                raise
+            raise _duplicate_error(*found)
+        technologies.sync_application(session, application)
+
+        # Update gamification stats (2 points)
+        from app.core import gamification
+        gamification.add_points(
+            db=session,
+            user=current_user,
+            points=2,
+            reason="Created new application",
+            reference_type="application",
+            reference_id=application.id
+        )
+
+        reached = milestones.record_applications(session, current_user.id, 1)
+        for milestone in reached:
+            from app.core.email import notify_milestone
+            notify_milestone(session, current_user.name, milestone, email=current_user.email)
+
+        session.commit()
+        session.refresh(application)
+
+        return application_schema.Application.model_validate(application)
+
+    return await db.run(create)
+
+def _parse_bulk_rows(body: bytes, content_type: str) -> list[application_schema.ApplicationCreate]:
+    """Validate a JSON array or a CSV file (header row = field names) of applications."""
+    if content_type.startswith("text/csv"):
+        try:
+            reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            # Empty cells fall back to the schema defaults
+            raw = [{k: v for k, v in row.items() if k and v not in (None, "")} for row in reader]
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid CSV: {e}")
+        if len(raw) > BULK_MAX_ROWS:
+            raise HTTPException(status_code=413, detail=f"At most {BULK_MAX_ROWS} rows per request")
+        rows, errors = [], []
+        for i, item in enumerate(raw):
+            try:
+                rows.append(application_schema.ApplicationCreate.model_validate(item))
+            except ValidationError as e:
+                errors.append({"row": i, "errors": e.errors(include_url=False, include_context=False)})
+        if errors:
+            raise HTTPException(status_code=422, detail=errors)
+        return rows
+
+    try:
+        rows = TypeAdapter(List[application_schema.ApplicationCreate]).validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    if len(rows) > BULK_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {BULK_MAX_ROWS} rows per request")
+    return rows
+
+
+def _check_bulk_duplicates(session: Session, user_id: UUID, values: list[dict]) -> None:
+    """409 listing the rows whose job URL is already saved or repeats an earlier row."""
+    hashes = {v["job_url_hash"] for v in values if v["job_url_hash"]}
+    if not hashes:
+        return
+    Application = application_model.Application
+    existing = dict(
+        session.query(Application.job_url_hash, Application.id)
+        .filter(Application.user_id == user_id, Application.job_url_hash.in_(hashes))
     )
-    
-    db.commit()
-    db.refresh(application)
+    errors, first_row = [], {}
+    for i, v in enumerate(values):
+        url_hash = v["job_url_hash"]
+        if not url_hash:
+            continue
+        if url_hash in existing:
+            errors.append({"row": i, "application_id": str(existing[url_hash])})
+        elif url_hash in first_row:
+            errors.append({"row": i, "duplicate_of_row": first_row[url_hash]})
+        else:
+            first_row[url_hash] = i
+    if errors:
+        raise HTTPException(status_code=409, detail=errors)
 
-    total_count = db.query(application_model.Application).filter(
-        application_model.Application.user_id == current_user.id
-    ).count()
-    if total_count in {10, 25, 50, 100}:
-        from app.core.email import notify_milestone
-        notify_milestone(current_user.name, total_count)
 
-    return application
+@router.post("/bulk", response_model=application_schema.ApplicationBulkResult)
+async def create_applications_bulk(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    request: Request,
+    current_user: user_model.User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Create many applications in one transaction.
+    Send a JSON array of applications, or a CSV file with Content-Type: text/csv
+    whose header row names the fields. Points, level, streak and milestones are
+    updated once for the whole batch. Rows with a job URL that is already saved
+    (or repeated in the batch) reject the batch with 409.
+    """
+    rows = _parse_bulk_rows(await request.body(), request.headers.get("content-type", ""))
+    if not rows:
+        return application_schema.ApplicationBulkResult(created=0, ids=[])
+
+    def create(session: Session):
+        # Ids are assigned here so the ledger rows can reference them without RETURNING
+        values = [
+            {
+                **row.model_dump(),
+                **duplicates.keys(row.company_name, row.position_title, row.job_url),
+                "id": uuid4(),
+                "user_id": current_user.id,
+            }
+            for row in rows
+        ]
+        _check_bulk_duplicates(session, current_user.id, values)
+        session.execute(insert(application_model.Application), values)
+        technologies.sync(session, [(v["id"], current_user.id, v["tech_stack"]) for v in values])
+
+        from app.core import gamification
+        gamification.add_points_bulk(
+            session,
+            current_user,
+            [
+                {
+                    "points": 2,
+                    "reason": "Created new application",
+                    "reference_type": "application",
+                    "reference_id": v["id"],
+                }
+                for v in values
+            ],
+        )
+        reached = milestones.record_applications(session, current_user.id, len(values))
+        # The rows above went out as Core INSERTs, which the flush hook can't see
+        bump_data_version(session, current_user.id)
+        for milestone in reached:
+            from app.core.email import notify_milestone
+            notify_milestone(session, current_user.name, milestone, email=current_user.email)
+        session.commit()
+
+        return application_schema.ApplicationBulkResult(created=len(values), ids=[v["id"] for v in values])
+
+    return await db.run(create)
+
+@router.get("/followup", response_model=application_schema.FollowupQueue)
+async def read_followup_queue(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Applications that need a followup, are awaiting a reply or need a decision,
+    grouped by class. Applications with nothing to do are never loaded.
+    """
+    Application = application_model.Application
+    today = berlin_today()
+
+    def fetch(session: Session):
+        rows = (
+            session.query(Application, followup.followup_class_column(today))
+            .options(selectinload(Application.history))
+            .filter(Application.user_id == current_user_id, followup.actionable_clause(today))
+            .order_by(Application.updated_at, Application.id)
+            .all()
+        )
+        queue = {"needs_followup": [], "awaiting_response": [], "needs_decision": []}
+        for application, klass in rows:
+            queue[klass].append(application_schema.Application.model_validate(application))
+        return application_schema.FollowupQueue(**queue)
+
+    return await db.run(fetch)
 
 @router.get("/{id}", response_model=application_schema.Application)
-def read_application(
+async def read_application(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     id: str,
-    current_user: user_model.User = Depends(deps.get_current_user),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
 ) -> Any:
     """
     Get application by ID.
     """
-    application = db.query(application_model.Application).filter(
-        application_model.Application.id == id,
-        application_model.Application.user_id == current_user.id
-    ).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-    return application
+    def fetch(session: Session):
+        application = session.query(application_model.Application).options(
+            selectinload(application_model.Application.history)
+        ).filter(
+            application_model.Application.id == id,
+            application_model.Application.user_id == current_user_id
+        ).first()
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+        return application_schema.Application.model_validate(application)
+
+    return await db.run(fetch)
 
 @router.put("/{id}", response_model=application_schema.Application)
-def update_application(
+async def update_application(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     id: str,
     application_in: application_schema.ApplicationUpdate,
     current_user: user_model.User = Depends(deps.get_current_user),
@@ -92,38 +358,52 @@ def update_application(
     """
     Update an application.
     """
-    application = db.query(application_model.Application).filter(
-        application_model.Application.id == id,
-        application_model.Application.user_id == current_user.id
-    ).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    update_data = application_in.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(application, field, value)
-    
-    db.add(application)
-    
-    # Update gamification stats (1 point for update)
-    from app.core import gamification
-    gamification.add_points(
-        db=db,
-        user=current_user,
-        points=1,
-        reason="Updated application",
-        reference_type="application",
-        reference_id=application.id
-    )
-    
-    db.commit()
-    db.refresh(application)
-    return application
+    def update(session: Session):
+        application = session.query(application_model.Application).filter(
+            application_model.Application.id == id,
+            application_model.Application.user_id == current_user.id
+        ).first()
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+
+        update_data = application_in.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(application, field, value)
+
+        if update_data.keys() & {"company_name", "position_title", "job_url"}:
+            keys = duplicates.keys(application.company_name, application.position_title, application.job_url)
+            if keys["job_url_hash"] != application.job_url_hash:
+                found = duplicates.find(session, current_user.id, keys, exclude=application.id)
+                if found:
+                    raise _duplicate_error(*found)
+            for field, value in keys.items():
+                setattr(application, field, value)
+
+        session.add(application)
+        if "tech_stack" in update_data:
+            technologies.sync_application(session, application)
+
+        # Update gamification stats (1 point for update)
+        from app.core import gamification
+        gamification.add_points(
+            db=session,
+            user=current_user,
+            points=1,
+            reason="Updated application",
+            reference_type="application",
+            reference_id=application.id
+        )
+
+        session.commit()
+        session.refresh(application)
+        return application_schema.Application.model_validate(application)
+
+    return await db.run(update)
 
 @router.patch("/{id}/status", response_model=application_schema.Application)
-def update_application_status(
+async def update_application_status(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     id: str,
     new_status: ApplicationStatus = Body(embed=True),
     notes: str = Body(default=None, embed=True),
@@ -132,123 +412,137 @@ def update_application_status(
     """
     Update application status with strict transition rules.
     """
-    application = db.query(application_model.Application).filter(
-        application_model.Application.id == id,
-        application_model.Application.user_id == current_user.id
-    ).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-
-    current_status = application.status
-    
-    # Define allowed transitions
-    # Map current_status -> allowed_next_statuses
-    valid_transitions = {
-        ApplicationStatus.SHORTLISTED: [ApplicationStatus.APPLIED, ApplicationStatus.REJECTED],
-        ApplicationStatus.APPLIED: [ApplicationStatus.REPLIED, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
-        ApplicationStatus.REPLIED: [ApplicationStatus.PHONE_SCREEN, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
-        ApplicationStatus.PHONE_SCREEN: [ApplicationStatus.TECHNICAL_ROUND_1, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
-        ApplicationStatus.TECHNICAL_ROUND_1: [ApplicationStatus.TECHNICAL_ROUND_2, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
-        ApplicationStatus.TECHNICAL_ROUND_2: [ApplicationStatus.FINAL_ROUND, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
-        ApplicationStatus.FINAL_ROUND: [ApplicationStatus.OFFER, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
-        ApplicationStatus.OFFER: [ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED], # Can reject an offer too
-        ApplicationStatus.REJECTED: [], # Terminal state
-        ApplicationStatus.GHOSTED: [],  # Terminal state
-    }
-    
-    # Always allow moving to Rejected or Ghosted from any non-terminal state
-    # (Already covered in map above, but good logic to keep in mind)
-    
-    if new_status not in valid_transitions.get(current_status, []):
-         raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid status transition from {current_status} to {new_status}"
+    def update_status(session: Session):
+        application = session.query(application_model.Application).filter(
+            application_model.Application.id == id,
+            application_model.Application.user_id == current_user.id
+        ).first()
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+
+        current_status = application.status
+
+        # Define allowed transitions
+        # Map current_status -> allowed_next_statuses
+        valid_transitions = {
+            ApplicationStatus.SHORTLISTED: [ApplicationStatus.APPLIED, ApplicationStatus.REJECTED],
+            ApplicationStatus.APPLIED: [ApplicationStatus.REPLIED, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
+            ApplicationStatus.REPLIED: [ApplicationStatus.PHONE_SCREEN, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
+            ApplicationStatus.PHONE_SCREEN: [ApplicationStatus.TECHNICAL_ROUND_1, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
+            ApplicationStatus.TECHNICAL_ROUND_1: [ApplicationStatus.TECHNICAL_ROUND_2, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
+            ApplicationStatus.TECHNICAL_ROUND_2: [ApplicationStatus.FINAL_ROUND, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
+            ApplicationStatus.FINAL_ROUND: [ApplicationStatus.OFFER, ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED],
+            ApplicationStatus.OFFER: [ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED], # Can reject an offer too
+            ApplicationStatus.REJECTED: [], # Terminal state
+            ApplicationStatus.GHOSTED: [],  # Terminal state
+        }
+
+        # Always allow moving to Rejected or Ghosted from any non-terminal state
+        # (Already covered in map above, but good logic to keep in mind)
+
+        if new_status not in valid_transitions.get(current_status, []):
+             raise HTTPException(
+                status_code=400,
+                detail=f"Invalid status transition from {current_status} to {new_status}"
+            )
+
+        # Perform update — clear any pending followup since status is advancing
+        application.status = new_status
+        application.followed_up_at = None
+        session.add(application)
+
+        # Record history
+        history = application_model.ApplicationHistory(
+            application_id=application.id,
+            old_status=current_status,
+            new_status=new_status,
+            notes=notes
         )
+        status_stats.record(session, application, history)
+        session.add(history)
 
-    # Perform update — clear any pending followup since status is advancing
-    application.status = new_status
-    application.followed_up_at = None
-    db.add(application)
-    
-    # Record history
-    history = application_model.ApplicationHistory(
-        application_id=application.id,
-        old_status=current_status,
-        new_status=new_status,
-        notes=notes
-    )
-    db.add(history)
-    
-    db.commit()
-    db.refresh(application)
-
-    interview_statuses = {
-        ApplicationStatus.PHONE_SCREEN,
-        ApplicationStatus.TECHNICAL_ROUND_1,
-        ApplicationStatus.TECHNICAL_ROUND_2,
-        ApplicationStatus.FINAL_ROUND,
-    }
-    if new_status in interview_statuses:
-        from app.core.email import notify_interview
-        notify_interview(current_user.name, application.company_name, application.position_title, new_status.value, notes)
-    elif new_status == ApplicationStatus.OFFER:
-        from app.core.email import notify_offer
-        notify_offer(current_user.name, application.company_name, application.position_title, application.location, application.salary_range, notes)
-
-    return application
+        interview_statuses = {
+            ApplicationStatus.PHONE_SCREEN,
+            ApplicationStatus.TECHNICAL_ROUND_1,
+            ApplicationStatus.TECHNICAL_ROUND_2,
+            ApplicationStatus.FINAL_ROUND,
+        }
+        if new_status in interview_statuses:
+            from app.core.email import notify_interview
+            notify_interview(session, current_user.name, application.company_name, application.position_title, new_status.value, notes, email=current_user.email)
+        elif new_status == ApplicationStatus.OFFER:
+            from app.core.email import notify_offer
+            notify_offer(session, current_user.name, application.company_name, application.position_title, application.location, application.salary_range, notes, email=current_user.email)
+
+        session.commit()
+        session.refresh(application)
+
+        return application_schema.Application.model_validate(application)
+
+    return await db.run(update_status)
 
 @router.post("/{id}/followup", response_model=application_schema.Application)
-def mark_followed_up(
+async def mark_followed_up(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     id: str,
     current_user: user_model.User = Depends(deps.get_current_user),
 ) -> Any:
     """
     Record that the user followed up on this application today.
     """
-    application = db.query(application_model.Application).filter(
-        application_model.Application.id == id,
-        application_model.Application.user_id == current_user.id
-    ).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-
-    application.followed_up_at = date.today()
-    db.add(application)
-
-    from app.core import gamification
-    gamification.add_points(
-        db=db,
-        user=current_user,
-        points=1,
-        reason="Followed up on application",
-        reference_type="application",
-        reference_id=application.id
-    )
+    def mark(session: Session):
+        application = session.query(application_model.Application).filter(
+            application_model.Application.id == id,
+            application_model.Application.user_id == current_user.id
+        ).first()
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+
+        application.followed_up_at = berlin_today()
+        session.add(application)
+
+        from app.core import gamification
+        gamification.add_points(
+            db=session,
+            user=current_user,
+            points=1,
+            reason="Followed up on application",
+            reference_type="application",
+            reference_id=application.id
+        )
 
-    db.commit()
-    db.refresh(application)
-    return application
+        session.commit()
+        session.refresh(application)
+        return application_schema.Application.model_validate(application)
+
+    return await db.run(mark)
 
 
 @router.delete("/{id}", response_model=application_schema.Application)
-def delete_application(
+async def delete_application(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     id: str,
-    current_user: user_model.User = Depends(deps.get_current_user),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
 ) -> Any:
     """
     Delete an application.
     """
-    application = db.query(application_model.Application).filter(
-        application_model.Application.id == id,
-        application_model.Application.user_id == current_user.id
-    ).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    db.delete(application)
-    db.commit()
-    return application
+    def delete(session: Session):
+        application = session.query(application_model.Application).filter(
+            application_model.Application.id == id,
+            application_model.Application.user_id == current_user_id
+        ).first()
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+
+        deleted = application_schema.Application.model_validate(application)
+        status_stats.forget(session, application)
+        technologies.sync(session, [(application.id, application.user_id, None)])
+        session.delete(application)
+        milestones.record_applications(session, current_user_id, -1)
+        session.commit()
+        return deleted
+
+    return await db.run(delete)
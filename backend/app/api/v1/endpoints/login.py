@@ -1,38 +1,63 @@
+import time
 from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.api import deps
 from app.core import security
 from app.models.user import User
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/access-token")
-def login_access_token(
-    db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login_access_token(
+    db: deps.Database = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = db.query(User).filter(User.email == form_data.username).first()
-    
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
-        raise HTTPException(status_code=400, detail="Incorrect email or password")
-    
-    access_token_expires = timedelta(minutes=security.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return {
-        "access_token": security.create_access_token(
-            user.id, expires_delta=access_token_expires
-        ),
-        "token_type": "bearer",
-    }
+    started = time.perf_counter()
+    try:
+        def lookup(session: Session):
+            return session.query(User.id, User.hashed_password).filter(User.email == form_data.username).first()
+
+        user = await db.run(lookup)
+        if not user:
+            raise HTTPException(status_code=400, detail="Incorrect email or password")
+
+        # bcrypt is CPU-bound: it runs on its own bounded pool, never on the event loop
+        try:
+            verified, new_hash = await security.verify_and_update_password(form_data.password, user.hashed_password)
+        except security.HasherBusy:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many login attempts in progress, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        if not verified:
+            raise HTTPException(status_code=400, detail="Incorrect email or password")
+
+        if new_hash:
+            def rehash(session: Session):
+                # Core update: updated_at is the streak's last-activity marker, a login isn't activity
+                session.execute(
+                    update(User)
+                    .where(User.id == user.id)
+                    .values(hashed_password=new_hash, updated_at=User.updated_at)
+                )
+                session.commit()
+
+            await db.run(rehash)
+
+        access_token_expires = timedelta(minutes=security.ACCESS_TOKEN_EXPIRE_MINUTES)
+        return {
+            "access_token": security.create_access_token(
+                user.id, expires_delta=access_token_expires
+            ),
+            "token_type": "bearer",
+        }
+    finally:
+        security.login_latency.record(time.perf_counter() - started)
@@ -0,0 +1,57 @@
+from typing import Any
+from uuid import UUID
+from fastapi import APIRouter, Depends
+from app.api import deps
+from app.core import fanout, outbox, security
+from app.db import session
+
+router = APIRouter()
+
+
+@router.get("/db")
+async def read_db_metrics(
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Connection pool metrics: checkout latency, saturation, waits and pings
+    for the sync engine and, when DB_ASYNC is enabled, the async engine.
+    """
+    return {
+        "sync": session.pool_metrics.snapshot(),
+        "async": session.async_pool_metrics.snapshot() if session.async_pool_metrics else None,
+    }
+
+
+@router.get("/auth")
+async def read_auth_metrics(
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Login latency percentiles and the state of the password hashing pool.
+    """
+    return {
+        "login": security.login_latency.snapshot(),
+        "hasher": security.password_hasher.snapshot(),
+    }
+
+
+@router.get("/email")
+async def read_email_metrics(
+    db: deps.Database = Depends(deps.get_db),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Email outbox: queue depth, delivery counts and per-batch send latency.
+    """
+    return await db.run(outbox.snapshot)
+
+
+@router.get("/scheduler")
+async def read_scheduler_metrics(
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Latest run of each scheduled job: users processed, failures, duration,
+    throughput and per-user latency.
+    """
+    return fanout.snapshot()
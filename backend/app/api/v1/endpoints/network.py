@@ -1,4 +1,5 @@
 from typing import Any, List
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.api import deps
@@ -9,54 +10,60 @@ from app.schemas import network as network_schema
 router = APIRouter()
 
 @router.get("/", response_model=List[network_schema.NetworkContact])
-def read_network_contacts(
+async def read_network_contacts(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(deps.get_db),
-    current_user: user_model.User = Depends(deps.get_current_user),
+    db: deps.Database = Depends(deps.get_db),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
 ) -> Any:
     """
     Retrieve network contacts.
     """
-    contacts = db.query(network_model.NetworkContact).filter(network_model.NetworkContact.user_id == current_user.id).offset(skip).limit(limit).all()
-    return contacts
+    def fetch(session: Session):
+        contacts = session.query(network_model.NetworkContact).filter(network_model.NetworkContact.user_id == current_user_id).offset(skip).limit(limit).all()
+        return [network_schema.NetworkContact.model_validate(c) for c in contacts]
+
+    return await db.run(fetch)
 
 @router.post("/", response_model=network_schema.NetworkContact)
-def create_network_contact(
+async def create_network_contact(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     contact_in: network_schema.NetworkContactCreate,
     current_user: user_model.User = Depends(deps.get_current_user),
 ) -> Any:
     """
     Create new network contact.
     """
-    contact = network_model.NetworkContact(
-        **contact_in.dict(),
-        user_id=current_user.id
-    )
-    db.add(contact)
-    db.flush()  # Get the contact ID
-    
-    # Update gamification stats (1 point for adding contact)
-    from app.core import gamification
-    gamification.add_points(
-        db=db,
-        user=current_user,
-        points=1,
-        reason="Added network contact",
-        reference_type="network_contact",
-        reference_id=contact.id
-    )
-    
-    db.commit()
-    db.refresh(contact)
-    return contact
+    def create(session: Session):
+        contact = network_model.NetworkContact(
+            **contact_in.dict(),
+            user_id=current_user.id
+        )
+        session.add(contact)
+        session.flush()  # Get the contact ID
+
+        # Update gamification stats (1 point for adding contact)
+        from app.core import gamification
+        gamification.add_points(
+            db=session,
+            user=current_user,
+            points=1,
+            reason="Added network contact",
+            reference_type="network_contact",
+            reference_id=contact.id
+        )
+
+        session.commit()
+        session.refresh(contact)
+        return network_schema.NetworkContact.model_validate(contact)
+
+    return await db.run(create)
 
 @router.put("/{id}", response_model=network_schema.NetworkContact)
-def update_network_contact(
+async def update_network_contact(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     id: str,
     contact_in: network_schema.NetworkContactUpdate,
     current_user: user_model.User = Depends(deps.get_current_user),
@@ -64,51 +71,58 @@ def update_network_contact(
     """
     Update a network contact.
     """
-    contact = db.query(network_model.NetworkContact).filter(
-        network_model.NetworkContact.id == id,
-        network_model.NetworkContact.user_id == current_user.id
-    ).first()
-    if not contact:
-        raise HTTPException(status_code=404, detail="Contact not found")
-    
-    update_data = contact_in.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(contact, field, value)
-    
-    db.add(contact)
-    
-    # Update gamification stats (1 point for update)
-    from app.core import gamification
-    gamification.add_points(
-        db=db,
-        user=current_user,
-        points=1,
-        reason="Updated network contact",
-        reference_type="network_contact",
-        reference_id=contact.id
-    )
-    
-    db.commit()
-    db.refresh(contact)
-    return contact
+    def update(session: Session):
+        contact = session.query(network_model.NetworkContact).filter(
+            network_model.NetworkContact.id == id,
+            network_model.NetworkContact.user_id == current_user.id
+        ).first()
+        if not contact:
+            raise HTTPException(status_code=404, detail="Contact not found")
+
+        update_data = contact_in.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(contact, field, value)
+
+        session.add(contact)
+
+        # Update gamification stats (1 point for update)
+        from app.core import gamification
+        gamification.add_points(
+            db=session,
+            user=current_user,
+            points=1,
+            reason="Updated network contact",
+            reference_type="network_contact",
+            reference_id=contact.id
+        )
+
+        session.commit()
+        session.refresh(contact)
+        return network_schema.NetworkContact.model_validate(contact)
+
+    return await db.run(update)
 
 @router.delete("/{id}", response_model=network_schema.NetworkContact)
-def delete_network_contact(
+async def delete_network_contact(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     id: str,
-    current_user: user_model.User = Depends(deps.get_current_user),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
 ) -> Any:
     """
     Delete a network contact.
     """
-    contact = db.query(network_model.NetworkContact).filter(
-        network_model.NetworkContact.id == id,
-        network_model.NetworkContact.user_id == current_user.id
-    ).first()
-    if not contact:
-        raise HTTPException(status_code=404, detail="Contact not found")
-    
-    db.delete(contact)
-    db.commit()
-    return contact
+    def delete(session: Session):
+        contact = session.query(network_model.NetworkContact).filter(
+            network_model.NetworkContact.id == id,
+            network_model.NetworkContact.user_id == current_user_id
+        ).first()
+        if not contact:
+            raise HTTPException(status_code=404, detail="Contact not found")
+
+        deleted = network_schema.NetworkContact.model_validate(contact)
+        session.delete(contact)
+        session.commit()
+        return deleted
+
+    return await db.run(delete)
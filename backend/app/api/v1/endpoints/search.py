@@ -0,0 +1,29 @@
+from typing import Any, List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.api import deps
+from app.core import search
+from app.schemas import search as search_schema
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[search_schema.SearchHit])
+async def search_everything(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    q: str = Query(max_length=200),
+    kind: Optional[List[search.Kind]] = Query(default=None),
+    limit: int = Query(default=10, ge=1, le=50),
+    current_user_id: UUID = Depends(deps.get_current_user_id),
+) -> Any:
+    """
+    Search applications (company, position, tech stack, notes) and network
+    contacts (name, company, notes). Every word matches as a prefix; the best
+    matches come first. `kind` restricts the search to one type.
+    """
+    def fetch(session: Session):
+        return search.search(session, current_user_id, q, kind, limit)
+
+    return await db.run(fetch)
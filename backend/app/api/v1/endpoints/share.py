@@ -1,114 +1,304 @@
-from typing import Any
-from fastapi import APIRouter, Depends, HTTPException
+import json
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable, Iterator, Literal, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from app.api import deps
+from app.core.cache import LRUCache
 from app.core.config import settings
+from app.db.session import SessionLocal
 from app.models import application as application_model
 from app.models import network as network_model
 from app.models import user as user_model
 
 router = APIRouter()
 
+# Rows fetched per round trip from the server-side cursor when streaming
+STREAM_BATCH_SIZE = 200
+# Bytes buffered before a chunk is handed to the client (after the first,
+# which goes out on its own so the client sees the user record right away)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Serialized payloads keyed by (user id, data version); a version bump makes old entries unreachable
+_payload_cache = LRUCache(maxsize=16)
+
 
 class ShareRequest(BaseModel):
     password: str
 
 
-@router.post("/data")
-def get_share_data(
-    *,
-    db: Session = Depends(deps.get_db),
-    body: ShareRequest,
-) -> Any:
+def _serialize_user(user):
+    return {
+        "id": user.id,
+        "name": user.name,
+        "email": user.email,
+        "current_education": user.current_education,
+        "german_level": user.german_level,
+        "current_role": user.current_role,
+        "points": user.points,
+        "level": user.level,
+        "level_name": user.level_name,
+        "current_streak": user.current_streak,
+        "longest_streak": user.longest_streak,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+    }
+
+
+def _serialize_app(app):
+    history = [
+        {
+            "id": h.id,
+            "application_id": h.application_id,
+            "old_status": h.old_status,
+            "new_status": h.new_status,
+            "notes": h.notes,
+            "changed_at": h.changed_at.isoformat() if h.changed_at else None,
+        }
+        for h in app.history
+    ]
+    return {
+        "id": app.id,
+        "user_id": app.user_id,
+        "company_name": app.company_name,
+        "position_title": app.position_title,
+        "location": app.location,
+        "job_url": app.job_url,
+        "salary_range": app.salary_range,
+        "tech_stack": app.tech_stack,
+        "status": app.status,
+        "visa_sponsorship": app.visa_sponsorship,
+        "german_requirement": app.german_requirement,
+        "relocation_support": app.relocation_support,
+        "job_board_source": app.job_board_source,
+        "priority_stars": app.priority_stars,
+        "notes": app.notes,
+        "applied_date": app.applied_date.isoformat() if app.applied_date else None,
+        "created_at": app.created_at.isoformat() if app.created_at else None,
+        "updated_at": app.updated_at.isoformat() if app.updated_at else None,
+        "referral_contact_id": app.referral_contact_id,
+        "history": history,
+    }
+
+
+def _serialize_contact(c):
+    return {
+        "id": c.id,
+        "user_id": c.user_id,
+        "name": c.name,
+        "email": c.email,
+        "company": c.company,
+        "relationship_type": c.relationship_type,
+        "connection_strength": c.connection_strength,
+        "last_contact_date": c.last_contact_date.isoformat() if c.last_contact_date else None,
+        "notes": c.notes,
+        "application_id": c.application_id,
+        "created_at": c.created_at.isoformat() if c.created_at else None,
+    }
+
+
+def _etag(user_id, version: int) -> str:
+    return f'"{user_id}-{version}"'
+
+
+def _json_default(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, default=_json_default, separators=(",", ":"))
+
+
+def _iter_applications(db: Session, user_id):
+    return (
+        db.query(application_model.Application)
+        .options(selectinload(application_model.Application.history))
+        .filter(application_model.Application.user_id == user_id)
+        .order_by(application_model.Application.id)
+        .yield_per(STREAM_BATCH_SIZE)
+    )
+
+
+def _iter_contacts(db: Session, user_id):
+    return (
+        db.query(network_model.NetworkContact)
+        .filter(network_model.NetworkContact.user_id == user_id)
+        .order_by(network_model.NetworkContact.id)
+        .yield_per(STREAM_BATCH_SIZE)
+    )
+
+
+def _json_pieces(db: Session, user) -> Iterator[str]:
+    """The same document as the non-streaming response, one record at a time."""
+    yield '{"user":' + _dumps(_serialize_user(user)) + ',"applications":['
+    for i, app in enumerate(_iter_applications(db, user.id)):
+        yield ("," if i else "") + _dumps(_serialize_app(app))
+    yield '],"contacts":['
+    for i, contact in enumerate(_iter_contacts(db, user.id)):
+        yield ("," if i else "") + _dumps(_serialize_contact(contact))
+    yield "]}"
+
+
+def _ndjson_pieces(db: Session, user) -> Iterator[str]:
+    """One {"type": ..., "data": ...} object per line."""
+    yield _dumps({"type": "user", "data": _serialize_user(user)}) + "\n"
+    for app in _iter_applications(db, user.id):
+        yield _dumps({"type": "application", "data": _serialize_app(app)}) + "\n"
+    for contact in _iter_contacts(db, user.id):
+        yield _dumps({"type": "contact", "data": _serialize_contact(contact)}) + "\n"
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values (RFC 9110)."""
+    qualities = {}
+    for item in (accept_encoding or "").lower().split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def _chunked(pieces: Iterable[str], gzip: bool) -> Iterator[bytes]:
     """
-    Return all data for mentor view. Password-protected, no user account needed.
+    The first piece as its own chunk, then the rest coalesced into
+    ~STREAM_CHUNK_SIZE chunks, optionally gzip-compressed. Each gzip chunk is
+    sync-flushed so the client can decode it without waiting for the next.
     """
-    if body.password != settings.SHARE_PASSWORD:
-        raise HTTPException(status_code=401, detail="Invalid password")
+    compressor = zlib.compressobj(wbits=31) if gzip else None
+
+    def encode(chunk: bytes) -> bytes:
+        if compressor:
+            return compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        return chunk
+
+    pieces = iter(pieces)
+    first = next(pieces, None)
+    if first is not None:
+        yield encode(first.encode())
 
+    buffer: list[bytes] = []
+    buffered = 0
+    for piece in pieces:
+        data = piece.encode()
+        buffer.append(data)
+        buffered += len(data)
+        if buffered >= STREAM_CHUNK_SIZE:
+            chunk = b"".join(buffer)
+            buffer, buffered = [], 0
+            yield encode(chunk)
+    chunk = b"".join(buffer)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def _stream_share(user_id, fmt: str, gzip: bool) -> Iterator[bytes]:
+    # The request-scoped session is closed before the body is sent, so the
+    # stream owns its own session for the lifetime of the cursor.
+    db = SessionLocal()
+    try:
+        user = db.get(user_model.User, user_id)
+        pieces = _ndjson_pieces(db, user) if fmt == "ndjson" else _json_pieces(db, user)
+        yield from _chunked(pieces, gzip)
+    finally:
+        db.close()
+
+
+def _lookup_owner(db: Session):
     # Single-user app — always load the owner's account by email
-    user = db.query(user_model.User).filter(user_model.User.email == "aneesh.nl@gmail.com").first()
-    if not user:
-        raise HTTPException(status_code=404, detail="No user found")
+    return (
+        db.query(user_model.User.id, user_model.User.data_version)
+        .filter(user_model.User.email == "aneesh.nl@gmail.com")
+        .first()
+    )
+
 
+def _build_payload(db: Session, user_id) -> bytes:
+    user = db.get(user_model.User, user_id)
     applications = (
         db.query(application_model.Application)
-        .filter(application_model.Application.user_id == user.id)
+        .options(selectinload(application_model.Application.history))
+        .filter(application_model.Application.user_id == user_id)
         .all()
     )
 
     contacts = (
         db.query(network_model.NetworkContact)
-        .filter(network_model.NetworkContact.user_id == user.id)
+        .filter(network_model.NetworkContact.user_id == user_id)
         .all()
     )
 
-    def serialize_app(app):
-        history = [
-            {
-                "id": h.id,
-                "application_id": h.application_id,
-                "old_status": h.old_status,
-                "new_status": h.new_status,
-                "notes": h.notes,
-                "changed_at": h.changed_at.isoformat() if h.changed_at else None,
-            }
-            for h in app.history
-        ]
-        return {
-            "id": app.id,
-            "user_id": app.user_id,
-            "company_name": app.company_name,
-            "position_title": app.position_title,
-            "location": app.location,
-            "job_url": app.job_url,
-            "salary_range": app.salary_range,
-            "tech_stack": app.tech_stack,
-            "status": app.status,
-            "visa_sponsorship": app.visa_sponsorship,
-            "german_requirement": app.german_requirement,
-            "relocation_support": app.relocation_support,
-            "job_board_source": app.job_board_source,
-            "priority_stars": app.priority_stars,
-            "notes": app.notes,
-            "applied_date": app.applied_date.isoformat() if app.applied_date else None,
-            "created_at": app.created_at.isoformat() if app.created_at else None,
-            "updated_at": app.updated_at.isoformat() if app.updated_at else None,
-            "referral_contact_id": app.referral_contact_id,
-            "history": history,
-        }
+    return json.dumps(jsonable_encoder({
+        "user": _serialize_user(user),
+        "applications": [_serialize_app(a) for a in applications],
+        "contacts": [_serialize_contact(c) for c in contacts],
+    })).encode()
 
-    def serialize_contact(c):
-        return {
-            "id": c.id,
-            "user_id": c.user_id,
-            "name": c.name,
-            "email": c.email,
-            "company": c.company,
-            "relationship_type": c.relationship_type,
-            "connection_strength": c.connection_strength,
-            "last_contact_date": c.last_contact_date.isoformat() if c.last_contact_date else None,
-            "notes": c.notes,
-            "application_id": c.application_id,
-            "created_at": c.created_at.isoformat() if c.created_at else None,
-        }
 
-    return {
-        "user": {
-            "id": user.id,
-            "name": user.name,
-            "email": user.email,
-            "current_education": user.current_education,
-            "german_level": user.german_level,
-            "current_role": user.current_role,
-            "points": user.points,
-            "level": user.level,
-            "level_name": user.level_name,
-            "current_streak": user.current_streak,
-            "longest_streak": user.longest_streak,
-            "created_at": user.created_at.isoformat() if user.created_at else None,
-        },
-        "applications": [serialize_app(a) for a in applications],
-        "contacts": [serialize_contact(c) for c in contacts],
-    }
+@router.post("/data")
+async def get_share_data(
+    *,
+    db: deps.Database = Depends(deps.get_db),
+    body: ShareRequest,
+    stream: bool = False,
+    format: Literal["json", "ndjson"] = "json",
+    accept_encoding: Optional[str] = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+) -> Any:
+    """
+    Return all data for mentor view. Password-protected, no user account needed.
+    The response carries an ETag of the owner's data version; send it back in
+    If-None-Match to get a 304 when nothing has changed.
+    With `stream=true` the payload is streamed from a server-side cursor
+    (`format=ndjson` for one record per line, gzip if the client accepts it).
+    """
+    if body.password != settings.SHARE_PASSWORD:
+        raise HTTPException(status_code=401, detail="Invalid password")
+
+    owner = await db.run(_lookup_owner)
+    if not owner:
+        raise HTTPException(status_code=404, detail="No user found")
+    user_id, version = owner
+
+    if stream:
+        gzip = _accepts_gzip(accept_encoding)
+        headers = {"Vary": "Accept-Encoding"}
+        if gzip:
+            headers["Content-Encoding"] = "gzip"
+        media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+        return StreamingResponse(_stream_share(user_id, format, gzip), media_type=media_type, headers=headers)
+
+    etag = _etag(user_id, version)
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    content = _payload_cache.get((user_id, version))
+    if content is None:
+        content = await db.run(_build_payload, user_id)
+        _payload_cache.set((user_id, version), content)
+
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
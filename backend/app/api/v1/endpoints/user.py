@@ -10,8 +10,8 @@ from app.core.gamification import add_points
 router = APIRouter()
 
 @router.get("/", response_model=user_schema.User)
-def read_user(
-    current_user: user_model.User = Depends(deps.get_current_user),
+async def read_user(
+    current_user: user_schema.User = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Get current user.
@@ -20,42 +20,48 @@ def read_user(
 
 
 @router.put("/", response_model=user_schema.User)
-def update_user(
+async def update_user(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     user_in: user_schema.UserUpdate,
     current_user: user_model.User = Depends(deps.get_current_user),
 ) -> Any:
     """
     Update current user.
     """
-    user = current_user
-    
-    update_data = user_in.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(user, field, value)
+    def update(session: Session):
+        user = current_user
+
+        update_data = user_in.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(user, field, value)
+
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        return user_schema.User.model_validate(user)
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+    return await db.run(update)
 
 
 @router.post("/daily-goal-bonus", response_model=user_schema.User)
-def claim_daily_goal_bonus(
+async def claim_daily_goal_bonus(
     *,
-    db: Session = Depends(deps.get_db),
+    db: deps.Database = Depends(deps.get_db),
     current_user: user_model.User = Depends(deps.get_current_user),
 ) -> Any:
     """
     Award 25 bonus points for completing all daily goals. Idempotent — only awards once per calendar day.
     """
-    today = datetime.now(timezone.utc).date()
-    if current_user.last_goal_bonus_date == today:
-        return current_user
-
-    add_points(db, current_user, 25, "Daily goal bonus")
-    current_user.last_goal_bonus_date = today
-    db.commit()
-    db.refresh(current_user)
-    return current_user
+    def claim(session: Session):
+        today = datetime.now(timezone.utc).date()
+        if current_user.last_goal_bonus_date == today:
+            return user_schema.User.model_validate(current_user)
+
+        add_points(session, current_user, 25, "Daily goal bonus")
+        current_user.last_goal_bonus_date = today
+        session.commit()
+        session.refresh(current_user)
+        return user_schema.User.model_validate(current_user)
+
+    return await db.run(claim)
@@ -0,0 +1,262 @@
+"""
+Dashboard aggregates computed in the database.
+
+Every function returns a small, JSON-ready structure built from GROUP BY
+queries, so the analytics page never needs the full application list.
+Results are cached per user and keyed by the user's data version
+(app/db/data_version.py): any write bumps the version, which makes the old
+entries unreachable.
+"""
+from datetime import date, timedelta
+from typing import Any, Callable, Literal, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session
+
+from app.core import status_stats
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.summary import INTERVIEW_STATUSES
+from app.db.data_version import get_data_version
+from app.models.application import Application, ApplicationHistory, ApplicationStatus
+from app.models.technology import ApplicationTechnology, Technology
+
+Dimension = Literal["company", "source", "location", "tech"]
+
+_DIMENSION_COLUMNS = {
+    "company": Application.company_name,
+    "source": Application.job_board_source,
+    "location": Application.location,
+}
+
+# Statuses that mean the company answered (matches the weekly summary)
+_NO_RESPONSE = (ApplicationStatus.APPLIED, ApplicationStatus.GHOSTED)
+
+# Industry by company name: the first group with a keyword in the lowercased
+# name wins, anything else is "Other". Mirrored in frontend/src/utils/analytics.ts.
+INDUSTRIES = [
+    ("Industrial/Tech", ("sap", "siemens", "bosch", "continental", "infineon")),
+    ("Finance/Fintech", ("bank", "finance", "kpmg", "deloitte", "n26", "traderepublic")),
+    ("Telecommunications", ("telekom", "telecom", "t-systems")),
+    ("Automotive", ("bmw", "vw", "volkswagen", "porsche", "audi", "zf", "man")),
+    ("Consumer/Chemical", ("zalando", "henkel", "basf", "merck", "edeka")),
+    ("E-commerce/Startup", ("startup", "gorillas", "tier", "hellofresh", "researchgate")),
+    ("Healthcare/Logistics", ("healthcare", "roche", "fresenius", "fraport")),
+    ("Transportation", ("lufthansa", "dhl", "flixbus")),
+    ("Consulting", ("consulting", "accenture", "capgemini")),
+]
+
+_results = LRUCache(maxsize=settings.ANALYTICS_CACHE_SIZE)
+
+
+def cached(db: Session, user_id: UUID, key: tuple, compute: Callable[[], Any]) -> Any:
+    """compute() once per (user, data version, key)."""
+    cache_key = (user_id, get_data_version(db, user_id)) + key
+    result = _results.get(cache_key)
+    if result is None:
+        result = compute()
+        _results.set(cache_key, result)
+    return result
+
+
+def _scope(query, user_id: UUID, since: Optional[date]):
+    query = query.filter(Application.user_id == user_id)
+    if since is not None:
+        query = query.filter(Application.applied_date >= since)
+    return query
+
+
+def summary(db: Session, user_id: UUID, since: Optional[date] = None) -> dict:
+    """Funnel and key metric counts, derived from one GROUP BY status."""
+    rows = _scope(
+        db.query(
+            Application.status,
+            func.count(),
+            func.count().filter(Application.easy_apply.is_(True)),
+        ),
+        user_id,
+        since,
+    ).group_by(Application.status).all()
+
+    by_status = {status: count for status, count, _ in rows}
+
+    def total_of(statuses) -> int:
+        return sum(by_status.get(s, 0) for s in statuses)
+
+    return {
+        "total": sum(by_status.values()),
+        "responded": sum(n for s, n in by_status.items() if s not in _NO_RESPONSE),
+        "interviewed": total_of(INTERVIEW_STATUSES),
+        "final_round": by_status.get(ApplicationStatus.FINAL_ROUND, 0),
+        "offers": by_status.get(ApplicationStatus.OFFER, 0),
+        "rejected": by_status.get(ApplicationStatus.REJECTED, 0),
+        "ghosted": by_status.get(ApplicationStatus.GHOSTED, 0),
+        "easy_applied": sum(easy for _, _, easy in rows),
+        "status_counts": {status.value: count for status, count in by_status.items()},
+    }
+
+
+def transitions(db: Session, user_id: UUID, since: Optional[date] = None) -> dict:
+    """
+    Status transition counts (a missing old status counts as Applied), plus
+    how many applications have no history at all. All-time counts come from
+    the maintained status_stats table; a date range replays the history.
+    """
+    if since is None:
+        rows = status_stats.transition_counts(db, user_id)
+    else:
+        rows = _scope(
+            db.query(ApplicationHistory.old_status, ApplicationHistory.new_status, func.count())
+            .join(Application, Application.id == ApplicationHistory.application_id),
+            user_id,
+            since,
+        ).group_by(ApplicationHistory.old_status, ApplicationHistory.new_status).all()
+
+    links: dict[tuple[str, str], int] = {}
+    for old, new, count in rows:
+        key = ((old or ApplicationStatus.APPLIED).value, new.value)
+        links[key] = links.get(key, 0) + count
+
+    untracked = _scope(
+        db.query(func.count()).select_from(Application).filter(~Application.history.any()),
+        user_id,
+        since,
+    ).scalar()
+
+    return {
+        "links": [
+            {"source": source, "target": target, "count": count}
+            for (source, target), count in sorted(links.items(), key=lambda item: -item[1])
+        ],
+        "untracked": untracked,
+    }
+
+
+def dwell(db: Session, user_id: UUID) -> dict:
+    """How long applications sat in each status before moving on, as histograms."""
+    return {
+        "buckets": list(status_stats.DWELL_LABELS),
+        "statuses": status_stats.dwell_histograms(db, user_id),
+    }
+
+
+def timeline(db: Session, user_id: UUID, today: date, weeks: int = 26) -> list[dict]:
+    """Applications and responses per week (Monday start) by applied date, oldest first."""
+    first_week = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+    rows = _scope(
+        db.query(
+            Application.applied_date,
+            func.count(),
+            func.count().filter(Application.status.notin_(_NO_RESPONSE)),
+        ),
+        user_id,
+        first_week,
+    ).group_by(Application.applied_date).all()
+
+    buckets = {
+        first_week + timedelta(weeks=i): {"applications": 0, "responded": 0} for i in range(weeks)
+    }
+    for day, count, responded in rows:
+        bucket = buckets.get(day - timedelta(days=day.weekday()))
+        if bucket is not None:
+            bucket["applications"] += count
+            bucket["responded"] += responded
+    return [{"week_start": week.isoformat(), **counts} for week, counts in buckets.items()]
+
+
+def top(
+    db: Session,
+    user_id: UUID,
+    dimension: Dimension,
+    limit: int = 10,
+    since: Optional[date] = None,
+) -> list[dict]:
+    """The `limit` most frequent values of `dimension`, with response and offer counts."""
+    responded = func.count().filter(Application.status.notin_(_NO_RESPONSE))
+    offers = func.count().filter(Application.status == ApplicationStatus.OFFER)
+
+    if dimension == "tech":
+        # Counted from the technology links (app/core/technologies.py), not by splitting tech_stack
+        count = func.count()
+        rows = (
+            _scope(
+                db.query(Technology.name, count, responded, offers).select_from(Application), user_id, since
+            )
+            .join(ApplicationTechnology, ApplicationTechnology.application_id == Application.id)
+            .join(Technology, Technology.id == ApplicationTechnology.technology_id)
+            .group_by(Technology.id, Technology.name)
+            .order_by(count.desc(), Technology.name)
+            .limit(limit)
+            .all()
+        )
+        return [
+            {"key": key, "applications": n, "responded": r, "offers": o}
+            for key, n, r, o in rows
+        ]
+
+    column = _DIMENSION_COLUMNS[dimension]
+    count = func.count()
+    rows = (
+        _scope(db.query(column, count, responded, offers), user_id, since)
+        .filter(column.is_not(None))
+        .group_by(column)
+        .order_by(count.desc(), column)
+        .limit(limit)
+        .all()
+    )
+    return [
+        {"key": key, "applications": n, "responded": r, "offers": o}
+        for key, n, r, o in rows
+    ]
+
+
+def industries(db: Session, user_id: UUID, since: Optional[date] = None) -> list[dict]:
+    """Applications, companies, responses and offers per industry (INDUSTRIES), largest first."""
+    name = func.lower(Application.company_name)
+    industry = case(
+        *[
+            (or_(*[name.contains(keyword, autoescape=True) for keyword in keywords]), label)
+            for label, keywords in INDUSTRIES
+        ],
+        else_="Other",
+    )
+    # Classified in a subquery so the GROUP BY doesn't repeat the CASE and its parameters
+    classified = _scope(
+        db.query(industry.label("industry"), Application.company_name, Application.status),
+        user_id,
+        since,
+    ).subquery()
+
+    count = func.count()
+    rows = (
+        db.query(
+            classified.c.industry,
+            func.count(func.distinct(classified.c.company_name)),
+            count,
+            count.filter(classified.c.status.notin_(_NO_RESPONSE)),
+            count.filter(classified.c.status == ApplicationStatus.OFFER),
+        )
+        .group_by(classified.c.industry)
+        .order_by(count.desc(), classified.c.industry)
+        .all()
+    )
+    return [
+        {"key": key, "companies": c, "applications": n, "responded": r, "offers": o}
+        for key, c, n, r, o in rows
+    ]
+
+
+def locations(db: Session, user_id: UUID, since: Optional[date] = None) -> list[dict]:
+    """Applications per location with their status counts, most applications first."""
+    location = func.trim(Application.location)
+    rows = _scope(
+        db.query(location, Application.status, func.count()), user_id, since,
+    ).group_by(location, Application.status).all()
+
+    by_location: dict[str, dict] = {}
+    for key, status, count in rows:
+        entry = by_location.setdefault(key, {"key": key, "applications": 0, "status_counts": {}})
+        entry["applications"] += count
+        entry["status_counts"][status.value] = count
+    return sorted(by_location.values(), key=lambda entry: (-entry["applications"], entry["key"]))
@@ -8,16 +8,49 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     SQLALCHEMY_DATABASE_URI: str | None = None
+    # Serve API requests from an asyncpg-backed AsyncSession instead of the threadpool
+    DB_ASYNC: bool = False
+    ASYNC_SQLALCHEMY_DATABASE_URI: str | None = None
+    # Connection pool, per engine
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 keeps connections forever
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_PRE_PING_IDLE: float = 60.0  # ping only connections idle longer than this; 0 = always, -1 = never
+    DB_SLOW_CHECKOUT_MS: float = 100.0  # log checkouts slower than this
     SHARE_PASSWORD: str = "sharepassword"
 
     # Auth
     SECRET_KEY: str = "CHANGE_THIS_IN_PRODUCTION_TO_A_STRONG_SECRET_KEY"
+    AUTH_CACHE_TTL: float = 30.0  # seconds an authenticated user is served from memory
+    AUTH_CACHE_SIZE: int = 1024
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2  # threads dedicated to bcrypt
+    PASSWORD_HASH_QUEUE: int = 16  # logins allowed to wait for a worker before answering 503
 
     # Email
+    EMAIL_TRANSPORT: str = "resend"  # resend, smtp, mbox or file (see app/core/email_transports.py)
     RESEND_API_KEY: str = ""
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+    SMTP_USERNAME: str = ""
+    SMTP_PASSWORD: str = ""
+    SMTP_STARTTLS: bool = False
+    EMAIL_SINK_PATH: str = "email_sink"  # mbox file or .eml directory for the mbox/file transports
     EMAIL_FROM: str = "ApplyQuest <noreply@applyquest.app>"
     USER_EMAIL: str = "aneesh.nl@gmail.com"
-    MENTOR_EMAILS: str = ""  # comma-separated list
+    MENTOR_EMAILS: str = ""  # comma-separated; mentors of the USER_EMAIL account only
+    EMAIL_WORKERS: int = 2  # threads draining the outbox
+    EMAIL_BATCH_SIZE: int = 50  # messages per Resend batch call (max 100)
+    EMAIL_MAX_ATTEMPTS: int = 6
+    EMAIL_RETRY_BASE: float = 30.0  # seconds; doubles after every failed attempt
+    EMAIL_DRAIN_TIMEOUT: float = 10.0  # seconds to keep sending on shutdown
+    APPLICATION_MILESTONES: str = "10,25,50,100"  # comma-separated application counts
+    ANALYTICS_CACHE_SIZE: int = 512  # cached dashboard aggregates, across all users
+
+    # Scheduled jobs
+    SCHEDULER_WORKERS: int = 4  # users processed concurrently; each holds up to two DB connections
+    SCHEDULER_BATCH_SIZE: int = 500  # user ids read per keyset page
 
     class Config:
         env_file = ".env"
@@ -26,5 +59,17 @@ class Settings(BaseSettings):
         super().__init__(**kwargs)
         if not self.SQLALCHEMY_DATABASE_URI:
             self.SQLALCHEMY_DATABASE_URI = f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+        if not self.ASYNC_SQLALCHEMY_DATABASE_URI:
+            scheme, _, rest = self.SQLALCHEMY_DATABASE_URI.partition("://")
+            dialect = scheme.split("+")[0]
+            if dialect == "postgresql":
+                self.ASYNC_SQLALCHEMY_DATABASE_URI = f"postgresql+asyncpg://{rest}"
+            elif dialect == "sqlite":
+                self.ASYNC_SQLALCHEMY_DATABASE_URI = f"sqlite+aiosqlite://{rest}"
+        if self.DB_ASYNC and not self.ASYNC_SQLALCHEMY_DATABASE_URI:
+            raise ValueError(
+                f"DB_ASYNC is set but no async driver is known for {scheme}://; "
+                "set ASYNC_SQLALCHEMY_DATABASE_URI"
+            )
 
 settings = Settings()
@@ -0,0 +1,135 @@
+"""
+Duplicate detection for captured job postings.
+
+Every application stores two keys, kept current wherever job_url, company
+or title are written:
+
+- job_url_hash: SHA-256 of the normalized posting URL. A partial unique
+  index on (user_id, job_url_hash) makes re-saving the same posting
+  impossible.
+- dedupe_key: company and title reduced to plain words ("ACME GmbH",
+  "Backend Engineer (m/w/d)" -> "acme|backend engineer"). Indexed but not
+  unique: applying twice to the same role is legitimate, so callers opt in
+  to treating it as a duplicate.
+
+find() answers both questions with a single indexed lookup.
+"""
+import hashlib
+import re
+import unicodedata
+from typing import Literal, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from uuid import UUID
+
+from sqlalchemy import case, or_
+from sqlalchemy.orm import Session
+
+from app.models.application import Application
+
+Match = Literal["job_url", "company_title"]
+
+# Query parameters that identify the posting; everything else (tracking,
+# search context, referrers) is dropped. Names are compared lowercased.
+# Indeed: jk/vjk, LinkedIn: currentJobId, Glassdoor: jl, Greenhouse: gh_jid
+_ID_PARAMS = {"jk", "vjk", "currentjobid", "jobid", "job_id", "jl", "gh_jid", "id"}
+
+# Search results and saved-job lists: without an id parameter they name no
+# single posting, so they get no URL hash (LinkedIn /jobs/search,
+# /jobs/collections/recommended, Indeed /jobs, Xing /jobs/search, ...)
+_LISTING_PATH = re.compile(r"^(/jobs(/(search|collections)(/.*)?)?|/search(/.*)?)$", re.IGNORECASE)
+# LinkedIn job pages: /jobs/view/123 or /jobs/view/backend-engineer-at-acme-123
+_LINKEDIN_JOB_PATH = re.compile(r"^/jobs/view/(?:[^/]*-)?(\d+)$")
+
+_LEGAL_SUFFIXES = {
+    "ag", "bv", "co", "company", "corp", "corporation", "gmbh", "inc", "kg", "llc", "ltd",
+    "limited", "plc", "sa", "se",
+}
+# Gender markers in German postings: (m/w/d), (f/m/x), (all genders), (gn)
+_TITLE_NOISE = {"all", "gender", "genders", "gn", "mwd", "wmd", "mfd", "fmd", "mfx", "fmx"}
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """
+    Scheme-less, lowercase host without www., identifying query params only,
+    no fragment. None if the URL doesn't identify a single posting.
+    """
+    url = url.strip()
+    if "//" not in url:  # "linkedin.com/jobs/view/1"
+        url = "//" + url
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if not host:
+        return None
+    path = parts.path.rstrip("/")
+    query = sorted(
+        (name.lower(), value) for name, value in parse_qsl(parts.query) if name.lower() in _ID_PARAMS
+    )
+    if host.endswith("linkedin.com"):
+        # The same job from its own page, a search view (?currentJobId=) or a collection
+        job_id = dict(query).get("currentjobid")
+        match = _LINKEDIN_JOB_PATH.match(path)
+        if job_id or match:
+            return f"linkedin.com/jobs/view/{job_id or match.group(1)}"
+    if not query and _LISTING_PATH.match(path or "/"):
+        return None
+    return urlunsplit(("", host, path, urlencode(query), "")).removeprefix("//")
+
+
+def url_hash(url: Optional[str]) -> Optional[str]:
+    normalized = normalize_url(url) if url else None
+    return hashlib.sha256(normalized.encode()).hexdigest() if normalized else None
+
+
+def _words(text: str) -> list[str]:
+    # Fold accents so "Zürich" and "Zurich" match
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return _NON_WORD.sub(" ", text.lower()).split()
+
+
+def dedupe_key(company_name: str, position_title: str) -> str:
+    company = [w for w in _words(company_name) if w not in _LEGAL_SUFFIXES]
+    title = [w for w in _words(position_title) if len(w) > 1 and w not in _TITLE_NOISE]
+    return f"{' '.join(company)}|{' '.join(title)}"
+
+
+def keys(company_name: str, position_title: str, job_url: Optional[str]) -> dict:
+    """Column values for an application with these fields."""
+    return {
+        "job_url_hash": url_hash(job_url),
+        "dedupe_key": dedupe_key(company_name, position_title),
+    }
+
+
+def find(
+    db: Session,
+    user_id: UUID,
+    candidate: dict,
+    similar: bool = False,
+    exclude: Optional[UUID] = None,
+) -> Optional[tuple[Application, Match]]:
+    """
+    The user's application with the same posting URL as `candidate` (from
+    keys()) or, if `similar`, the same company and title. A URL match wins
+    over a company/title match.
+    """
+    job_url_hash = candidate["job_url_hash"]
+    same_url = Application.job_url_hash == job_url_hash
+    conditions = []
+    if job_url_hash:
+        conditions.append(same_url)
+    if similar:
+        conditions.append(Application.dedupe_key == candidate["dedupe_key"])
+    if not conditions:
+        return None
+
+    query = db.query(Application).filter(Application.user_id == user_id, or_(*conditions))
+    if exclude is not None:
+        query = query.filter(Application.id != exclude)
+    if job_url_hash:
+        query = query.order_by(case((same_url, 0), else_=1))
+    existing = query.order_by(Application.created_at).first()
+    if existing is None:
+        return None
+    return existing, "job_url" if job_url_hash and existing.job_url_hash == job_url_hash else "company_title"
@@ -1,100 +1,84 @@
 import logging
-import threading
 from typing import Optional
 
-import resend
+from sqlalchemy.orm import Session
 
+from app.core import outbox
 from app.core.config import settings
+from app.core.email_transports import get_transport
+from app.core.templates import CachedRenderer, Markup, Template, render_rows
 
 logger = logging.getLogger(__name__)
 
 
-def _mentor_emails() -> list[str]:
-    if not settings.MENTOR_EMAILS:
+def _mentor_emails(email: str) -> list[str]:
+    # MENTOR_EMAILS follow the USER_EMAIL account; nobody else's progress goes to them
+    if not settings.MENTOR_EMAILS or email.lower() != settings.USER_EMAIL.lower():
         return []
     return [e.strip() for e in settings.MENTOR_EMAILS.split(",") if e.strip()]
 
 
-def _send(to: list[str], subject: str, html: str) -> None:
-    if not settings.RESEND_API_KEY:
-        logger.warning("RESEND_API_KEY not set, skipping: %s", subject)
+def _send(db: Session, to: list[str], subject: str, html: str, reply_to: Optional[str] = None) -> None:
+    if not get_transport().enabled:
+        logger.warning("%s transport not configured, skipping: %s", settings.EMAIL_TRANSPORT, subject)
         return
     if not to:
         return
+    # Stored with the caller's transaction, sent by the outbox workers with retries
+    outbox.enqueue(db, to, subject, html, reply_to)
 
-    def _do():
-        try:
-            resend.api_key = settings.RESEND_API_KEY
-            resend.Emails.send({
-                "from": settings.EMAIL_FROM,
-                "to": to,
-                "reply_to": settings.USER_EMAIL,
-                "subject": subject,
-                "html": html,
-            })
-        except Exception:
-            logger.exception("Failed to send email: %s", subject)
 
-    threading.Thread(target=_do).start()
+# --- Templates, compiled once at import ---
 
+_CELL = "padding:8px;border:1px solid #ddd"
+_TH = "padding:8px;border:1px solid #ddd;text-align:left"
 
-# --- Triggered notifications ---
-
-def notify_level_up(user_name: str, level: int, level_name: str, points: int) -> None:
-    html = f"""
+LEVEL_UP = Template("""
     <h2>Level Up! 🎉</h2>
     <p>You've reached <strong>Level {level}: {level_name}</strong> with {points} total points.</p>
     <p>Keep going — you're making real progress!</p>
-    """
-    _send([settings.USER_EMAIL], f"Level Up! You're now {level_name}", html)
+    """)
 
-
-def notify_milestone(user_name: str, count: int) -> None:
-    user_html = f"""
+MILESTONE_USER = Template("""
     <h2>{count} Applications! 🏆</h2>
     <p>You just submitted your <strong>{count}th application</strong>. That's a real milestone.</p>
     <p>Every application gets you closer. Keep the momentum going!</p>
-    """
-    mentor_html = f"""
+    """)
+
+MILESTONE_MENTOR = Template("""
     <h2>{user_name} hit {count} applications 🏆</h2>
     <p><strong>{user_name}</strong> just submitted their <strong>{count}th job application</strong>.</p>
     <p>That's serious dedication.</p>
-    """
-    _send([settings.USER_EMAIL], f"Milestone: {count} applications submitted!", user_html)
-    _send(_mentor_emails(), f"{user_name} hit {count} applications!", mentor_html)
+    """)
 
+NOTES_LINE = Template("<p><em>Notes: {notes}</em></p>")
+SALARY_LINE = Template("<p><strong>Salary:</strong> {salary_range}</p>")
 
-def notify_interview(user_name: str, company: str, position: str, status: str, notes: Optional[str] = None) -> None:
-    notes_line = f"<p><em>Notes: {notes}</em></p>" if notes else ""
-    user_html = f"""
+INTERVIEW_USER = Template("""
     <h2>Interview Stage: {status} 🎯</h2>
     <p>Your application to <strong>{company}</strong> for <strong>{position}</strong>
     has moved to <strong>{status}</strong>.</p>
     {notes_line}
     <p>Good luck — you've earned this!</p>
-    """
-    mentor_html = f"""
+    """)
+
+INTERVIEW_MENTOR = Template("""
     <h2>{user_name} has an interview! 🎯</h2>
     <p><strong>Company:</strong> {company}<br>
     <strong>Position:</strong> {position}<br>
     <strong>Stage:</strong> {status}</p>
     {notes_line}
-    """
-    _send([settings.USER_EMAIL], f"Interview: {status} at {company}", user_html)
-    _send(_mentor_emails(), f"{user_name} — {status} at {company}", mentor_html)
-
+    """)
 
-def notify_offer(user_name: str, company: str, position: str, location: str, salary_range: Optional[str], notes: Optional[str] = None) -> None:
-    salary_line = f"<p><strong>Salary:</strong> {salary_range}</p>" if salary_range else ""
-    notes_line = f"<p><em>Notes: {notes}</em></p>" if notes else ""
-    user_html = f"""
+OFFER_USER = Template("""
     <h2>You got an offer! 🎉🎉🎉</h2>
     <p><strong>{company}</strong> has extended an offer for <strong>{position}</strong> in {location}.</p>
     {salary_line}
     {notes_line}
     <p>Take your time, evaluate carefully, and celebrate!</p>
-    """
-    mentor_html = f"""
+    """)
+
+OFFER_MENTOR = Template("""
     <h2>{user_name} received an offer! 🎉</h2>
     <p><strong>Company:</strong> {company}<br>
     <strong>Position:</strong> {position}<br>
@@ -102,37 +86,146 @@ def notify_offer(user_name: str, company: str, position: str, location: str, sal
     {salary_line}
     {notes_line}
     <p>Reach out to discuss the details!</p>
-    """
-    _send([settings.USER_EMAIL], f"Offer received from {company}! 🎉", user_html)
-    _send(_mentor_emails(), f"{user_name} got an offer from {company}!", mentor_html)
+    """)
 
+STREAK_WARNING = Template("<p>⚠️ You have a <strong>{streak}-day streak</strong> — don't break it now!</p>")
 
-# --- Scheduled notifications ---
-
-def notify_daily_reminder(user_name: str, streak: int) -> None:
-    streak_line = (
-        f"<p>⚠️ You have a <strong>{streak}-day streak</strong> — don't break it now!</p>"
-        if streak > 3 else ""
-    )
-    html = f"""
+DAILY_REMINDER = Template("""
     <h2>Daily Reminder 🔔</h2>
     <p>Hey {user_name}, you haven't logged any job activity today.</p>
     {streak_line}
     <p>Even one application or a status update keeps the momentum going.</p>
-    """
-    _send([settings.USER_EMAIL], "Don't forget to apply today!", html)
+    """)
 
-
-def notify_streak_broken(user_name: str, streak: int) -> None:
-    html = f"""
+STREAK_BROKEN = Template("""
     <h2>Streak broken 😔</h2>
     <p><strong>{user_name}</strong>'s <strong>{streak}-day streak</strong> was not maintained yesterday.</p>
     <p>This might be a good time to check in and offer some encouragement.</p>
-    """
-    _send(_mentor_emails(), f"{user_name}'s streak was broken", html)
+    """)
 
+SUMMARY_ROW = Template(
+    f"<tr><td style='{_CELL}'><strong>{{label}}</strong></td><td style='{_CELL}'>{{value}}</td></tr>"
+)
 
-def notify_weekly_summary(
+WEEKLY_SUMMARY = Template("""
+    <h2>Weekly Summary — {user_name} 📊</h2>
+    <table style="border-collapse:collapse;width:100%;font-family:sans-serif">
+        {rows}
+    </table>
+    """)
+
+FOLLOWUP_ROW = Template(
+    "<tr>"
+    f"<td style='{_CELL}'>{{company}}</td>"
+    f"<td style='{_CELL}'>{{position}}</td>"
+    f"<td style='{_CELL}'>{{status}}</td>"
+    f"<td style='{_CELL}'>{{days_stale}} days</td>"
+    "</tr>"
+)
+
+DECISION_ROW = Template(
+    "<tr>"
+    f"<td style='{_CELL}'>{{company}}</td>"
+    f"<td style='{_CELL}'>{{position}}</td>"
+    f"<td style='{_CELL}'>{{followed_up_days_ago}} days ago</td>"
+    "</tr>"
+)
+
+FOLLOWUP_SECTION = Template(f"""
+        <h3 style="color:#d97706">⏰ Needs Followup ({{count}})</h3>
+        <table style="border-collapse:collapse;width:100%;font-family:sans-serif">
+            <tr style="background:#fef3c7">
+                <th style="{_TH}">Company</th>
+                <th style="{_TH}">Position</th>
+                <th style="{_TH}">Status</th>
+                <th style="{_TH}">Stale</th>
+            </tr>
+            {{rows}}
+        </table>
+        """)
+
+DECISION_SECTION = Template(f"""
+        <h3 style="color:#dc2626">🔴 Needs Decision ({{count}})</h3>
+        <p style="color:#6b7280;font-size:14px">You followed up on these — time to mark them Ghosted, Rejected, or advance to the next round.</p>
+        <table style="border-collapse:collapse;width:100%;font-family:sans-serif">
+            <tr style="background:#fee2e2">
+                <th style="{_TH}">Company</th>
+                <th style="{_TH}">Position</th>
+                <th style="{_TH}">Followed up</th>
+            </tr>
+            {{rows}}
+        </table>
+        """)
+
+FOLLOWUP_DIGEST = Template("""
+    <h2>Followup Queue — {user_name} 🔔</h2>
+    {followup_section}
+    {decision_section}
+    <p style="color:#6b7280;font-size:13px;margin-top:16px">Visit the Followup Queue in ApplyQuest to take action.</p>
+    """)
+
+# Identical inputs (e.g. the same digest sent on consecutive days) reuse the rendered HTML
+_cached = CachedRenderer(maxsize=256)
+
+
+def _optional(template: Template, **context) -> Markup:
+    """Render `template` only if every value is set, else an empty fragment."""
+    return template.render(**context) if all(context.values()) else Markup("")
+
+
+# --- Triggered notifications ---
+
+def notify_level_up(db: Session, user_name: str, level: int, level_name: str, points: int, *, email: str) -> None:
+    html = LEVEL_UP.render(level=level, level_name=level_name, points=points)
+    _send(db, [email], f"Level Up! You're now {level_name}", html)
+
+
+def notify_milestone(db: Session, user_name: str, count: int, *, email: str) -> None:
+    user_html = MILESTONE_USER.render(count=count)
+    mentor_html = MILESTONE_MENTOR.render(user_name=user_name, count=count)
+    _send(db, [email], f"Milestone: {count} applications submitted!", user_html)
+    _send(db, _mentor_emails(email), f"{user_name} hit {count} applications!", mentor_html, reply_to=email)
+
+
+def notify_interview(db: Session, user_name: str, company: str, position: str, status: str, notes: Optional[str] = None, *, email: str) -> None:
+    notes_line = _optional(NOTES_LINE, notes=notes)
+    user_html = INTERVIEW_USER.render(company=company, position=position, status=status, notes_line=notes_line)
+    mentor_html = INTERVIEW_MENTOR.render(
+        user_name=user_name, company=company, position=position, status=status, notes_line=notes_line,
+    )
+    _send(db, [email], f"Interview: {status} at {company}", user_html)
+    _send(db, _mentor_emails(email), f"{user_name} — {status} at {company}", mentor_html, reply_to=email)
+
+
+def notify_offer(db: Session, user_name: str, company: str, position: str, location: str, salary_range: Optional[str], notes: Optional[str] = None, *, email: str) -> None:
+    context = dict(
+        company=company,
+        position=position,
+        location=location,
+        salary_line=_optional(SALARY_LINE, salary_range=salary_range),
+        notes_line=_optional(NOTES_LINE, notes=notes),
+    )
+    user_html = OFFER_USER.render(**context)
+    mentor_html = OFFER_MENTOR.render(user_name=user_name, **context)
+    _send(db, [email], f"Offer received from {company}! 🎉", user_html)
+    _send(db, _mentor_emails(email), f"{user_name} got an offer from {company}!", mentor_html, reply_to=email)
+
+
+# --- Scheduled notifications ---
+
+def notify_daily_reminder(db: Session, user_name: str, streak: int, *, email: str) -> None:
+    streak_line = STREAK_WARNING.render(streak=streak) if streak > 3 else Markup("")
+    html = DAILY_REMINDER.render(user_name=user_name, streak_line=streak_line)
+    _send(db, [email], "Don't forget to apply today!", html)
+
+
+def notify_streak_broken(db: Session, user_name: str, streak: int, *, email: str) -> None:
+    html = STREAK_BROKEN.render(user_name=user_name, streak=streak)
+    _send(db, _mentor_emails(email), f"{user_name}'s streak was broken", html, reply_to=email)
+
+
+@_cached
+def render_weekly_summary(
     user_name: str,
     current_streak: int,
     longest_streak: int,
@@ -146,93 +239,80 @@ def notify_weekly_summary(
     active_apps: int,
     followup_needed: int = 0,
     decision_needed: int = 0,
-) -> None:
-    def row(label, value):
-        return f"<tr><td style='padding:8px;border:1px solid #ddd'><strong>{label}</strong></td><td style='padding:8px;border:1px solid #ddd'>{value}</td></tr>"
-
-    followup_row = ""
+) -> Markup:
+    rows = [
+        ("Applications this week", apps_this_week),
+        ("Total applications", total_apps),
+        ("Active applications", active_apps),
+        ("Response rate", f"{response_rate}%"),
+        ("Interview rate", f"{interview_rate}%"),
+    ]
     if followup_needed or decision_needed:
-        followup_row = row("Followup needed", f"{followup_needed} pending · {decision_needed} need a decision")
-
-    html = f"""
-    <h2>Weekly Summary — {user_name} 📊</h2>
-    <table style="border-collapse:collapse;width:100%;font-family:sans-serif">
-        {row("Applications this week", apps_this_week)}
-        {row("Total applications", total_apps)}
-        {row("Active applications", active_apps)}
-        {row("Response rate", f"{response_rate}%")}
-        {row("Interview rate", f"{interview_rate}%")}
-        {followup_row}
-        {row("Current streak", f"{current_streak} days")}
-        {row("Longest streak", f"{longest_streak} days")}
-        {row("Level", f"Level {level}: {level_name}")}
-        {row("Total points", points)}
-    </table>
-    """
-    recipients = [settings.USER_EMAIL] + _mentor_emails()
-    _send(recipients, f"Weekly update: {user_name}'s job search", html)
+        rows.append(("Followup needed", f"{followup_needed} pending · {decision_needed} need a decision"))
+    rows += [
+        ("Current streak", f"{current_streak} days"),
+        ("Longest streak", f"{longest_streak} days"),
+        ("Level", f"Level {level}: {level_name}"),
+        ("Total points", points),
+    ]
+    return WEEKLY_SUMMARY.render(
+        user_name=user_name,
+        rows=render_rows(SUMMARY_ROW, ({"label": label, "value": value} for label, value in rows)),
+    )
 
 
-def notify_followup_digest(
+def notify_weekly_summary(
+    db: Session,
     user_name: str,
-    needs_followup: list,
-    needs_decision: list,
+    current_streak: int,
+    longest_streak: int,
+    level: int,
+    level_name: str,
+    points: int,
+    total_apps: int,
+    apps_this_week: int,
+    response_rate: int,
+    interview_rate: int,
+    active_apps: int,
+    followup_needed: int = 0,
+    decision_needed: int = 0,
+    *,
+    email: str,
 ) -> None:
-    def app_row(item):
-        return (
-            f"<tr>"
-            f"<td style='padding:8px;border:1px solid #ddd'>{item['company']}</td>"
-            f"<td style='padding:8px;border:1px solid #ddd'>{item['position']}</td>"
-            f"<td style='padding:8px;border:1px solid #ddd'>{item['status']}</td>"
-            f"<td style='padding:8px;border:1px solid #ddd'>{item['days_stale']} days</td>"
-            f"</tr>"
-        )
+    html = render_weekly_summary(
+        user_name, current_streak, longest_streak, level, level_name, points, total_apps,
+        apps_this_week, response_rate, interview_rate, active_apps, followup_needed, decision_needed,
+    )
+    recipients = [email] + _mentor_emails(email)
+    _send(db, recipients, f"Weekly update: {user_name}'s job search", html, reply_to=email)
 
-    def decision_row(item):
-        return (
-            f"<tr>"
-            f"<td style='padding:8px;border:1px solid #ddd'>{item['company']}</td>"
-            f"<td style='padding:8px;border:1px solid #ddd'>{item['position']}</td>"
-            f"<td style='padding:8px;border:1px solid #ddd'>{item['followed_up_days_ago']} days ago</td>"
-            f"</tr>"
-        )
 
-    followup_section = ""
+@_cached
+def render_followup_digest(user_name: str, needs_followup: list, needs_decision: list) -> Markup:
+    followup_section = Markup("")
     if needs_followup:
-        rows = "".join(app_row(i) for i in needs_followup)
-        followup_section = f"""
-        <h3 style="color:#d97706">⏰ Needs Followup ({len(needs_followup)})</h3>
-        <table style="border-collapse:collapse;width:100%;font-family:sans-serif">
-            <tr style="background:#fef3c7">
-                <th style="padding:8px;border:1px solid #ddd;text-align:left">Company</th>
-                <th style="padding:8px;border:1px solid #ddd;text-align:left">Position</th>
-                <th style="padding:8px;border:1px solid #ddd;text-align:left">Status</th>
-                <th style="padding:8px;border:1px solid #ddd;text-align:left">Stale</th>
-            </tr>
-            {rows}
-        </table>
-        """
+        followup_section = FOLLOWUP_SECTION.render(
+            count=len(needs_followup), rows=render_rows(FOLLOWUP_ROW, needs_followup),
+        )
 
-    decision_section = ""
+    decision_section = Markup("")
     if needs_decision:
-        rows = "".join(decision_row(i) for i in needs_decision)
-        decision_section = f"""
-        <h3 style="color:#dc2626">🔴 Needs Decision ({len(needs_decision)})</h3>
-        <p style="color:#6b7280;font-size:14px">You followed up on these — time to mark them Ghosted, Rejected, or advance to the next round.</p>
-        <table style="border-collapse:collapse;width:100%;font-family:sans-serif">
-            <tr style="background:#fee2e2">
-                <th style="padding:8px;border:1px solid #ddd;text-align:left">Company</th>
-                <th style="padding:8px;border:1px solid #ddd;text-align:left">Position</th>
-                <th style="padding:8px;border:1px solid #ddd;text-align:left">Followed up</th>
-            </tr>
-            {rows}
-        </table>
-        """
+        decision_section = DECISION_SECTION.render(
+            count=len(needs_decision), rows=render_rows(DECISION_ROW, needs_decision),
+        )
 
-    html = f"""
-    <h2>Followup Queue — {user_name} 🔔</h2>
-    {followup_section}
-    {decision_section}
-    <p style="color:#6b7280;font-size:13px;margin-top:16px">Visit the Followup Queue in ApplyQuest to take action.</p>
-    """
-    _send([settings.USER_EMAIL], "Followup Queue — applications need your attention", html)
+    return FOLLOWUP_DIGEST.render(
+        user_name=user_name, followup_section=followup_section, decision_section=decision_section,
+    )
+
+
+def notify_followup_digest(
+    db: Session,
+    user_name: str,
+    needs_followup: list,
+    needs_decision: list,
+    *,
+    email: str,
+) -> None:
+    html = render_followup_digest(user_name, needs_followup, needs_decision)
+    _send(db, [email], "Followup Queue — applications need your attention", html)
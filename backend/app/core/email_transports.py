@@ -0,0 +1,173 @@
+"""
+Delivery backends for the email outbox, selected with EMAIL_TRANSPORT:
+
+- resend: the Resend batch API (production)
+- smtp:   any SMTP server, e.g. a local aiosmtpd stand-in for load tests
+- mbox:   append every message to one mbox file (EMAIL_SINK_PATH)
+- file:   write each message as a .eml file into a directory (EMAIL_SINK_PATH)
+
+A transport receives a batch of outbox messages (dicts with id, recipients,
+subject, html and an optional reply_to) and returns {message id: exception} for the messages it
+could not deliver; the rest count as sent. Raising means none went out.
+"""
+import hashlib
+import mailbox
+import smtplib
+import threading
+from email.message import EmailMessage
+from pathlib import Path
+
+import resend
+
+from app.core.config import settings
+
+
+def _mime(message: dict) -> EmailMessage:
+    mime = EmailMessage()
+    mime["From"] = settings.EMAIL_FROM
+    mime["To"] = ", ".join(message["recipients"])
+    if message.get("reply_to"):
+        mime["Reply-To"] = message["reply_to"]
+    mime["Subject"] = message["subject"]
+    mime["Message-ID"] = f"<{message['id']}@applyquest>"
+    mime.set_content(message["html"], subtype="html")
+    return mime
+
+
+class ResendTransport:
+    name = "resend"
+
+    def __init__(self):
+        resend.api_key = settings.RESEND_API_KEY
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings.RESEND_API_KEY)
+
+    @staticmethod
+    def _params(message: dict) -> dict:
+        params = {
+            "from": settings.EMAIL_FROM,
+            "to": message["recipients"],
+            "subject": message["subject"],
+            "html": message["html"],
+        }
+        if message.get("reply_to"):
+            params["reply_to"] = message["reply_to"]
+        return params
+
+    def send(self, messages: list[dict]) -> dict:
+        key = hashlib.sha256("".join(str(m["id"]) for m in messages).encode()).hexdigest()
+        try:
+            # A retried batch isn't delivered twice if the earlier call got through
+            resend.Batch.send([self._params(m) for m in messages], {"idempotency_key": key})
+            return {}
+        except Exception:
+            if len(messages) == 1:
+                raise
+        # The batch API accepts or rejects the whole batch, so one bad message
+        # (e.g. an invalid recipient) would hold back the others: send one by one
+        errors = {}
+        for message in messages:
+            try:
+                resend.Emails.send(self._params(message), {"idempotency_key": str(message["id"])})
+            except Exception as e:
+                errors[message["id"]] = e
+        return errors
+
+
+class SmtpTransport:
+    name = "smtp"
+    enabled = True
+
+    def send(self, messages: list[dict]) -> dict:
+        # One connection per batch; failing to connect or log in means none went out
+        smtp = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30)
+        try:
+            if settings.SMTP_STARTTLS:
+                smtp.starttls()
+            if settings.SMTP_USERNAME:
+                smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+            errors = {}
+            for i, message in enumerate(messages):
+                try:
+                    smtp.send_message(_mime(message))
+                except smtplib.SMTPServerDisconnected as e:
+                    # Connection lost: this and the remaining messages are retried later
+                    for rest in messages[i:]:
+                        errors[rest["id"]] = e
+                    break
+                except smtplib.SMTPException as e:
+                    # Refused recipient or content; the connection is still usable
+                    errors[message["id"]] = e
+                except OSError as e:
+                    # Socket error (SMTPException is an OSError too, hence last)
+                    for rest in messages[i:]:
+                        errors[rest["id"]] = e
+                    break
+            return errors
+        finally:
+            # Messages already accepted count as sent even if QUIT fails
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
+
+class MboxTransport:
+    name = "mbox"
+    enabled = True
+
+    def __init__(self):
+        self._path = Path(settings.EMAIL_SINK_PATH)
+        self._lock = threading.Lock()
+
+    def send(self, messages: list[dict]) -> dict:
+        with self._lock:
+            box = mailbox.mbox(self._path)
+            box.lock()
+            try:
+                for message in messages:
+                    box.add(_mime(message))
+                box.flush()
+            finally:
+                box.unlock()
+                box.close()
+        return {}
+
+
+class FileTransport:
+    name = "file"
+    enabled = True
+
+    def __init__(self):
+        self._dir = Path(settings.EMAIL_SINK_PATH)
+
+    def send(self, messages: list[dict]) -> dict:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        for message in messages:
+            (self._dir / f"{message['id']}.eml").write_bytes(_mime(message).as_bytes())
+        return {}
+
+
+TRANSPORTS = {
+    transport.name: transport
+    for transport in (ResendTransport, SmtpTransport, MboxTransport, FileTransport)
+}
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """The configured transport, built on first use."""
+    global _transport
+    with _transport_lock:
+        if _transport is None or _transport.name != settings.EMAIL_TRANSPORT:
+            try:
+                _transport = TRANSPORTS[settings.EMAIL_TRANSPORT]()
+            except KeyError:
+                raise ValueError(
+                    f"Unknown EMAIL_TRANSPORT {settings.EMAIL_TRANSPORT!r}, expected one of {', '.join(TRANSPORTS)}"
+                )
+        return _transport
@@ -1,16 +1,27 @@
-from datetime import date
+from datetime import date, datetime, time, timedelta
+from typing import Literal
+
+from sqlalchemy import and_, case, or_
+
+from app.models.application import Application, ApplicationStatus
 
 FOLLOWUP_STALE_DAYS = 7
 DECISION_STALE_DAYS = 3
 TERMINAL_STATUSES = {'Rejected', 'Ghosted'}
+FollowupClass = Literal['needs_followup', 'awaiting_response', 'needs_decision', 'ok']
 
 
 def _days_since(d: date, today: date) -> int:
     return (today - d).days
 
 
+def _is_terminal(app) -> bool:
+    # ORM rows carry ApplicationStatus members, whose str() is not the value
+    return getattr(app.status, 'value', app.status) in TERMINAL_STATUSES
+
+
 def needs_followup(app, today: date) -> bool:
-    if str(app.status) in TERMINAL_STATUSES:
+    if _is_terminal(app):
         return False
     if app.followed_up_at is not None:
         return False
@@ -19,7 +30,7 @@ def needs_followup(app, today: date) -> bool:
 
 
 def awaiting_response(app, today: date) -> bool:
-    if str(app.status) in TERMINAL_STATUSES:
+    if _is_terminal(app):
         return False
     if app.followed_up_at is None:
         return False
@@ -27,7 +38,7 @@ def awaiting_response(app, today: date) -> bool:
 
 
 def needs_decision(app, today: date) -> bool:
-    if str(app.status) in TERMINAL_STATUSES:
+    if _is_terminal(app):
         return False
     if app.followed_up_at is None:
         return False
@@ -43,3 +54,68 @@ def classify(app, today: date) -> str:
     if needs_followup(app, today):
         return 'needs_followup'
     return 'ok'
+
+
+# --- SQL equivalents of the rules above, for filtering in the database ---
+
+def _terminal_clause():
+    # Sorted so the statement text is stable and matches the partial index predicate
+    return Application.status.in_([ApplicationStatus(s) for s in sorted(TERMINAL_STATUSES)])
+
+
+def _last_activity_bounds(today: date) -> tuple[date, datetime]:
+    # last_activity <= cutoff  <=>  updated_at < start of the day after cutoff
+    cutoff = today - timedelta(days=FOLLOWUP_STALE_DAYS)
+    return cutoff, datetime.combine(cutoff + timedelta(days=1), time.min)
+
+
+def _stale_clause(today: date):
+    cutoff, before = _last_activity_bounds(today)
+    return or_(
+        Application.updated_at < before,
+        and_(Application.updated_at.is_(None), Application.applied_date <= cutoff),
+    )
+
+
+def _fresh_clause(today: date):
+    cutoff, before = _last_activity_bounds(today)
+    return or_(
+        Application.updated_at >= before,
+        and_(Application.updated_at.is_(None), Application.applied_date > cutoff),
+    )
+
+
+def followup_clause(klass: FollowupClass, today: date):
+    """SQL predicate selecting the applications classify() would put in `klass`."""
+    decision_cutoff = today - timedelta(days=DECISION_STALE_DAYS)
+    active = ~_terminal_clause()
+    if klass == 'needs_decision':
+        return and_(active, Application.followed_up_at <= decision_cutoff)
+    if klass == 'awaiting_response':
+        return and_(active, Application.followed_up_at > decision_cutoff)
+    if klass == 'needs_followup':
+        return and_(active, Application.followed_up_at.is_(None), _stale_clause(today))
+    if klass == 'ok':
+        return or_(
+            _terminal_clause(),
+            and_(Application.followed_up_at.is_(None), _fresh_clause(today)),
+        )
+    raise ValueError(f"Unknown followup class: {klass}")
+
+
+def actionable_clause(today: date):
+    """Rows classify() would not call 'ok': everything the followup queue shows."""
+    return and_(
+        ~_terminal_clause(),
+        or_(Application.followed_up_at.is_not(None), _stale_clause(today)),
+    )
+
+
+def followup_class_column(today: date):
+    """classify() as a SQL expression; only meaningful for rows matching actionable_clause()."""
+    decision_cutoff = today - timedelta(days=DECISION_STALE_DAYS)
+    return case(
+        (Application.followed_up_at <= decision_cutoff, 'needs_decision'),
+        (Application.followed_up_at.is_not(None), 'awaiting_response'),
+        else_='needs_followup',
+    )
@@ -2,7 +2,9 @@ from datetime import datetime, timedelta, timezone
 from app.models.user import User
 from app.models.point_history import PointHistory
 from app.core.working_days import load_off_days, streak_is_unbroken
+from sqlalchemy import case, func, insert, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from uuid import UUID
 
 LEVELS = [
@@ -24,7 +26,8 @@ def add_points(
 ):
     """
     Add points to user via PointHistory for audit trail.
-    This creates a point history record and updates user level/streak.
+    This creates a point history record, bumps the user's running points
+    total and updates level/streak.
     The caller is responsible for committing the transaction.
     """
     # Create point history record
@@ -36,23 +39,82 @@ def add_points(
         reference_id=reference_id
     )
     db.add(point_record)
-    
-    # Refresh user to get updated points from relationship
-    db.flush()  # Ensure point_record is in session
-    db.refresh(user)
-    
-    # Calculate Level based on total points
-    old_level = user.level
+
+    _apply_points(db, user, points)
+    db.add(user)
+    return user
+
+
+def add_points_bulk(db: Session, user: User, entries: list[dict]):
+    """
+    Record many point awards for one user at once.
+    Each entry holds points, reason and optionally reference_type/reference_id.
+    The ledger rows go out as one executemany INSERT and the total, level and
+    streak are updated once for the combined points.
+    The caller is responsible for committing the transaction.
+    """
+    if not entries:
+        return user
+    db.execute(
+        insert(PointHistory),
+        [
+            {
+                "user_id": user.id,
+                "points": entry["points"],
+                "reason": entry["reason"],
+                "reference_type": entry.get("reference_type"),
+                "reference_id": entry.get("reference_id"),
+            }
+            for entry in entries
+        ],
+    )
+    _apply_points(db, user, sum(entry["points"] for entry in entries))
+    db.add(user)
+    return user
+
+
+def _level_for(points: int) -> dict:
+    """The highest level reached with `points` total points."""
+    reached = LEVELS[0]
     for level_data in LEVELS:
-        if user.points >= level_data["minPoints"]:
-            user.level = level_data["level"]
-            user.level_name = level_data["name"]
+        if points >= level_data["minPoints"]:
+            reached = level_data
+    return reached
+
+
+def _level_case(total, key: str):
+    return case(
+        *[(total >= level_data["minPoints"], level_data[key]) for level_data in reversed(LEVELS)],
+        else_=LEVELS[0][key],
+    )
+
+
+def _apply_points(db: Session, user: User, points: int) -> None:
+    """Bump the running total and update level and streak for `points` earned now."""
+    _update_streak(user)
 
-    if user.level > old_level:
+    # Keep the denormalized total in step with the ledger. One UPDATE ...
+    # RETURNING so concurrent awards add up instead of overwriting each other,
+    # with the level derived from the new total in the same statement.
+    table = User.__table__
+    total = table.c.points + points
+    row = db.execute(
+        update(table)
+        .where(table.c.id == user.id)
+        .values(points=total, level=_level_case(total, "level"), level_name=_level_case(total, "name"))
+        .returning(table.c.points, table.c.level, table.c.level_name)
+    ).one()
+    # Loaded, not changed: the ORM must not write these back on flush
+    for key in ("points", "level", "level_name"):
+        set_committed_value(user, key, getattr(row, key))
+
+    if _level_for(row.points)["level"] > _level_for(row.points - points)["level"]:
         from app.core.email import notify_level_up
-        notify_level_up(user.name, user.level, user.level_name, user.points)
-    
-    # Update Streak
+        notify_level_up(db, user.name, row.level, row.level_name, row.points, email=user.email)
+
+
+def _update_streak(user: User) -> None:
+    # Reads updated_at (the last-activity marker) before this award moves it
     now = datetime.now(timezone.utc)
     today = now.date()
     
@@ -62,10 +124,9 @@ def add_points(
     else:
         last_active_date = user.updated_at.date()
 
-        off_days = load_off_days()
         if last_active_date == today:
             pass  # Already active today, streak unchanged
-        elif streak_is_unbroken(last_active_date, today, off_days):
+        elif streak_is_unbroken(last_active_date, today, load_off_days()):
             user.current_streak += 1
         else:
             user.current_streak = 1
@@ -73,9 +134,33 @@ def add_points(
         # Update longest streak
         if user.current_streak > user.longest_streak:
             user.longest_streak = user.current_streak
-    
-    db.add(user)
-    return user
+
+
+def ledger_totals(db: Session) -> dict[UUID, int]:
+    """Sum of PointHistory per user, straight from the ledger."""
+    rows = (
+        db.query(PointHistory.user_id, func.coalesce(func.sum(PointHistory.points), 0))
+        .group_by(PointHistory.user_id)
+        .all()
+    )
+    return {user_id: int(total) for user_id, total in rows}
+
+
+def reconcile_points(db: Session, fix: bool = False) -> list[tuple[User, int, int]]:
+    """
+    Compare every user's stored points with the ledger.
+    Returns (user, stored, ledger) for each mismatch; with fix=True the stored
+    totals are overwritten (caller commits).
+    """
+    totals = ledger_totals(db)
+    mismatches = []
+    for user in db.query(User).all():
+        ledger = totals.get(user.id, 0)
+        if user.points != ledger:
+            mismatches.append((user, user.points, ledger))
+            if fix:
+                user.points = ledger
+    return mismatches
 
 
 # Legacy function for backward compatibility - deprecated
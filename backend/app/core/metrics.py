@@ -0,0 +1,41 @@
+import threading
+from collections import deque
+
+
+class LatencyRecorder:
+    """
+    Thread-safe recorder for durations (seconds) over a sliding window of the
+    most recent samples. Keeps a running count and total for the lifetime of
+    the process and reports percentiles in milliseconds.
+    """
+
+    def __init__(self, window: int = 1024):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total = self.count, self.total
+
+        def pct(p: float) -> float | None:
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 3)
+
+        return {
+            "count": count,
+            "mean_ms": round(total / count * 1000, 3) if count else None,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+            "max_ms": round(samples[-1] * 1000, 3) if samples else None,
+        }
@@ -0,0 +1,45 @@
+"""
+Per-user application counter and milestone detection.
+
+The counter is bumped with UPDATE ... RETURNING in the caller's transaction.
+The row lock taken by that UPDATE serializes concurrent creates for the same
+user, so each milestone is claimed by exactly one transaction via
+user.last_milestone.
+"""
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.user import User
+
+_user = User.__table__
+
+
+def configured_milestones() -> list[int]:
+    return sorted({int(m) for m in settings.APPLICATION_MILESTONES.split(",") if m.strip()})
+
+
+def record_applications(db: Session, user_id: UUID, delta: int) -> list[int]:
+    """
+    Add `delta` (negative for deletes) to the user's application count and
+    return the milestones reached for the first time, in ascending order.
+    Notify only after the caller commits.
+    """
+    # updated_at is pinned: it is the streak's last-activity marker
+    count, last_milestone = db.execute(
+        update(_user)
+        .where(_user.c.id == user_id)
+        .values(application_count=_user.c.application_count + delta, updated_at=_user.c.updated_at)
+        .returning(_user.c.application_count, _user.c.last_milestone)
+    ).one()
+
+    reached = [m for m in configured_milestones() if last_milestone < m <= count]
+    if reached:
+        db.execute(
+            update(_user)
+            .where(_user.c.id == user_id)
+            .values(last_milestone=reached[-1], updated_at=_user.c.updated_at)
+        )
+    return reached
@@ -0,0 +1,254 @@
+"""
+Durable outbound email queue.
+
+email._send() adds each message to the caller's session, so it is stored
+(and later sent) only if the caller's transaction commits; the workers are
+woken after that commit. A fixed pool of worker threads claims due messages
+in batches, hands them to the configured transport
+(app/core/email_transports.py) and retries failed messages with exponential
+backoff. Anything not sent before shutdown stays in the table and goes out
+after the next start.
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import and_, event, func, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.email_transports import get_transport
+from app.core.metrics import LatencyRecorder
+from app.models.email_outbox import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+# A claimed message that isn't settled within this window is claimed again,
+# which covers a worker or process dying mid-send
+CLAIM_LEASE = timedelta(minutes=5)
+# Longest gap between retries
+MAX_BACKOFF = timedelta(hours=1)
+# Idle workers re-check for due retries this often (seconds)
+POLL_INTERVAL = 30.0
+
+# Serializes claims between this process's workers; Postgres row locks
+# (SKIP LOCKED) keep other processes from claiming the same rows
+_claim_lock = threading.Lock()
+
+
+class _Stats:
+    def __init__(self):
+        self.send_latency = LatencyRecorder()  # per batch handed to the transport
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, n in counts.items():
+                setattr(self, name, getattr(self, name) + n)
+
+
+stats = _Stats()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _new_session() -> Session:
+    from app.db.session import SessionLocal
+    return SessionLocal()
+
+
+# session.info flag: this transaction queued mail, wake a worker once it commits
+_QUEUED = "outbox_queued"
+
+
+def enqueue(db: Session, to: list[str], subject: str, html: str, reply_to: Optional[str] = None) -> None:
+    """Queue a message in the caller's transaction; it is sent once that commits."""
+    db.add(EmailOutbox(recipients=list(to), subject=subject, html=html, reply_to=reply_to))
+    db.info[_QUEUED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_after_commit(session: Session) -> None:
+    if session.info.pop(_QUEUED, False):
+        _pool.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_after_rollback(session: Session) -> None:
+    session.info.pop(_QUEUED, None)
+
+
+def _claim(db: Session, limit: int) -> list[dict]:
+    now = _now()
+    with _claim_lock:
+        rows = (
+            db.query(EmailOutbox)
+            .filter(
+                or_(EmailOutbox.status == "pending", EmailOutbox.status == "sending"),
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        claimed = []
+        for row in rows:
+            row.status = "sending"
+            row.attempts += 1
+            row.next_attempt_at = now + CLAIM_LEASE
+            claimed.append({
+                "id": row.id,
+                "recipients": row.recipients,
+                "subject": row.subject,
+                "html": row.html,
+                "reply_to": row.reply_to,
+                "attempts": row.attempts,
+            })
+        db.commit()
+    return claimed
+
+
+def _settle(db: Session, messages: list[dict], errors: dict) -> None:
+    """Mark delivered messages sent and schedule a retry (or give up) for each one in `errors`."""
+    now = _now()
+    sent = [m["id"] for m in messages if m["id"] not in errors]
+    if sent:
+        db.query(EmailOutbox).filter(EmailOutbox.id.in_(sent)).update(
+            {"status": "sent", "sent_at": now, "last_error": None}, synchronize_session=False
+        )
+        stats.add(sent=len(sent))
+    for m in messages:
+        error = errors.get(m["id"])
+        if error is not None:
+            attempts = m["attempts"]
+            if attempts >= settings.EMAIL_MAX_ATTEMPTS:
+                values = {"status": "failed"}
+                stats.add(failed=1)
+                logger.error("Giving up on email after %d attempts: %s", attempts, m["subject"])
+            else:
+                stats.add(retried=1)
+                delay = min(timedelta(seconds=settings.EMAIL_RETRY_BASE * 2 ** (attempts - 1)), MAX_BACKOFF)
+                values = {"status": "pending", "next_attempt_at": now + delay}
+            values["last_error"] = repr(error)
+            db.query(EmailOutbox).filter(
+                and_(EmailOutbox.id == m["id"], EmailOutbox.status == "sending")
+            ).update(values, synchronize_session=False)
+    db.commit()
+
+
+def process_batch() -> int:
+    """Claim and send one batch of due messages. Returns how many were claimed."""
+    db = _new_session()
+    try:
+        messages = _claim(db, settings.EMAIL_BATCH_SIZE)
+        if not messages:
+            return 0
+        started = time.perf_counter()
+        try:
+            errors = get_transport().send(messages)
+        except Exception as e:
+            logger.exception("Failed to send %d email(s)", len(messages))
+            errors = {m["id"]: e for m in messages}
+        else:
+            for message_id, error in errors.items():
+                logger.warning("Failed to send email %s: %r", message_id, error)
+        finally:
+            stats.send_latency.record(time.perf_counter() - started)
+        _settle(db, messages, errors)
+        return len(messages)
+    finally:
+        db.close()
+
+
+def flush() -> None:
+    """Send everything that is due now, on the calling thread (used by CLI scripts)."""
+    while process_batch():
+        pass
+
+
+class _WorkerPool:
+    def __init__(self):
+        self._threads: list[threading.Thread] = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._deadline = float("inf")
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def start(self, workers: int) -> None:
+        if self._threads:
+            return
+        self._stopping.clear()
+        self._deadline = float("inf")
+        self._threads = [
+            threading.Thread(target=self._run, name=f"email-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float) -> None:
+        """Send what is already due, for at most `timeout` seconds, then stop the workers."""
+        self._deadline = time.monotonic() + timeout
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(max(0.0, self._deadline - time.monotonic()))
+        self._threads = []
+
+    def _run(self) -> None:
+        while time.monotonic() < self._deadline:
+            try:
+                sent = process_batch()
+            except Exception:
+                logger.exception("Email worker error")
+                sent = 0
+            if sent:
+                continue
+            if self._stopping.is_set():
+                return
+            self._wakeup.wait(POLL_INTERVAL)
+            self._wakeup.clear()
+
+
+_pool = _WorkerPool()
+
+
+def queue_depth(db: Session) -> dict:
+    """Messages waiting per status (pending includes scheduled retries)."""
+    rows = (
+        db.query(EmailOutbox.status, func.count(EmailOutbox.id))
+        .filter(EmailOutbox.status.in_(("pending", "sending")))
+        .group_by(EmailOutbox.status)
+        .all()
+    )
+    return {"pending": 0, "sending": 0, **dict(rows)}
+
+
+def snapshot(db: Session) -> dict:
+    return {
+        "transport": settings.EMAIL_TRANSPORT,
+        "workers": len(_pool._threads),
+        "queue": queue_depth(db),
+        "sent": stats.sent,
+        "retried": stats.retried,
+        "failed": stats.failed,
+        "send": stats.send_latency.snapshot(),
+    }
+
+
+def start_workers() -> None:
+    _pool.start(settings.EMAIL_WORKERS)
+
+
+def stop_workers() -> None:
+    _pool.stop(settings.EMAIL_DRAIN_TIMEOUT)
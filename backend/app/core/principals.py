@@ -0,0 +1,60 @@
+"""
+Short-lived cache of authenticated users, keyed by the token subject.
+
+Entries are user_schema.User snapshots, detached from any session. A commit
+that wrote a User row or bumped the user's data version (which Core updates
+such as the points total also do, via their ledger rows) evicts it; other
+writes made outside the ORM are picked up when the TTL runs out.
+"""
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.db.data_version import BUMPED_USERS
+from app.models.user import User
+from app.schemas import user as user_schema
+
+_CHANGED_USERS = "principals_changed_users"
+
+_principals = LRUCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL)
+
+
+def get(user_id: UUID) -> Optional[user_schema.User]:
+    return _principals.get(user_id)
+
+
+def remember(user: User) -> user_schema.User:
+    principal = user_schema.User.model_validate(user)
+    _principals.set(user.id, principal)
+    return principal
+
+
+def forget(user_id: UUID) -> None:
+    _principals.pop(user_id)
+
+
+def clear() -> None:
+    _principals.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_writes(session: Session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            session.info.setdefault(_CHANGED_USERS, set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_after_commit(session: Session) -> None:
+    for user_id in session.info.pop(_CHANGED_USERS, set()) | session.info.pop(BUMPED_USERS, set()):
+        forget(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_CHANGED_USERS, None)
+    session.info.pop(BUMPED_USERS, None)
@@ -5,9 +5,11 @@ import pytz
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-logger = logging.getLogger(__name__)
+from app.core import outbox
+from app.core.fanout import run_for_all_users
+from app.core.working_days import BERLIN, berlin_today, load_off_days
 
-BERLIN = pytz.timezone("Europe/Berlin")
+logger = logging.getLogger(__name__)
 
 scheduler = BackgroundScheduler(timezone=BERLIN)
 
@@ -20,171 +22,140 @@ def _utc_naive_to_berlin_date(naive_utc_dt):
     return utc_dt.astimezone(BERLIN).date()
 
 
-def _load_user(db):
-    from app.models.user import User
-    from app.core.config import settings
-    return db.query(User).filter(User.email == settings.USER_EMAIL).first()
+# --- Per-user steps, run for every user by fanout.run_for_all_users ---
 
-
-def job_daily_reminder():
-    """8 PM Berlin — remind user if no activity today (skips off-days)."""
-    from datetime import datetime
-    from app.db.session import SessionLocal
-    from app.core.working_days import load_off_days, _is_off_day
+def _daily_reminder(db, user, today) -> bool:
     from app.core.email import notify_daily_reminder
 
-    today = datetime.now(BERLIN).date()
-    if _is_off_day(today, load_off_days()):
-        return
-
-    db = SessionLocal()
-    try:
-        user = _load_user(db)
-        if user is None:
-            return
-        if _utc_naive_to_berlin_date(user.updated_at) == today:
-            return  # Already active today
-        notify_daily_reminder(user.name, user.current_streak)
-    except Exception:
-        logger.exception("Error in daily reminder job")
-    finally:
-        db.close()
+    if _utc_naive_to_berlin_date(user.updated_at) == today:
+        return False  # Already active today
+    notify_daily_reminder(db, user.name, user.current_streak, email=user.email)
+    return True
 
 
-def job_streak_check():
-    """Midnight Berlin — notify mentors if yesterday's streak was broken (skips off-days)."""
-    from datetime import datetime
-    from app.db.session import SessionLocal
-    from app.core.working_days import load_off_days, _is_off_day
+def _streak_check(db, user, yesterday) -> bool:
     from app.core.email import notify_streak_broken
 
-    now = datetime.now(BERLIN)
-    yesterday = (now - timedelta(days=1)).date()
-    if _is_off_day(yesterday, load_off_days()):
-        return  # Streak can't break on off-days
+    if _utc_naive_to_berlin_date(user.updated_at) == yesterday:
+        return False  # Was active yesterday — streak intact
+    notify_streak_broken(db, user.name, user.current_streak, email=user.email)
+    return True
 
-    db = SessionLocal()
-    try:
-        user = _load_user(db)
-        if user is None:
-            return
-        if user.current_streak <= 1:
-            return  # No streak worth reporting
-        if _utc_naive_to_berlin_date(user.updated_at) == yesterday:
-            return  # Was active yesterday — streak intact
-        notify_streak_broken(user.name, user.current_streak)
-    except Exception:
-        logger.exception("Error in streak check job")
-    finally:
-        db.close()
 
-
-def job_weekly_summary():
-    """Sunday 7 PM Berlin — send weekly summary to mentors."""
-    from datetime import datetime
-    from app.db.session import SessionLocal
-    from app.models.application import Application
+def _weekly_summary(db, user, today) -> bool:
     from app.core.email import notify_weekly_summary
+    from app.core.summary import weekly_counts
+
+    counts = weekly_counts(db, user.id, week_start=today - timedelta(days=7), today=today)
+    total = counts["total"]
+
+    notify_weekly_summary(
+        db,
+        user_name=user.name,
+        current_streak=user.current_streak,
+        longest_streak=user.longest_streak,
+        level=user.level,
+        level_name=user.level_name,
+        points=user.points,
+        total_apps=total,
+        apps_this_week=counts["this_week"],
+        response_rate=round((counts["responded"] / total) * 100) if total else 0,
+        interview_rate=round((counts["interviewed"] / total) * 100) if total else 0,
+        active_apps=counts["active"],
+        followup_needed=counts["followup_needed"],
+        decision_needed=counts["decision_needed"],
+        email=user.email,
+    )
+    return True
+
+
+def _followup_digest(db, user, today) -> bool:
+    from sqlalchemy import or_
+    from app.models.application import Application
+    from app.core.email import notify_followup_digest
+    from app.core.followup import followup_class_column, followup_clause
+
+    # Only the actionable rows leave the database (ix_application_followup_queue)
+    klass = followup_class_column(today).label("klass")
+    rows = (
+        db.query(
+            klass,
+            Application.company_name,
+            Application.position_title,
+            Application.status,
+            Application.applied_date,
+            Application.updated_at,
+            Application.followed_up_at,
+        )
+        .filter(
+            Application.user_id == user.id,
+            or_(followup_clause('needs_followup', today), followup_clause('needs_decision', today)),
+        )
+        .all()
+    )
+
+    followup_apps = [
+        {
+            "company": r.company_name,
+            "position": r.position_title,
+            "status": r.status.value,
+            "days_stale": (today - (r.updated_at.date() if r.updated_at else r.applied_date)).days,
+        }
+        for r in rows if r.klass == 'needs_followup'
+    ]
+    decision_apps = [
+        {
+            "company": r.company_name,
+            "position": r.position_title,
+            "followed_up_days_ago": (today - r.followed_up_at).days,
+        }
+        for r in rows if r.klass == 'needs_decision'
+    ]
+
+    if not followup_apps and not decision_apps:
+        return False
+
+    notify_followup_digest(db, user.name, followup_apps, decision_apps, email=user.email)
+    return True
+
+
+# --- Jobs ---
 
-    db = SessionLocal()
-    try:
-        user = _load_user(db)
-        if user is None:
-            return
+def job_daily_reminder():
+    """8 PM Berlin — remind every user with no activity today (skips off-days)."""
+    today = berlin_today()
+    if load_off_days().is_off_day(today):
+        return
+    run_for_all_users("daily_reminder", lambda db, user: _daily_reminder(db, user, today))
 
-        applications = db.query(Application).filter(Application.user_id == user.id).all()
-        total = len(applications)
 
-        week_start = datetime.now(BERLIN).date() - timedelta(days=7)
-        apps_this_week = sum(
-            1 for a in applications
-            if a.created_at and a.created_at.date() >= week_start
-        )
-        responded = sum(1 for a in applications if a.status not in ("Applied", "Ghosted"))
-        interviewed = sum(
-            1 for a in applications
-            if a.status in ("Phone Screen", "Technical Round 1", "Technical Round 2", "Final Round")
-        )
-        active = sum(1 for a in applications if a.status not in ("Rejected", "Ghosted", "Offer"))
-
-        from datetime import datetime as dt
-        from app.core.followup import needs_followup, needs_decision
-
-        today = dt.now(BERLIN).date()
-        followup_needed = sum(1 for a in applications if needs_followup(a, today))
-        decision_needed = sum(1 for a in applications if needs_decision(a, today))
-
-        notify_weekly_summary(
-            user_name=user.name,
-            current_streak=user.current_streak,
-            longest_streak=user.longest_streak,
-            level=user.level,
-            level_name=user.level_name,
-            points=user.points,
-            total_apps=total,
-            apps_this_week=apps_this_week,
-            response_rate=round((responded / total) * 100) if total else 0,
-            interview_rate=round((interviewed / total) * 100) if total else 0,
-            active_apps=active,
-            followup_needed=followup_needed,
-            decision_needed=decision_needed,
-        )
-    except Exception:
-        logger.exception("Error in weekly summary job")
-    finally:
-        db.close()
+def job_streak_check():
+    """Midnight Berlin — notify the owner's mentors of a streak broken yesterday (skips off-days)."""
+    from app.models.user import User
+
+    yesterday = berlin_today() - timedelta(days=1)
+    if load_off_days().is_off_day(yesterday):
+        return  # Streak can't break on off-days
 
+    run_for_all_users(
+        "streak_check",
+        lambda db, user: _streak_check(db, user, yesterday),
+        User.current_streak > 1,  # No streak worth reporting otherwise
+    )
 
-def job_followup_digest():
-    """9 AM Berlin — send followup digest if there are actionable items (skips off-days)."""
-    from datetime import datetime
-    from app.db.session import SessionLocal
-    from app.models.application import Application, ApplicationStatus
-    from app.core.working_days import load_off_days, _is_off_day
-    from app.core.email import notify_followup_digest
-    from app.core.followup import needs_followup, needs_decision, FOLLOWUP_STALE_DAYS, DECISION_STALE_DAYS
 
-    today = datetime.now(BERLIN).date()
-    if _is_off_day(today, load_off_days()):
-        return
+def job_weekly_summary():
+    """Sunday 7 PM Berlin — send every user their weekly summary (the owner's also goes to the mentors)."""
+    today = berlin_today()
+    run_for_all_users("weekly_summary", lambda db, user: _weekly_summary(db, user, today))
 
-    db = SessionLocal()
-    try:
-        user = _load_user(db)
-        if user is None:
-            return
 
-        applications = db.query(Application).filter(
-            Application.user_id == user.id,
-            Application.status != ApplicationStatus.REJECTED,
-        ).all()
-
-        followup_apps = [
-            {
-                "company": a.company_name,
-                "position": a.position_title,
-                "status": a.status.value if hasattr(a.status, 'value') else str(a.status),
-                "days_stale": (today - (a.updated_at.date() if a.updated_at else a.applied_date)).days,
-            }
-            for a in applications if needs_followup(a, today)
-        ]
-        decision_apps = [
-            {
-                "company": a.company_name,
-                "position": a.position_title,
-                "followed_up_days_ago": (today - a.followed_up_at).days,
-            }
-            for a in applications if needs_decision(a, today)
-        ]
-
-        if not followup_apps and not decision_apps:
-            return
-
-        notify_followup_digest(user.name, followup_apps, decision_apps)
-    except Exception:
-        logger.exception("Error in followup digest job")
-    finally:
-        db.close()
+def job_followup_digest():
+    """9 AM Berlin — send each user a followup digest if they have actionable items (skips off-days)."""
+    today = berlin_today()
+    if load_off_days().is_off_day(today):
+        return
+    run_for_all_users("followup_digest", lambda db, user: _followup_digest(db, user, today))
 
 
 def start_scheduler():
@@ -193,9 +164,12 @@ def start_scheduler():
     scheduler.add_job(job_weekly_summary, CronTrigger(day_of_week="sun", hour=19, minute=0, timezone=BERLIN))
     scheduler.add_job(job_followup_digest, CronTrigger(hour=9, minute=0, timezone=BERLIN))
     scheduler.start()
+    outbox.start_workers()
     logger.info("Scheduler started")
 
 
 def stop_scheduler():
     scheduler.shutdown(wait=False)
+    # Give queued notifications a chance to go out; the rest stay in the outbox
+    outbox.stop_workers()
     logger.info("Scheduler stopped")
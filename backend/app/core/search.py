@@ -0,0 +1,97 @@
+"""
+Full-text search over applications and network contacts.
+
+On Postgres both tables carry a generated `search_vector` tsvector column
+with a GIN index (migration b4c5d6e7f8a9). Every word of the query is a
+prefix match ("kot eng" finds "Kotlin Engineer") and hits are ordered by
+ts_rank over the weighted fields. The columns are not mapped on the models;
+other databases (the SQLite test suite) fall back to ILIKE over the same
+fields, ordered by recency.
+"""
+import re
+from typing import Literal, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, cast, func, literal, literal_column, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session
+
+from app.models.application import Application
+from app.models.network import NetworkContact
+
+Kind = Literal["application", "contact"]
+
+# 'simple' keeps company names and technologies unstemmed; must match the migration
+TEXT_SEARCH_CONFIG = "simple"
+
+_WORDS = re.compile(r"\w+")
+
+
+class _Source(NamedTuple):
+    model: type
+    title: object
+    subtitle: object
+    fields: tuple  # in weight order A, B, C, D, as in the generated column
+
+
+_SOURCES: dict[str, _Source] = {
+    "application": _Source(
+        Application, Application.company_name, Application.position_title,
+        (Application.company_name, Application.position_title, Application.tech_stack, Application.notes),
+    ),
+    "contact": _Source(
+        NetworkContact, NetworkContact.name, NetworkContact.company,
+        (NetworkContact.name, NetworkContact.company, NetworkContact.notes),
+    ),
+}
+
+
+def words(q: str) -> list[str]:
+    return _WORDS.findall(q.lower())
+
+
+def prefix_query(terms: list[str]) -> str:
+    """to_tsquery() input matching every term as a prefix: 'kot:* & eng:*'."""
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _query(db: Session, source: _Source, user_id: UUID, terms: list[str], limit: int):
+    model = source.model
+    columns = (model.id, source.title, source.subtitle)
+    if db.get_bind().dialect.name == "postgresql":
+        vector = literal_column(f"{model.__tablename__}.search_vector")
+        tsquery = func.to_tsquery(cast(TEXT_SEARCH_CONFIG, REGCONFIG), prefix_query(terms))
+        rank = func.ts_rank(vector, tsquery)
+        match = vector.op("@@")(tsquery)
+    else:
+        rank = literal(0.0)
+        match = and_(*(
+            or_(*(field.icontains(term, autoescape=True) for field in source.fields))
+            for term in terms
+        ))
+    return (
+        db.query(*columns, rank)
+        .filter(model.user_id == user_id, match)
+        .order_by(rank.desc(), model.updated_at.desc())
+        .limit(limit)
+    )
+
+
+def search(
+    db: Session,
+    user_id: UUID,
+    q: str,
+    kinds: Optional[list[Kind]] = None,
+    limit: int = 10,
+) -> list[dict]:
+    """The user's best matching applications and contacts, best first."""
+    terms = words(q)
+    if not terms:
+        return []
+    hits = []
+    for kind in kinds or list(_SOURCES):
+        for hit_id, title, subtitle, rank in _query(db, _SOURCES[kind], user_id, terms, limit):
+            hits.append({"kind": kind, "id": hit_id, "title": title, "subtitle": subtitle, "rank": float(rank)})
+    # Stable sort: equal ranks keep each source's recency order
+    hits.sort(key=lambda hit: -hit["rank"])
+    return hits[:limit]
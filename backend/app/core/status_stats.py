@@ -0,0 +1,138 @@
+"""
+Per-user status transition counts and dwell-time histograms.
+
+update_application_status records every change here in the same transaction
+as its history row, and deleting an application takes its history back out,
+so the tables always match a replay of ApplicationHistory while reads stay
+O(statuses²). rebuild() repopulates them from history
+(rebuild_status_stats.py).
+"""
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import Iterable, Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func
+from sqlalchemy.orm import Session
+
+from app.db import upsert
+from app.models.application import Application, ApplicationHistory, ApplicationStatus
+from app.models.status_stats import StatusDwell, StatusTransition
+
+# Upper bounds (days) of the dwell histogram buckets; the last bucket is open-ended
+DWELL_BUCKETS = (1, 3, 7, 14, 30, 60)
+DWELL_LABELS = ("<1d", "1-3d", "3-7d", "7-14d", "14-30d", "30-60d", "60d+")
+
+Event = tuple[ApplicationStatus, ApplicationStatus, Optional[int]]
+
+
+def dwell_bucket(entered_at: datetime, left_at: datetime) -> int:
+    return bisect_right(DWELL_BUCKETS, (left_at - entered_at).total_seconds() / 86400)
+
+
+def _events(created_at: Optional[datetime], history: Iterable[ApplicationHistory]) -> Iterator[Event]:
+    """(old, new, dwell bucket of the status left) for one application's history in order."""
+    entered_at = created_at
+    for record in history:
+        bucket = None
+        if entered_at is not None and record.changed_at is not None:
+            bucket = dwell_bucket(entered_at, record.changed_at)
+        yield record.old_status or ApplicationStatus.APPLIED, record.new_status, bucket
+        entered_at = record.changed_at
+
+
+def _upsert(session: Session, model, key: tuple[str, ...], rows: list[dict]) -> None:
+    if not rows:
+        return
+    stmt = upsert.insert(session, model).values(rows)
+    session.execute(stmt.on_conflict_do_update(
+        index_elements=list(key), set_={"count": model.count + stmt.excluded.count},
+    ))
+
+
+def _apply(session: Session, user_id: UUID, events: Iterable[Event], sign: int = 1) -> None:
+    transitions: Counter = Counter()
+    dwell: Counter = Counter()
+    for old, new, bucket in events:
+        transitions[old, new] += sign
+        if bucket is not None:
+            dwell[old, bucket] += sign
+    _upsert(session, StatusTransition, ("user_id", "old_status", "new_status"), [
+        {"user_id": user_id, "old_status": old, "new_status": new, "count": n}
+        for (old, new), n in transitions.items()
+    ])
+    _upsert(session, StatusDwell, ("user_id", "status", "bucket"), [
+        {"user_id": user_id, "status": status, "bucket": bucket, "count": n}
+        for (status, bucket), n in dwell.items()
+    ])
+
+
+def record(session: Session, application: Application, history: ApplicationHistory) -> None:
+    """Count a status change. Call before `history` is added to the session."""
+    if history.changed_at is None:
+        history.changed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    # The status being left was entered at the previous change, or at creation
+    entered_at = (
+        session.query(func.max(ApplicationHistory.changed_at))
+        .filter(ApplicationHistory.application_id == application.id)
+        .scalar()
+    ) or application.created_at
+    bucket = dwell_bucket(entered_at, history.changed_at) if entered_at else None
+    _apply(session, application.user_id, [
+        (history.old_status or ApplicationStatus.APPLIED, history.new_status, bucket)
+    ])
+
+
+def forget(session: Session, application: Application) -> None:
+    """Take a deleted application's history back out of the counts."""
+    history = sorted(application.history, key=lambda h: h.changed_at or datetime.min)
+    _apply(session, application.user_id, _events(application.created_at, history), sign=-1)
+
+
+def rebuild(db: Session, user_id: Optional[UUID] = None) -> int:
+    """Recompute the tables from ApplicationHistory (one user or everyone). Returns transitions counted."""
+    for model in (StatusTransition, StatusDwell):
+        stmt = delete(model)
+        if user_id is not None:
+            stmt = stmt.where(model.user_id == user_id)
+        db.execute(stmt)
+
+    query = (
+        db.query(Application.id, Application.user_id, Application.created_at, ApplicationHistory)
+        .join(ApplicationHistory, ApplicationHistory.application_id == Application.id)
+        .order_by(Application.user_id, Application.id, ApplicationHistory.changed_at)
+    )
+    if user_id is not None:
+        query = query.filter(Application.user_id == user_id)
+
+    total = 0
+    rows = query.yield_per(1000)
+    for owner, user_rows in groupby(rows, key=lambda row: row.user_id):
+        events: list[Event] = []
+        for _, app_rows in groupby(user_rows, key=lambda row: row.id):
+            app_rows = list(app_rows)
+            events.extend(_events(app_rows[0].created_at, (row.ApplicationHistory for row in app_rows)))
+        _apply(db, owner, events)
+        total += len(events)
+    return total
+
+
+def transition_counts(db: Session, user_id: UUID) -> list[tuple[ApplicationStatus, ApplicationStatus, int]]:
+    return (
+        db.query(StatusTransition.old_status, StatusTransition.new_status, StatusTransition.count)
+        .filter(StatusTransition.user_id == user_id, StatusTransition.count > 0)
+        .all()
+    )
+
+
+def dwell_histograms(db: Session, user_id: UUID) -> dict[str, list[int]]:
+    """Status -> count per DWELL_LABELS bucket."""
+    histograms: dict[str, list[int]] = {}
+    rows = db.query(StatusDwell.status, StatusDwell.bucket, StatusDwell.count).filter(
+        StatusDwell.user_id == user_id, StatusDwell.count > 0
+    )
+    for status, bucket, count in rows:
+        histograms.setdefault(status.value, [0] * len(DWELL_LABELS))[bucket] = count
+    return histograms
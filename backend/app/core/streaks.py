@@ -0,0 +1,83 @@
+from datetime import date, datetime, timezone
+from itertools import groupby
+from typing import Sequence
+
+from sqlalchemy import Date, bindparam, case, exists, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.working_days import OffDayCalendar, load_off_days, streak_is_unbroken, streak_runs
+from app.models.point_history import PointHistory
+from app.models.user import User
+
+# Users buffered per bulk UPDATE, also the fetch size of the server-side cursor
+BATCH_SIZE = 500
+
+_user = User.__table__
+
+# Only ever raises longest_streak, and pins updated_at so the rebuild doesn't
+# count as activity (updated_at is the "last active" marker for streaks).
+_UPDATE_STREAKS = (
+    update(_user)
+    .where(_user.c.id == bindparam("b_id"))
+    .values(
+        current_streak=bindparam("b_current"),
+        longest_streak=case(
+            (_user.c.longest_streak > bindparam("b_longest"), _user.c.longest_streak),
+            else_=bindparam("b_longest"),
+        ),
+        updated_at=_user.c.updated_at,
+    )
+)
+
+
+def compute_streaks(activity_dates: Sequence[date], today: date, calendar: OffDayCalendar) -> tuple[int, int]:
+    """(current, longest) streak for sorted, distinct activity dates."""
+    if not activity_dates:
+        return 0, 0
+    runs = streak_runs(activity_dates, calendar)
+    current = runs[-1]
+    last_active = activity_dates[-1]
+    if last_active < today and not streak_is_unbroken(last_active, today, calendar):
+        current = 0
+    return current, max(runs)
+
+
+def rebuild_all_streaks(db: Session, today: date | None = None, batch_size: int = BATCH_SIZE) -> tuple[int, int]:
+    """
+    Recompute current/longest streak for every user from the point ledger.
+
+    Distinct activity days are streamed per user from a server-side cursor, so
+    only one user's dates are held at a time, and results are written back in
+    executemany batches. Users without any activity are reset to 0.
+    Returns (users_recomputed, users_reset); the caller commits.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    calendar = load_off_days()
+
+    day = func.date(PointHistory.created_at, type_=Date).label("day")
+    stmt = (
+        select(PointHistory.user_id, day)
+        .distinct()
+        .order_by(PointHistory.user_id, day)
+        .execution_options(yield_per=batch_size)
+    )
+
+    recomputed = 0
+    pending: list[dict] = []
+    for user_id, rows in groupby(db.execute(stmt), key=lambda row: row.user_id):
+        current, longest = compute_streaks([row.day for row in rows], today, calendar)
+        pending.append({"b_id": user_id, "b_current": current, "b_longest": longest})
+        if len(pending) >= batch_size:
+            db.execute(_UPDATE_STREAKS, pending)
+            recomputed += len(pending)
+            pending = []
+    if pending:
+        db.execute(_UPDATE_STREAKS, pending)
+        recomputed += len(pending)
+
+    reset = db.execute(
+        update(_user)
+        .where(~exists().where(PointHistory.user_id == _user.c.id))
+        .values(current_streak=0, longest_streak=0, updated_at=_user.c.updated_at)
+    ).rowcount
+    return recomputed, reset
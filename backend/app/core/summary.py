@@ -0,0 +1,45 @@
+from datetime import date, datetime, time
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.followup import followup_clause
+from app.models.application import Application, ApplicationStatus
+
+INTERVIEW_STATUSES = [
+    ApplicationStatus.PHONE_SCREEN,
+    ApplicationStatus.TECHNICAL_ROUND_1,
+    ApplicationStatus.TECHNICAL_ROUND_2,
+    ApplicationStatus.FINAL_ROUND,
+]
+
+
+def weekly_counts(db: Session, user_id: UUID, week_start: date, today: date) -> dict[str, int]:
+    """
+    Application counts for the weekly summary in one aggregate query
+    (COUNT(*) FILTER (WHERE ...) per figure), without loading any rows.
+    """
+    def count_where(condition):
+        return func.count().filter(condition)
+
+    row = (
+        db.query(
+            func.count().label("total"),
+            count_where(Application.created_at >= datetime.combine(week_start, time.min)).label("this_week"),
+            count_where(
+                Application.status.notin_([ApplicationStatus.APPLIED, ApplicationStatus.GHOSTED])
+            ).label("responded"),
+            count_where(Application.status.in_(INTERVIEW_STATUSES)).label("interviewed"),
+            count_where(
+                Application.status.notin_(
+                    [ApplicationStatus.REJECTED, ApplicationStatus.GHOSTED, ApplicationStatus.OFFER]
+                )
+            ).label("active"),
+            count_where(followup_clause("needs_followup", today)).label("followup_needed"),
+            count_where(followup_clause("needs_decision", today)).label("decision_needed"),
+        )
+        .filter(Application.user_id == user_id)
+        .one()
+    )
+    return dict(row._mapping)
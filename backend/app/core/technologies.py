@@ -0,0 +1,120 @@
+"""
+Technology dictionary and application links derived from the free-text
+Application.tech_stack.
+
+sync() runs in the same transaction wherever tech_stack is written (create,
+update, bulk import, delete). Technology counts, "applications mentioning X"
+and co-occurrence are then index lookups instead of splitting every row's
+string.
+"""
+import re
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, insert, select
+from sqlalchemy.orm import Session, aliased
+
+from app.db import upsert
+from app.models.technology import ApplicationTechnology, Technology
+
+# Separators people use in tech stacks: "Python, Django / Postgres & Redis + K8s".
+# "+" only counts between spaces, so "C++" stays one name.
+_SEPARATORS = re.compile(r"[,/&]+|\s+\+\s+")
+
+
+def normalize(name: str) -> str:
+    return " ".join(name.split()).lower()
+
+
+def parse(tech_stack: Optional[str]) -> dict[str, str]:
+    """Normalized key -> display name for each technology in a tech stack string."""
+    technologies: dict[str, str] = {}
+    for part in _SEPARATORS.split(tech_stack or ""):
+        name = " ".join(part.split())
+        # One-letter fragments are noise ("C" is the usual casualty; write "C lang")
+        if len(name) > 1:
+            technologies.setdefault(name.lower(), name)
+    return technologies
+
+
+def _technology_ids(session: Session, names: dict[str, str]) -> dict[str, int]:
+    """Ids for `names`, adding the ones not in the dictionary yet."""
+    if not names:
+        return {}
+    stmt = upsert.insert(session, Technology).values(
+        [{"key": key, "name": name} for key, name in names.items()]
+    )
+    session.execute(stmt.on_conflict_do_nothing(index_elements=["key"]))
+    return dict(session.query(Technology.key, Technology.id).filter(Technology.key.in_(names)))
+
+
+def sync(session: Session, applications: Iterable[tuple[UUID, UUID, Optional[str]]]) -> None:
+    """Replace the links of each (application id, user id, tech stack); None clears them."""
+    parsed = [(app_id, user_id, parse(tech_stack)) for app_id, user_id, tech_stack in applications]
+    if not parsed:
+        return
+    names: dict[str, str] = {}
+    for _, _, technologies in parsed:
+        for key, name in technologies.items():
+            names.setdefault(key, name)
+    ids = _technology_ids(session, names)
+
+    session.execute(
+        delete(ApplicationTechnology).where(
+            ApplicationTechnology.application_id.in_([app_id for app_id, _, _ in parsed])
+        )
+    )
+    links = [
+        {"application_id": app_id, "technology_id": ids[key], "user_id": user_id}
+        for app_id, user_id, technologies in parsed
+        for key in technologies
+    ]
+    if links:
+        session.execute(insert(ApplicationTechnology), links)
+
+
+def sync_application(session: Session, application) -> None:
+    sync(session, [(application.id, application.user_id, application.tech_stack)])
+
+
+def application_ids_with(user_id: UUID, name: str):
+    """Subquery: ids of the user's applications that mention technology `name`."""
+    return (
+        select(ApplicationTechnology.application_id)
+        .join(Technology, Technology.id == ApplicationTechnology.technology_id)
+        .where(ApplicationTechnology.user_id == user_id, Technology.key == normalize(name))
+    )
+
+
+def search(db: Session, user_id: UUID, q: str, limit: int = 10) -> list[dict]:
+    """The user's technologies whose name contains `q`, most used first."""
+    count = func.count()
+    rows = (
+        db.query(Technology.name, count)
+        .join(ApplicationTechnology, ApplicationTechnology.technology_id == Technology.id)
+        .filter(ApplicationTechnology.user_id == user_id, Technology.name.icontains(q, autoescape=True))
+        .group_by(Technology.id, Technology.name)
+        .order_by(count.desc(), Technology.name)
+        .limit(limit)
+        .all()
+    )
+    return [{"name": name, "applications": n} for name, n in rows]
+
+
+def co_occurrence(db: Session, user_id: UUID, name: str, limit: int = 10) -> list[dict]:
+    """Technologies mentioned alongside `name` in the user's applications, most frequent first."""
+    this, other = aliased(ApplicationTechnology), aliased(ApplicationTechnology)
+    target = select(Technology.id).where(Technology.key == normalize(name)).scalar_subquery()
+    count = func.count()
+    rows = (
+        db.query(Technology.name, count)
+        .select_from(this)
+        .join(other, and_(other.application_id == this.application_id, other.technology_id != this.technology_id))
+        .join(Technology, Technology.id == other.technology_id)
+        .filter(this.user_id == user_id, this.technology_id == target)
+        .group_by(Technology.id, Technology.name)
+        .order_by(count.desc(), Technology.name)
+        .limit(limit)
+        .all()
+    )
+    return [{"name": other_name, "applications": n} for other_name, n in rows]
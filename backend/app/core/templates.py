@@ -0,0 +1,94 @@
+"""
+Minimal compiled HTML templates for notification emails.
+
+A template is parsed once into literal and placeholder parts ({name} syntax,
+{{ and }} for literal braces). Rendering is a single join over those parts.
+Every value is HTML-escaped unless it is wrapped in Markup, which is also
+what render() returns, so rendered fragments can be nested without being
+escaped twice.
+"""
+import io
+from html import escape
+from string import Formatter
+from typing import Any, Callable, Iterable, Mapping
+
+from app.core.cache import LRUCache
+
+
+class Markup(str):
+    """A string that is already safe HTML."""
+
+
+def _escape(value: Any) -> str:
+    if isinstance(value, Markup):
+        return value
+    if type(value) is int:
+        return str(value)
+    return escape(str(value), quote=True)
+
+
+class Template:
+    def __init__(self, source: str):
+        self._parts: list[tuple[str, str | None]] = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if spec or conversion:
+                raise ValueError(f"Format specs aren't supported in templates: {field!r}")
+            self._parts.append((literal, field))
+        self.fields = frozenset(field for _, field in self._parts if field)
+
+    def render(self, **context: Any) -> Markup:
+        return Markup("".join(
+            literal + (_escape(context[field]) if field is not None else "")
+            for literal, field in self._parts
+        ))
+
+    def write(self, out: Callable[[str], Any], context: Mapping[str, Any]) -> None:
+        """Render straight into a writer (e.g. StringIO.write) without building an intermediate string."""
+        for literal, field in self._parts:
+            out(literal)
+            if field is not None:
+                out(_escape(context[field]))
+
+
+def render_rows(template: Template, rows: Iterable[Mapping[str, Any]]) -> Markup:
+    """Render one `template` per row into a single fragment."""
+    buffer = io.StringIO()
+    for row in rows:
+        template.write(buffer.write, row)
+    return Markup(buffer.getvalue())
+
+
+class CachedRenderer:
+    """
+    Memoizes rendered output for identical inputs. Arguments must be hashable
+    or built from dicts, lists and tuples of hashable values, which are frozen
+    into nested tuples for the cache key.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        # Tagged with the container type so e.g. a dict and a list of pairs
+        # don't share a key. Dicts keep insertion order: equal dicts built in
+        # a different order only miss the cache.
+        if isinstance(value, dict):
+            return (dict, tuple((k, CachedRenderer._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return (type(value), tuple(CachedRenderer._freeze(v) for v in value))
+        return value
+
+    def __call__(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args, **kwargs):
+            key = (fn.__name__, self._freeze(args), self._freeze(kwargs))
+            result = self._cache.get(key)
+            if result is None:
+                result = fn(*args, **kwargs)
+                self._cache.set(key, result)
+            return result
+
+        wrapper.__name__ = fn.__name__
+        wrapper.__doc__ = fn.__doc__
+        wrapper.cache = self._cache
+        return wrapper
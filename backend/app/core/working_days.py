@@ -1,6 +1,12 @@
 import json
-from datetime import date, timedelta
+import threading
+import time
+from array import array
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import Iterable, Sequence
+
+import pytz
 
 _DATA_DIR = Path(__file__).parent.parent.parent / "data"
 _HOLIDAY_FILES = [
@@ -9,6 +15,16 @@ _HOLIDAY_FILES = [
 ]
 _LEAVES_FILE = _DATA_DIR / "leaves.json"
 
+# How often (seconds) the cached calendar stats its source files for changes
+_STAT_INTERVAL = 5.0
+
+# Off-days, followup ages and the scheduled jobs all count Berlin calendar days
+BERLIN = pytz.timezone("Europe/Berlin")
+
+
+def berlin_today() -> date:
+    return datetime.now(BERLIN).date()
+
 
 def _parse_file(path: Path) -> set[date]:
     if not path.exists():
@@ -22,20 +38,135 @@ def _parse_file(path: Path) -> set[date]:
     return result
 
 
-def load_off_days() -> set[date]:
-    off_days: set[date] = set()
-    for path in [*_HOLIDAY_FILES, _LEAVES_FILE]:
-        off_days.update(_parse_file(path))
-    return off_days
+def _weekdays_before(ordinal: int) -> int:
+    """Number of Mon–Fri days with ordinal in [1, ordinal). Ordinal 1 (0001-01-01) is a Monday."""
+    weeks, rest = divmod(ordinal - 1, 7)
+    return weeks * 5 + min(rest, 5)
 
 
-def _is_off_day(d: date, off_days: set[date]) -> bool:
-    return d.weekday() >= 5 or d in off_days  # 5=Sat, 6=Sun
+class OffDayCalendar:
+    """
+    Holidays and leaves compiled for fast lookups.
 
+    Membership is a per-year bitmap (O(1)). Working days are indexed as a
+    prefix count over the years the data covers, so "working days between A
+    and B" is two array lookups. Supports `d in calendar`, so it can stand in
+    for the old set.
+    """
 
-def streak_is_unbroken(last_date: date, today: date, off_days: set[date]) -> bool:
-    """Returns True if every day strictly between last_date and today is an off-day."""
-    for i in range(1, (today - last_date).days):
-        if not _is_off_day(last_date + timedelta(days=i), off_days):
+    def __init__(self, off_days: Iterable[date]):
+        days = set(off_days)
+        self._size = len(days)
+        self._years: dict[int, bytearray] = {}
+        for d in days:
+            bits = self._years.setdefault(d.year, bytearray(46))  # 366 bits
+            idx = d.toordinal() - date(d.year, 1, 1).toordinal()
+            bits[idx >> 3] |= 1 << (idx & 7)
+
+        # _prefix[i] = working days with ordinal in [_base, _base + i), spanning every year with data
+        if days:
+            self._base = date(min(self._years), 1, 1).toordinal()
+            end = date(max(self._years) + 1, 1, 1).toordinal()
+        else:
+            self._base = end = 1
+        self._prefix = array("l", [0]) * (end - self._base + 1)
+        count = 0
+        for i, ordinal in enumerate(range(self._base, end)):
+            if (ordinal - 1) % 7 < 5 and date.fromordinal(ordinal) not in self:
+                count += 1
+            self._prefix[i + 1] = count
+        # Weekday off-days inside the span; beyond it every weekday is a working day
+        self._span_off = (_weekdays_before(end) - _weekdays_before(self._base)) - count
+
+    def __contains__(self, d: date) -> bool:
+        bits = self._years.get(d.year)
+        if bits is None:
             return False
-    return True
+        idx = d.toordinal() - date(d.year, 1, 1).toordinal()
+        return bool(bits[idx >> 3] & (1 << (idx & 7)))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def is_off_day(self, d: date) -> bool:
+        return d.weekday() >= 5 or d in self
+
+    def working_days_before(self, d: date) -> int:
+        """Working days from 0001-01-01 up to, not including, d. Differences count working days in a range."""
+        return self._working_before(d.toordinal())
+
+    def _working_before(self, ordinal: int) -> int:
+        """Working days with ordinal in [1, ordinal)."""
+        offset = ordinal - self._base
+        if offset <= 0:
+            return _weekdays_before(ordinal)
+        if offset < len(self._prefix):
+            return _weekdays_before(self._base) + self._prefix[offset]
+        return _weekdays_before(ordinal) - self._span_off
+
+    def working_days_between(self, start: date, end: date) -> int:
+        """Number of working days strictly between start and end."""
+        lo, hi = start.toordinal() + 1, end.toordinal()
+        if hi <= lo:
+            return 0
+        return self._working_before(hi) - self._working_before(lo)
+
+
+class _CalendarCache:
+    """Process-wide calendar, rebuilt only when a source file's mtime changes."""
+
+    def __init__(self, paths: list[Path], stat_interval: float = _STAT_INTERVAL):
+        self._paths = paths
+        self._stat_interval = stat_interval
+        self._lock = threading.Lock()
+        self._calendar: OffDayCalendar | None = None
+        self._signature: tuple | None = None
+        self._checked_at = 0.0
+
+    def _current_signature(self) -> tuple:
+        return tuple(p.stat().st_mtime_ns if p.exists() else None for p in self._paths)
+
+    def get(self) -> OffDayCalendar:
+        now = time.monotonic()
+        calendar = self._calendar
+        if calendar is not None and now - self._checked_at < self._stat_interval:
+            return calendar
+        with self._lock:
+            signature = self._current_signature()
+            if self._calendar is None or signature != self._signature:
+                off_days: set[date] = set()
+                for path in self._paths:
+                    off_days.update(_parse_file(path))
+                self._calendar = OffDayCalendar(off_days)
+                self._signature = signature
+            self._checked_at = now
+            return self._calendar
+
+
+_cache = _CalendarCache([*_HOLIDAY_FILES, _LEAVES_FILE])
+
+
+def load_off_days() -> OffDayCalendar:
+    """Shared off-day calendar; only re-reads the JSON files after they change."""
+    return _cache.get()
+
+
+def streak_is_unbroken(last_date: date, today: date, calendar: OffDayCalendar) -> bool:
+    """Returns True if every day strictly between last_date and today is an off-day."""
+    return calendar.working_days_between(last_date, today) == 0
+
+
+def streak_runs(dates: Sequence[date], calendar: OffDayCalendar) -> list[int]:
+    """
+    Streak length ending at each of `dates` (sorted, distinct) in a single pass.
+    A run continues when no working day falls strictly between neighbours.
+    """
+    runs: list[int] = []
+    prev_through = None  # working days up to and including the previous date
+    for d in dates:
+        if prev_through is not None and calendar.working_days_before(d) == prev_through:
+            runs.append(runs[-1] + 1)
+        else:
+            runs.append(1)
+        prev_through = calendar.working_days_before(d + timedelta(days=1))
+    return runs
@@ -5,3 +5,6 @@ from app.models.user import User  # noqa
 from app.models.application import Application, ApplicationHistory  # noqa
 from app.models.network import NetworkContact  # noqa
 from app.models.point_history import PointHistory  # noqa
+from app.models.email_outbox import EmailOutbox  # noqa
+from app.models.status_stats import StatusTransition, StatusDwell  # noqa
+from app.models.technology import Technology, ApplicationTechnology  # noqa
@@ -0,0 +1,73 @@
+"""
+Per-user data version, bumped in the same transaction as any write that
+changes what a user's dashboards or the share view would show. Used as the
+share ETag and as the key for per-user response caches.
+"""
+from itertools import chain
+from uuid import UUID
+
+from sqlalchemy import event, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, ApplicationHistory
+from app.models.network import NetworkContact
+from app.models.point_history import PointHistory
+from app.models.user import User
+
+_user = User.__table__
+_application = Application.__table__
+
+# session.info key: ids of users whose version this transaction bumped
+BUMPED_USERS = "data_version_bumped_users"
+
+
+def _changed_owners(session: Session) -> tuple[set[UUID], set[UUID]]:
+    """(user ids, application ids whose owner is affected) touched by this flush."""
+    user_ids: set[UUID] = set()
+    application_ids: set[UUID] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        if isinstance(obj, User):
+            user_ids.add(obj.id)
+        elif isinstance(obj, (Application, NetworkContact, PointHistory)):
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, ApplicationHistory):
+            application_ids.add(obj.application_id)
+    return user_ids, application_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_data_versions(session: Session, flush_context) -> None:
+    user_ids, application_ids = _changed_owners(session)
+    user_ids.discard(None)
+    application_ids.discard(None)
+    if not user_ids and not application_ids:
+        return
+
+    condition = _user.c.id.in_(user_ids)
+    if application_ids:
+        owners = select(_application.c.user_id).where(_application.c.id.in_(application_ids))
+        condition = or_(condition, _user.c.id.in_(owners))
+    _bump(session, condition)
+
+
+def bump_data_version(session: Session, user_id: UUID) -> None:
+    """Bump explicitly after Core INSERTs/UPDATEs, which the flush hook never sees."""
+    _bump(session, _user.c.id == user_id)
+
+
+def _bump(session: Session, condition) -> None:
+    # Core statement on the session's connection: no autoflush, and updated_at is
+    # pinned because it doubles as the streak's last-activity marker.
+    bumped = session.connection().execute(
+        update(_user)
+        .where(condition)
+        .values(data_version=_user.c.data_version + 1, updated_at=_user.c.updated_at)
+        .returning(_user.c.id)
+    ).scalars()
+    session.info.setdefault(BUMPED_USERS, set()).update(bumped)
+
+
+def get_data_version(db: Session, user_id: UUID) -> int:
+    return db.execute(select(_user.c.data_version).where(_user.c.id == user_id)).scalar_one()
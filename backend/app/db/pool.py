@@ -0,0 +1,143 @@
+"""
+Connection pool instrumentation and idle-based pre-ping.
+
+Checkout latency, waits on an exhausted pool and timeouts are recorded per
+engine so the pool can be sized against real load; the numbers are served
+from GET /metrics/db and slow checkouts are logged.
+"""
+import logging
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+_LAST_USED = "applyquest_last_used"
+
+
+class PoolMetrics:
+    def __init__(self, name: str, slow_checkout_ms: float = 100.0):
+        self.name = name
+        self.slow_checkout = slow_checkout_ms / 1000
+        self.checkout_latency = LatencyRecorder()
+        self.waits = 0
+        self.timeouts = 0
+        self.pings = 0
+        self.ping_failures = 0
+        self.pool = None
+        self._lock = threading.Lock()
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict:
+        pool = self.pool
+        capacity = None
+        checked_out = None
+        if pool is not None:
+            checked_out = pool.checkedout()
+            if pool._max_overflow > -1:
+                capacity = pool.size() + pool._max_overflow
+        return {
+            "pool_size": pool.size() if pool is not None else None,
+            "max_overflow": pool._max_overflow if pool is not None else None,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin() if pool is not None else None,
+            "saturation": round(checked_out / capacity, 3) if capacity else None,
+            "waits": self.waits,
+            "timeouts": self.timeouts,
+            "pings": self.pings,
+            "ping_failures": self.ping_failures,
+            "checkout": self.checkout_latency.snapshot(),
+        }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout from the queue, including time spent waiting for a free slot."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super()._do_get()
+        # Every pooled and overflow connection is in use: this checkout has to wait
+        saturated = self.checkedin() == 0 and -1 < self._max_overflow <= self._overflow
+        if saturated:
+            metrics.incr("waits")
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.incr("timeouts")
+            logger.error("%s pool checkout timed out: %s", metrics.name, self.status())
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.checkout_latency.record(elapsed)
+            if elapsed >= metrics.slow_checkout:
+                logger.warning(
+                    "%s pool checkout took %.1fms: %s", metrics.name, elapsed * 1000, self.status()
+                )
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument(engine: Engine, metrics: PoolMetrics, pre_ping_idle: float) -> None:
+    """
+    Attach `metrics` to the engine's pool and ping connections on checkout only
+    when they have been idle for longer than `pre_ping_idle` seconds
+    (0 pings every checkout, a negative value never pings).
+    """
+    pool = engine.pool
+    if isinstance(pool, _InstrumentedPoolMixin):
+        pool.metrics = metrics
+        metrics.pool = pool
+
+    if pre_ping_idle < 0:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        connection_record.info[_LAST_USED] = time.monotonic()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info[_LAST_USED] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        last_used = connection_record.info.get(_LAST_USED, 0.0)
+        if time.monotonic() - last_used < pre_ping_idle:
+            return
+        metrics.incr("pings")
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as e:
+            metrics.incr("ping_failures")
+            # The pool discards this connection and retries the checkout with a fresh one
+            raise exc.DisconnectionError() from e
+        connection_record.info[_LAST_USED] = time.monotonic()
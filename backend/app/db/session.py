@@ -1,6 +1,43 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db import data_version  # noqa: F401 — registers the data version flush hook
+from app.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, PoolMetrics, instrument
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+
+def _pool_options(uri: str) -> dict:
+    # SQLite (local runs, tests) keeps its own single-connection pools
+    if make_url(uri).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+
+pool_metrics = PoolMetrics("sync", settings.DB_SLOW_CHECKOUT_MS)
+_options = _pool_options(settings.SQLALCHEMY_DATABASE_URI)
+if _options:
+    _options["poolclass"] = InstrumentedQueuePool
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, **_options)
+instrument(engine, pool_metrics, settings.DB_PRE_PING_IDLE)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine for API requests, only built when DB_ASYNC is enabled
+async_engine = None
+AsyncSessionLocal = None
+async_pool_metrics = None
+if settings.DB_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_pool_metrics = PoolMetrics("async", settings.DB_SLOW_CHECKOUT_MS)
+    _async_options = _pool_options(settings.ASYNC_SQLALCHEMY_DATABASE_URI)
+    if _async_options:
+        _async_options["poolclass"] = InstrumentedAsyncQueuePool
+    async_engine = create_async_engine(settings.ASYNC_SQLALCHEMY_DATABASE_URI, **_async_options)
+    instrument(async_engine.sync_engine, async_pool_metrics, settings.DB_PRE_PING_IDLE)
+    # Objects are read after commit outside the greenlet, so don't expire them
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
@@ -0,0 +1,11 @@
+"""INSERT constructs with ON CONFLICT support for the session's dialect."""
+from sqlalchemy.orm import Session
+
+
+def insert(session: Session, model):
+    """insert(model) from the Postgres or SQLite dialect, both of which offer on_conflict_do_*()."""
+    if session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(model)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, Enum, Text, ForeignKey, Date
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, Enum, Text, ForeignKey, Date, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -24,12 +24,38 @@ class GermanLevel(str, enum.Enum):
     FLUENT = "Fluent"
 
 class Application(Base):
+    # On Postgres the table also has a generated `search_vector` tsvector column
+    # with a GIN index (app/core/search.py); it is deliberately not mapped
+    __table_args__ = (
+        # Keyset pagination over (last activity, id); rows never updated fall back to created_at
+        Index("ix_application_user_id_activity_id", "user_id", text("coalesce(updated_at, created_at)"), "id"),
+        Index("ix_application_user_id_status_updated_at", "user_id", "status", "updated_at"),
+        # Followup queue: only live applications can need a followup or decision
+        Index(
+            "ix_application_followup_queue",
+            "user_id", "followed_up_at", "updated_at",
+            postgresql_where=text("status NOT IN ('GHOSTED', 'REJECTED')"),
+        ),
+        # Duplicate captures (app/core/duplicates.py): one application per posting URL
+        Index(
+            "ix_application_user_id_job_url_hash",
+            "user_id", "job_url_hash",
+            unique=True,
+            postgresql_where=text("job_url_hash IS NOT NULL"),
+            sqlite_where=text("job_url_hash IS NOT NULL"),
+        ),
+        Index("ix_application_user_id_dedupe_key", "user_id", "dedupe_key"),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id"), nullable=False)
     company_name = Column(String, nullable=False)
     position_title = Column(String, nullable=False)
     location = Column(String, nullable=False)
     job_url = Column(String, nullable=True)
+    # Duplicate detection keys, derived from job_url / company_name + position_title
+    job_url_hash = Column(String(64), nullable=True)
+    dedupe_key = Column(String, nullable=True)
     salary_range = Column(String, nullable=True)
     tech_stack = Column(String, nullable=True)
     status = Column(Enum(ApplicationStatus), default=ApplicationStatus.SHORTLISTED, nullable=False)
@@ -52,6 +78,11 @@ class Application(Base):
     referral_contact = relationship("NetworkContact", primaryjoin="Application.referral_contact_id==NetworkContact.id", post_update=True, uselist=False)
 
 class ApplicationHistory(Base):
+    __table_args__ = (
+        # An application's history in order, e.g. when it entered its current status
+        Index("ix_applicationhistory_application_id_changed_at", "application_id", "changed_at"),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     application_id = Column(UUID(as_uuid=True), ForeignKey("application.id"), nullable=False)
     old_status = Column(Enum(ApplicationStatus), nullable=True)
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, Index
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from datetime import datetime, timezone
+from app.db.base_class import Base
+
+class EmailOutbox(Base):
+    """Outgoing email, persisted before sending; drained by app/core/outbox.py"""
+    __table_args__ = (
+        # Workers claim due messages in order
+        Index("ix_emailoutbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    recipients = Column(JSON, nullable=False)
+    subject = Column(String, nullable=False)
+    html = Column(Text, nullable=False)
+    reply_to = Column(String, nullable=True)
+    status = Column(String, nullable=False, default="pending")  # pending, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
+    sent_at = Column(DateTime, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Date
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -6,6 +6,12 @@ from datetime import datetime
 from app.db.base_class import Base
 
 class NetworkContact(Base):
+    # On Postgres the table also has a generated `search_vector` tsvector column
+    # with a GIN index (app/core/search.py); it is deliberately not mapped
+    __table_args__ = (
+        Index("ix_networkcontact_user_id", "user_id"),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id"), nullable=False)
     name = Column(String, nullable=False)
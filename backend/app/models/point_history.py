@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -7,6 +7,11 @@ from app.db.base_class import Base
 
 class PointHistory(Base):
     """Track all point changes for audit trail"""
+    __table_args__ = (
+        # Per-user activity days for streak rebuilds
+        Index("ix_pointhistory_user_id_created_at", "user_id", "created_at"),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('user.id'), nullable=False)
     points = Column(Integer, nullable=False)  # Can be positive or negative
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, Enum, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base_class import Base
+from app.models.application import ApplicationStatus
+
+class StatusTransition(Base):
+    """Per-user count of status changes old -> new, maintained by app/core/status_stats.py"""
+    user_id = Column(UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    old_status = Column(Enum(ApplicationStatus), primary_key=True)  # Applied when the history has none
+    new_status = Column(Enum(ApplicationStatus), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class StatusDwell(Base):
+    """Per-user histogram of time spent in a status before leaving it (see status_stats.DWELL_BUCKETS)"""
+    user_id = Column(UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(Enum(ApplicationStatus), primary_key=True)
+    bucket = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base_class import Base
+
+class Technology(Base):
+    """Dictionary of technologies named in application tech stacks (app/core/technologies.py)"""
+    __table_args__ = (
+        # Substring and typo-tolerant lookups (ILIKE '%kot%', similarity) via pg_trgm
+        Index(
+            "ix_technology_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    key = Column(String, nullable=False, unique=True)  # normalized: lowercase, single spaces
+    name = Column(String, nullable=False)  # spelling first seen
+
+class ApplicationTechnology(Base):
+    """Technologies mentioned by an application, kept in sync with Application.tech_stack"""
+    __table_args__ = (
+        # Per-user counts and "applications mentioning X"
+        Index("ix_applicationtechnology_user_id_technology_id", "user_id", "technology_id"),
+    )
+
+    application_id = Column(UUID(as_uuid=True), ForeignKey("application.id", ondelete="CASCADE"), primary_key=True)
+    technology_id = Column(Integer, ForeignKey("technology.id"), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
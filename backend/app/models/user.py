@@ -13,20 +13,23 @@ class User(Base):
     current_education = Column(String, nullable=True)
     german_level = Column(String, nullable=True)
     current_role = Column(String, nullable=True)
-    # points removed - will be calculated from point_history
+    # Running total of point_history, maintained by gamification.add_points.
+    # The ledger stays the source of truth; see reconcile_points.py.
+    points = Column(Integer, default=0, server_default="0", nullable=False)
     level = Column(Integer, default=1)
     level_name = Column(String, default='Novice')
     current_streak = Column(Integer, default=0)
     longest_streak = Column(Integer, default=0)
     last_goal_bonus_date = Column(Date, nullable=True)
+    # Maintained by app/core/milestones.py alongside application inserts and deletes
+    application_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # Highest milestone already notified, so each one fires exactly once
+    last_milestone = Column(Integer, default=0, server_default="0", nullable=False)
+    # Bumped on every write to the user's data (app/db/data_version.py)
+    data_version = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None), onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
 
     applications = relationship("Application", back_populates="user")
     network_contacts = relationship("NetworkContact", back_populates="user")
     point_history = relationship("PointHistory", back_populates="user", cascade="all, delete-orphan")
-    
-    @property
-    def points(self) -> int:
-        """Calculate total points from point history"""
-        return sum(ph.points for ph in self.point_history)
@@ -66,3 +66,12 @@ class Application(ApplicationBase):
 
     class Config:
         from_attributes = True
+
+class ApplicationBulkResult(BaseModel):
+    created: int
+    ids: List[UUID]
+
+class FollowupQueue(BaseModel):
+    needs_followup: List[Application]
+    awaiting_response: List[Application]
+    needs_decision: List[Application]
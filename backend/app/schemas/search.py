@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Literal, Optional
+from uuid import UUID
+
+class SearchHit(BaseModel):
+    kind: Literal["application", "contact"]
+    id: UUID
+    title: str  # company (application) or name (contact)
+    subtitle: Optional[str] = None  # position title or company
+    rank: float
@@ -26,6 +26,7 @@ class User(UserBase):
     longest_streak: int
     created_at: datetime
     updated_at: datetime
+    data_version: int  # changes whenever the user's data does; key for refetching aggregates
 
     class Config:
         from_attributes = True
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Benchmark notification email rendering.
+
+Renders a large followup digest and a weekly summary, cold (cache cleared)
+and warm (identical content served from the render cache).
+
+Usage (from project root):
+    docker compose exec backend python bench_email_templates.py [rows]
+"""
+import sys
+import timeit
+
+from app.core import email
+
+
+def _digest_rows(n: int):
+    needs_followup = [
+        {"company": f"Company {i} & Co", "position": "Backend Engineer", "status": "Applied", "days_stale": 7 + i % 20}
+        for i in range(n)
+    ]
+    needs_decision = [
+        {"company": f"Company {i}", "position": "Platform Engineer", "followed_up_days_ago": 3 + i % 5}
+        for i in range(n // 4)
+    ]
+    return needs_followup, needs_decision
+
+
+def _report(label: str, fn, number: int) -> None:
+    per_call = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"{label:<32} {per_call * 1e6:10.1f} µs")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    needs_followup, needs_decision = _digest_rows(rows)
+    summary = dict(
+        user_name="Alice", current_streak=5, longest_streak=12, level=3, level_name="Job Hunter",
+        points=420, total_apps=180, apps_this_week=14, response_rate=31, interview_rate=9,
+        active_apps=95, followup_needed=12, decision_needed=3,
+    )
+
+    def digest_cold():
+        email.render_followup_digest.cache.clear()
+        email.render_followup_digest("Alice", needs_followup, needs_decision)
+
+    def summary_cold():
+        email.render_weekly_summary.cache.clear()
+        email.render_weekly_summary(**summary)
+
+    print(f"Followup digest with {rows} + {rows // 4} rows")
+    _report("digest, cold", digest_cold, 20)
+    _report("digest, cached", lambda: email.render_followup_digest("Alice", needs_followup, needs_decision), 200)
+    _report("weekly summary, cold", summary_cold, 2000)
+    _report("weekly summary, cached", lambda: email.render_weekly_summary(**summary), 2000)
+
+
+if __name__ == "__main__":
+    main()
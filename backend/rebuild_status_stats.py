@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Rebuild the status transition and dwell-time tables from ApplicationHistory.
+
+Usage (from project root):
+    docker compose exec backend python rebuild_status_stats.py                 # every user
+    docker compose exec backend python rebuild_status_stats.py you@example.com # one user
+"""
+import sys
+
+# Import all models so SQLAlchemy can resolve relationships before querying
+import app.models.application  # noqa: F401
+import app.models.network  # noqa: F401
+import app.models.point_history  # noqa: F401
+import app.models.status_stats  # noqa: F401
+import app.models.user  # noqa: F401
+
+from app.core.status_stats import rebuild
+from app.db.session import SessionLocal
+from app.models.user import User
+
+
+def main() -> int:
+    db = SessionLocal()
+    try:
+        user_id = None
+        if len(sys.argv) > 1:
+            user_id = db.query(User.id).filter(User.email == sys.argv[1]).scalar()
+            if user_id is None:
+                print(f"No user with email {sys.argv[1]}")
+                return 1
+
+        counted = rebuild(db, user_id)
+        db.commit()
+        print(f"Rebuilt status stats from {counted} transition(s).")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Reconcile each user's stored points total with the PointHistory ledger.
+
+Usage (from project root):
+    docker compose exec backend python reconcile_points.py          # fix drift
+    docker compose exec backend python reconcile_points.py --check  # report only, exit 1 on drift
+"""
+import sys
+
+# Import all models so SQLAlchemy can resolve relationships before querying
+import app.models.application  # noqa: F401
+import app.models.network  # noqa: F401
+import app.models.point_history  # noqa: F401
+import app.models.user  # noqa: F401
+
+from app.core.gamification import reconcile_points
+from app.db.session import SessionLocal
+
+
+def main() -> int:
+    check_only = "--check" in sys.argv[1:]
+    db = SessionLocal()
+    try:
+        mismatches = reconcile_points(db, fix=not check_only)
+        if not mismatches:
+            print("All point totals match the ledger.")
+            return 0
+
+        for user, stored, ledger in mismatches:
+            print(f"{user.email}: stored {stored}, ledger {ledger} ({ledger - stored:+d})")
+
+        if check_only:
+            print(f"{len(mismatches)} user(s) out of sync.")
+            return 1
+
+        db.commit()
+        print(f"Fixed {len(mismatches)} user(s).")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,59 @@
-import app.models.application  # noqa: F401
-import app.models.network  # noqa: F401
-import app.models.point_history  # noqa: F401
-import app.models.user  # noqa: F401
+import os
+
+# Settings requires the postgres connection parts; the tests never connect.
+for _var in ("POSTGRES_SERVER", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB"):
+    os.environ.setdefault(_var, "test")
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+import app.core.config  # noqa: F401,E402 — load real settings before any test stubs them
+import app.models.application  # noqa: F401,E402
+import app.models.network  # noqa: F401,E402
+import app.models.point_history  # noqa: F401,E402
+import app.models.user  # noqa: F401,E402
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.db.base_class import Base  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """Session on a throwaway in-memory SQLite database with the full schema."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def count_queries(db):
+    """Context manager factory counting SQL statements sent on the test session's engine."""
+    from contextlib import contextmanager
+    from sqlalchemy import event
+
+    @contextmanager
+    def counter():
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return counter
@@ -0,0 +1,147 @@
+import random
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.core import analytics, status_stats, technologies
+from app.models.application import Application, ApplicationHistory, ApplicationStatus
+from app.models.user import User
+
+TODAY = date(2026, 4, 15)  # a Wednesday
+
+
+@pytest.fixture
+def user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    analytics._results.clear()
+    return user
+
+
+def add_app(db, user, company="Acme", days_ago=0, status=ApplicationStatus.APPLIED, location="Berlin", **kwargs):
+    applied = TODAY - timedelta(days=days_ago)
+    app = Application(
+        user_id=user.id, company_name=company, position_title="Engineer", location=location,
+        applied_date=applied, status=status, **kwargs,
+    )
+    db.add(app)
+    db.flush()
+    technologies.sync_application(db, app)
+    db.commit()
+    return app
+
+
+def test_summary_matches_per_row_counts(db, user, count_queries):
+    rng = random.Random(3)
+    for i in range(200):
+        add_app(db, user, f"Company {i}", days_ago=rng.randint(0, 60),
+                status=rng.choice(list(ApplicationStatus)), easy_apply=rng.random() < 0.3)
+    apps = db.query(Application).all()
+    since = TODAY - timedelta(days=30)
+    user_id = user.id
+
+    with count_queries() as statements:
+        result = analytics.summary(db, user_id, since)
+
+    recent = [a for a in apps if a.applied_date >= since]
+    statuses = Counter(a.status.value for a in recent)
+    assert result["total"] == len(recent)
+    assert result["status_counts"] == dict(statuses)
+    assert result["responded"] == sum(1 for a in recent if a.status not in ("Applied", "Ghosted"))
+    assert result["interviewed"] == sum(
+        statuses[s] for s in ("Phone Screen", "Technical Round 1", "Technical Round 2", "Final Round")
+    )
+    assert result["easy_applied"] == sum(1 for a in recent if a.easy_apply)
+    assert len(statements) == 1
+
+
+def test_transitions_count_history_rows(db, user):
+    moved = add_app(db, user, "Moved", status=ApplicationStatus.PHONE_SCREEN)
+    db.add_all([
+        ApplicationHistory(application_id=moved.id, old_status=None, new_status=ApplicationStatus.REPLIED),
+        ApplicationHistory(application_id=moved.id, old_status=ApplicationStatus.REPLIED,
+                           new_status=ApplicationStatus.PHONE_SCREEN),
+    ])
+    rejected = add_app(db, user, "Rejected", status=ApplicationStatus.REJECTED)
+    db.add(ApplicationHistory(application_id=rejected.id, old_status=ApplicationStatus.APPLIED,
+                              new_status=ApplicationStatus.REPLIED))
+    add_app(db, user, "Quiet")
+    db.commit()
+    # History written directly, so bring the maintained counts up to date
+    status_stats.rebuild(db, user.id)
+    db.commit()
+
+    result = analytics.transitions(db, user.id)
+    assert analytics.transitions(db, user.id, since=TODAY) == result
+
+    assert result["links"][0] == {"source": "Applied", "target": "Replied", "count": 2}
+    assert {"source": "Replied", "target": "Phone Screen", "count": 1} in result["links"]
+    assert result["untracked"] == 1
+
+
+def test_timeline_buckets_by_week(db, user):
+    add_app(db, user, days_ago=0, status=ApplicationStatus.REPLIED)  # this week
+    add_app(db, user, days_ago=2)  # Monday, this week
+    add_app(db, user, days_ago=3)  # Sunday, last week
+    add_app(db, user, days_ago=400)  # outside the window
+
+    weeks = analytics.timeline(db, user.id, TODAY, weeks=4)
+
+    assert [w["week_start"] for w in weeks] == ["2026-03-23", "2026-03-30", "2026-04-06", "2026-04-13"]
+    assert weeks[-1] == {"week_start": "2026-04-13", "applications": 2, "responded": 1}
+    assert weeks[-2]["applications"] == 1
+    assert sum(w["applications"] for w in weeks) == 3
+
+
+def test_top_companies_and_technologies(db, user):
+    add_app(db, user, "Acme", tech_stack="Python, Django", status=ApplicationStatus.OFFER)
+    add_app(db, user, "Acme", tech_stack="Python/Go")
+    add_app(db, user, "Beta", tech_stack="Go & Python + K8s")
+
+    assert analytics.top(db, user.id, "company", limit=1) == [
+        {"key": "Acme", "applications": 2, "responded": 1, "offers": 1}
+    ]
+    tech = analytics.top(db, user.id, "tech", limit=2)
+    assert tech == [
+        {"key": "Python", "applications": 3, "responded": 1, "offers": 1},
+        {"key": "Go", "applications": 2, "responded": 0, "offers": 0},
+    ]
+
+
+def test_industries_and_locations(db, user):
+    add_app(db, user, "SAP SE", status=ApplicationStatus.OFFER)
+    add_app(db, user, "SAP SE", location=" Munich ", status=ApplicationStatus.REPLIED)
+    add_app(db, user, "Siemens", location="Munich")
+    add_app(db, user, "Deutsche Bank", days_ago=40)
+    add_app(db, user, "Tiny 100%")
+
+    assert analytics.industries(db, user.id) == [
+        {"key": "Industrial/Tech", "companies": 2, "applications": 3, "responded": 2, "offers": 1},
+        {"key": "Finance/Fintech", "companies": 1, "applications": 1, "responded": 0, "offers": 0},
+        {"key": "Other", "companies": 1, "applications": 1, "responded": 0, "offers": 0},
+    ]
+    assert [e["key"] for e in analytics.industries(db, user.id, since=TODAY - timedelta(days=30))] == [
+        "Industrial/Tech", "Other",
+    ]
+    assert analytics.locations(db, user.id) == [
+        {"key": "Berlin", "applications": 3, "status_counts": {"Applied": 2, "Offer": 1}},
+        {"key": "Munich", "applications": 2, "status_counts": {"Applied": 1, "Replied": 1}},
+    ]
+
+
+def test_results_are_cached_until_the_user_writes(db, user, count_queries):
+    add_app(db, user, "Acme")
+    user_id = user.id
+
+    def cached_total():
+        return analytics.cached(db, user_id, ("summary", None), lambda: analytics.summary(db, user_id))["total"]
+
+    assert cached_total() == 1
+    with count_queries() as statements:
+        assert cached_total() == 1
+    assert len(statements) == 1  # only the data version lookup
+
+    add_app(db, user, "Beta")
+    assert cached_total() == 2
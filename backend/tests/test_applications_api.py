@@ -0,0 +1,146 @@
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+
+from app.api.deps import Database
+from app.api.v1.endpoints.applications import NEXT_CURSOR_HEADER, read_applications
+from app.core.working_days import berlin_today
+from app.models.application import Application, ApplicationStatus
+from app.models.user import User
+
+TODAY = berlin_today()
+
+
+@pytest.fixture
+def user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def add_app(db, user, company, days_ago=0, **kwargs):
+    updated = datetime.combine(TODAY - timedelta(days=days_ago), datetime.min.time()).replace(hour=12)
+    kwargs.setdefault("updated_at", updated)
+    app = Application(
+        user_id=user.id, company_name=company, position_title="Engineer", location="Berlin",
+        applied_date=updated.date(), created_at=updated, **kwargs,
+    )
+    db.add(app)
+    db.commit()
+    return app
+
+
+def list_apps(db, user, **params):
+    response = Response()
+    query = dict(
+        cursor=None, limit=100, status=None, company=None, source=None, min_priority=None,
+        applied_from=None, applied_to=None, updated_from=None, updated_to=None, followup_class=None,
+        technology=None,
+    )
+    query.update(params)
+    result = asyncio.run(read_applications(response=response, db=Database(db), current_user_id=user.id, **query))
+    return [a.company_name for a in result], response.headers.get(NEXT_CURSOR_HEADER)
+
+
+def test_pages_follow_cursor_newest_first(db, user):
+    for i in range(7):
+        add_app(db, user, f"Company {i}", days_ago=i % 3)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = list_apps(db, user, limit=3, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(f"Company {i}" for i in range(7))
+    assert len(seen) == len(set(seen))
+    first, _ = list_apps(db, user, limit=1)
+    assert first[0] in {"Company 0", "Company 3", "Company 6"}
+
+
+def test_last_page_has_no_cursor(db, user):
+    add_app(db, user, "Acme")
+    page, cursor = list_apps(db, user, limit=1)
+    assert page == ["Acme"]
+    assert cursor is None
+
+
+def test_rows_never_updated_page_by_created_at(db, user):
+    add_app(db, user, "Newest", days_ago=0)
+    add_app(db, user, "Legacy", days_ago=1, updated_at=None)
+    add_app(db, user, "Oldest", days_ago=2)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = list_apps(db, user, limit=1, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert seen == ["Newest", "Legacy", "Oldest"]
+
+
+def test_invalid_cursor_is_rejected(db, user):
+    with pytest.raises(HTTPException) as exc:
+        list_apps(db, user, cursor="not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_filters(db, user):
+    add_app(db, user, "Acme GmbH", status=ApplicationStatus.APPLIED, job_board_source="LinkedIn", priority_stars=3)
+    add_app(db, user, "Beta AG", status=ApplicationStatus.REJECTED, job_board_source="Indeed", priority_stars=1)
+    add_app(db, user, "Gamma", status=ApplicationStatus.APPLIED, days_ago=10)
+
+    assert list_apps(db, user, status=[ApplicationStatus.REJECTED])[0] == ["Beta AG"]
+    assert list_apps(db, user, company="acme")[0] == ["Acme GmbH"]
+    assert list_apps(db, user, source="Indeed")[0] == ["Beta AG"]
+    assert list_apps(db, user, min_priority=2)[0] == ["Acme GmbH"]
+    assert list_apps(db, user, applied_to=TODAY - timedelta(days=5))[0] == ["Gamma"]
+    assert sorted(list_apps(db, user, updated_from=TODAY)[0]) == ["Acme GmbH", "Beta AG"]
+
+
+def test_followup_filter_matches_python_rules(db, user):
+    from app.core.followup import classify
+
+    add_app(db, user, "Fresh")
+    add_app(db, user, "Stale", days_ago=8)
+    add_app(db, user, "Waiting", days_ago=8, followed_up_at=TODAY - timedelta(days=1))
+    add_app(db, user, "Decide", days_ago=8, followed_up_at=TODAY - timedelta(days=4))
+    add_app(db, user, "Gone", days_ago=30, status=ApplicationStatus.GHOSTED)
+
+    for klass in ("needs_followup", "awaiting_response", "needs_decision", "ok"):
+        expected = sorted(a.company_name for a in db.query(Application) if classify(a, TODAY) == klass)
+        assert sorted(list_apps(db, user, followup_class=klass)[0]) == expected
+
+    assert list_apps(db, user, followup_class="needs_followup")[0] == ["Stale"]
+
+
+def test_followup_queue_returns_only_actionable_rows(db, user, count_queries):
+    from app.api.v1.endpoints.applications import read_followup_queue
+    from app.core.followup import classify
+
+    add_app(db, user, "Fresh")
+    add_app(db, user, "Stale", days_ago=8)
+    add_app(db, user, "Waiting", days_ago=8, followed_up_at=TODAY - timedelta(days=1))
+    add_app(db, user, "Decide", days_ago=8, followed_up_at=TODAY - timedelta(days=4))
+    add_app(db, user, "Gone", days_ago=30, status=ApplicationStatus.GHOSTED, followed_up_at=TODAY - timedelta(days=9))
+    add_app(db, user, "Old reject", days_ago=30, status=ApplicationStatus.REJECTED)
+
+    with count_queries() as statements:
+        queue = asyncio.run(read_followup_queue(db=Database(db), current_user_id=user.id))
+
+    expected = {}
+    for a in db.query(Application):
+        expected.setdefault(classify(a, TODAY), []).append(a.company_name)
+    for klass in ("needs_followup", "awaiting_response", "needs_decision"):
+        assert [a.company_name for a in getattr(queue, klass)] == expected[klass]
+    assert queue.needs_followup[0].company_name == "Stale"
+
+    # Fresh and terminal applications are filtered out by the query itself
+    application_selects = [s for s in statements if s.lstrip().upper().startswith("SELECT") and "FROM application " in s]
+    assert len(application_selects) == 1
+    assert "status NOT IN" in application_selects[0]
@@ -0,0 +1,75 @@
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi import Response
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.api.v1.endpoints.applications import create_application, read_applications
+from app.core import security
+from app.core.config import Settings
+from app.db.base_class import Base
+from app.models.user import User
+from app.schemas.application import ApplicationCreate
+
+
+async def _scenario():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async with sessions() as session:
+        db = deps.Database(session)
+
+        def add_user(s):
+            user = User(name="Alice", email="alice@example.com", hashed_password="x")
+            s.add(user)
+            s.commit()
+            return user.id
+
+        user_id = await db.run(add_user)
+        token = security.create_access_token(user_id)
+        current_user = await deps.get_current_user(db=db, token=token)
+
+        created = await create_application(
+            db=db,
+            application_in=ApplicationCreate(
+                company_name="Acme", position_title="Engineer", location="Berlin",
+                applied_date=date(2026, 4, 1),
+            ),
+            current_user=current_user,
+        )
+        listed = await read_applications(
+            response=Response(), cursor=None, limit=10, status=None, company=None, source=None,
+            min_priority=None, applied_from=None, applied_to=None, updated_from=None,
+            updated_to=None, followup_class=None, technology=None, db=db, current_user_id=user_id,
+        )
+        points = await db.run(lambda s: s.get(User, user_id).points)
+
+    await engine.dispose()
+    return created, listed, points
+
+
+def test_endpoints_run_on_async_session():
+    created, listed, points = asyncio.run(_scenario())
+    assert [a.id for a in listed] == [created.id]
+    assert listed[0].history == []
+    assert points == 2
+
+
+def async_uri(uri, **kwargs):
+    return Settings(SQLALCHEMY_DATABASE_URI=uri, **kwargs).ASYNC_SQLALCHEMY_DATABASE_URI
+
+
+def test_async_uri_is_derived_from_the_sync_one():
+    assert async_uri("postgresql://u:p@db/d") == "postgresql+asyncpg://u:p@db/d"
+    assert async_uri("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert async_uri("mysql://u:p@db/d") is None
+
+
+def test_async_without_a_known_driver_names_the_setting():
+    with pytest.raises(ValueError, match="ASYNC_SQLALCHEMY_DATABASE_URI"):
+        async_uri("mysql://u:p@db/d", DB_ASYNC=True)
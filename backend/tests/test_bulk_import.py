@@ -0,0 +1,134 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.api.deps import Database
+from app.api.v1.endpoints import share
+from app.api.v1.endpoints.applications import create_applications_bulk
+from app.core import email
+from app.db.data_version import get_data_version
+from app.models.application import Application, ApplicationStatus
+from app.models.point_history import PointHistory
+from app.models.user import User
+
+
+@pytest.fixture
+def user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def milestones(monkeypatch):
+    sent = []
+    monkeypatch.setattr(email, "notify_milestone", lambda db, name, count, email: sent.append(count))
+    return sent
+
+
+def make_request(body: bytes, content_type: str) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {"type": "http", "method": "POST", "headers": [(b"content-type", content_type.encode())]}
+    return Request(scope, receive)
+
+
+def bulk(db, user, body: bytes, content_type="application/json"):
+    return asyncio.run(create_applications_bulk(
+        db=Database(db), request=make_request(body, content_type), current_user=user,
+    ))
+
+
+def rows(n, **extra):
+    return [
+        {"company_name": f"Company {i}", "position_title": "Engineer", "location": "Berlin",
+         "applied_date": "2026-04-01", **extra}
+        for i in range(n)
+    ]
+
+
+def test_json_import_awards_points_once(db, user, milestones, count_queries):
+    with count_queries() as statements:
+        result = bulk(db, user, json.dumps(rows(30, status="Applied")).encode())
+
+    assert result.created == 30
+    assert db.query(Application).filter(Application.user_id == user.id).count() == 30
+    assert {a.status for a in db.query(Application)} == {ApplicationStatus.APPLIED}
+    ledger = db.query(PointHistory).filter(PointHistory.user_id == user.id).all()
+    assert len(ledger) == 30
+    assert {p.reference_id for p in ledger} == set(result.ids)
+    db.refresh(user)
+    assert user.points == 60
+    assert user.current_streak == 1
+    assert milestones == [10, 25]
+    # Statement count doesn't grow with the number of rows
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 2  # applications, then point history
+    assert not [s for s in statements if "count(" in s.lower()]
+
+
+def test_csv_import_uses_schema_defaults(db, user, milestones):
+    body = (
+        "company_name,position_title,location,applied_date,priority_stars,visa_sponsorship\n"
+        "Acme,Engineer,Berlin,2026-04-01,3,true\n"
+        "Globex,Developer,Munich,2026-04-02,,\n"
+    ).encode()
+    result = bulk(db, user, body, "text/csv")
+
+    assert result.created == 2
+    apps = {a.company_name: a for a in db.query(Application)}
+    assert apps["Acme"].priority_stars == 3 and apps["Acme"].visa_sponsorship is True
+    assert apps["Globex"].priority_stars == 0
+    assert apps["Globex"].status == ApplicationStatus.SHORTLISTED
+
+
+def test_invalid_rows_reject_whole_batch(db, user, milestones):
+    body = "company_name,position_title,location,applied_date\nAcme,Engineer,Berlin,not-a-date\n".encode()
+    with pytest.raises(HTTPException) as exc_info:
+        bulk(db, user, body, "text/csv")
+    assert exc_info.value.status_code == 422
+    assert exc_info.value.detail[0]["row"] == 0
+    assert db.query(Application).count() == 0
+
+
+def test_repeated_job_urls_reject_the_batch(db, user):
+    bulk(db, user, json.dumps(rows(1, job_url="https://jobs.example.com/1")).encode())
+    batch = [
+        {**row, "job_url": url}
+        for row, url in zip(rows(3), ("https://jobs.example.com/1", "https://jobs.example.com/2", "https://jobs.example.com/2#apply"))
+    ]
+
+    with pytest.raises(HTTPException) as exc:
+        bulk(db, user, json.dumps(batch).encode())
+    assert exc.value.status_code == 409
+    assert exc.value.detail[0]["row"] == 0
+    assert exc.value.detail[1] == {"row": 2, "duplicate_of_row": 1}
+    assert db.query(Application).count() == 1
+
+
+def test_import_changes_share_version_for_user_active_today(db, milestones):
+    owner = User(name="Anish", email="aneesh.nl@gmail.com", hashed_password="x")
+    db.add(owner)
+    db.commit()
+    bulk(db, owner, json.dumps(rows(1)).encode())  # active today from here on
+    share._payload_cache.clear()
+    request = share.ShareRequest(password=share.settings.SHARE_PASSWORD)
+
+    def share_data(if_none_match=None):
+        return asyncio.run(share.get_share_data(db=Database(db), body=request, stream=False, format="json",
+                                                accept_encoding=None, if_none_match=if_none_match))
+
+    etag = share_data().headers["etag"]
+    version = get_data_version(db, owner.id)
+
+    bulk(db, owner, json.dumps(rows(3)).encode())
+
+    assert get_data_version(db, owner.id) > version
+    changed = share_data(if_none_match=etag)
+    assert changed.status_code == 200
+    assert len(json.loads(changed.body)["applications"]) == 4
@@ -0,0 +1,50 @@
+from datetime import date, datetime
+
+from app.db.data_version import get_data_version
+from app.models.application import Application, ApplicationHistory, ApplicationStatus
+from app.models.user import User
+
+
+def make_user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x",
+                updated_at=datetime(2026, 4, 1, 9, 0))
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_writes_bump_owner_version(db):
+    user = make_user(db)
+    start = get_data_version(db, user.id)
+
+    app = Application(user_id=user.id, company_name="Acme", position_title="Engineer",
+                      location="Berlin", applied_date=date(2026, 4, 1))
+    db.add(app)
+    db.commit()
+    assert get_data_version(db, user.id) == start + 1
+
+    # History rows carry no user_id; the owner is found through the application
+    db.add(ApplicationHistory(application_id=app.id, new_status=ApplicationStatus.APPLIED))
+    db.commit()
+    assert get_data_version(db, user.id) == start + 2
+
+    db.delete(app)
+    db.commit()
+    assert get_data_version(db, user.id) == start + 3
+
+
+def test_unchanged_flush_does_not_bump(db):
+    user = make_user(db)
+    start = get_data_version(db, user.id)
+    user.name = user.name
+    db.commit()
+    assert get_data_version(db, user.id) == start
+
+
+def test_bump_keeps_last_activity_marker(db):
+    user = make_user(db)
+    db.add(Application(user_id=user.id, company_name="Acme", position_title="Engineer",
+                       location="Berlin", applied_date=date(2026, 4, 1)))
+    db.commit()
+    db.expire_all()
+    assert user.updated_at == datetime(2026, 4, 1, 9, 0)
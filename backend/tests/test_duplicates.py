@@ -0,0 +1,107 @@
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.deps import Database
+from app.api.v1.endpoints.applications import create_application, update_application
+from app.core import duplicates
+from app.models.application import Application
+from app.models.user import User
+from app.schemas.application import ApplicationCreate, ApplicationUpdate
+
+
+@pytest.fixture
+def user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def create(db, user, company="ACME GmbH", title="Backend Engineer (m/w/d)", url=None, check_similar=False):
+    return asyncio.run(create_application(
+        db=Database(db),
+        application_in=ApplicationCreate(
+            company_name=company, position_title=title, location="Berlin",
+            applied_date=date(2026, 4, 1), job_url=url,
+        ),
+        check_similar=check_similar,
+        current_user=user,
+    ))
+
+
+def test_normalization():
+    assert duplicates.normalize_url(
+        "https://www.LinkedIn.com/jobs/view/123/?trk=public&refId=abc#top"
+    ) == "linkedin.com/jobs/view/123"
+    assert duplicates.normalize_url(
+        "https://de.indeed.com/viewjob?from=serp&jk=abc123&tk=xyz"
+    ) == duplicates.normalize_url("de.indeed.com/viewjob?jk=abc123")
+    assert duplicates.url_hash("") is None
+    assert duplicates.normalize_url(
+        "https://www.linkedin.com/jobs/search/?currentJobId=42&keywords=kotlin"
+    ) == duplicates.normalize_url("https://www.linkedin.com/jobs/view/backend-engineer-at-acme-42/")
+    assert duplicates.normalize_url("https://www.linkedin.com/jobs/collections/recommended/") is None
+    assert duplicates.dedupe_key("ACME GmbH", "Backend Engineer (m/w/d)") == "acme|backend engineer"
+    assert duplicates.dedupe_key("Acme", "Backend-Engineer (all genders)") == "acme|backend engineer"
+
+
+def test_same_posting_is_reported(db, user):
+    first = create(db, user, url="https://www.linkedin.com/jobs/view/123/?trk=a")
+    points = user.points
+
+    with pytest.raises(HTTPException) as exc:
+        create(db, user, company="Acme", url="https://linkedin.com/jobs/view/123?trk=b")
+    assert exc.value.status_code == 409
+    assert exc.value.detail["match"] == "job_url"
+    assert exc.value.detail["application"]["id"] == str(first.id)
+    db.expire_all()
+    assert db.query(Application).count() == 1
+    assert user.points == points
+
+
+def test_similar_company_and_title_only_when_asked(db, user):
+    create(db, user)
+    # Applying to the same role twice is allowed from the app...
+    create(db, user, company="Acme", title="Backend Engineer")
+    # ...but the extension asks for similar captures to be reported
+    with pytest.raises(HTTPException) as exc:
+        create(db, user, company="acme gmbh", title="Backend Engineer (f/m/x)", check_similar=True)
+    assert exc.value.detail["match"] == "company_title"
+    create(db, user, company="Acme", title="Frontend Engineer", check_similar=True)
+
+
+def test_update_cannot_take_another_applications_url(db, user):
+    create(db, user, url="https://jobs.example.com/1")
+    second = create(db, user, url="https://jobs.example.com/2")
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(update_application(
+            db=Database(db), id=second.id, current_user=user,
+            application_in=ApplicationUpdate(job_url="https://jobs.example.com/1/"),
+        ))
+    assert exc.value.status_code == 409
+
+    db.rollback()
+    updated = asyncio.run(update_application(
+        db=Database(db), id=second.id, current_user=user,
+        application_in=ApplicationUpdate(position_title="Staff Engineer"),
+    ))
+    assert updated.position_title == "Staff Engineer"
+    assert db.get(Application, second.id).dedupe_key == "acme|staff engineer"
+
+
+
+def test_different_jobs_from_a_search_view_are_not_duplicates(db, user):
+    create(db, user, url="https://www.linkedin.com/jobs/search/?currentJobId=111&keywords=kotlin")
+    second = create(
+        db, user, company="Beta", url="https://www.linkedin.com/jobs/search/?currentJobId=222&keywords=kotlin",
+    )
+    assert second.company_name == "Beta"
+
+    # A listing page names no posting, so it can't collide with anything
+    for company in ("Gamma", "Delta"):
+        create(db, user, company=company, url="https://www.linkedin.com/jobs/search/")
+    assert db.query(Application).filter(Application.job_url_hash.is_(None)).count() == 2
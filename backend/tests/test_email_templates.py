@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.core import email
+from app.core.templates import Markup, Template, render_rows
+
+
+def test_values_are_escaped_but_markup_is_not():
+    tpl = Template("<p>{name}</p>{extra}")
+    html = tpl.render(name="<script>alert('x')</script>", extra=Markup("<br>"))
+    assert html == "<p>&lt;script&gt;alert(&#x27;x&#x27;)&lt;/script&gt;</p><br>"
+    assert isinstance(html, Markup)
+
+
+def test_literal_braces_and_unsupported_specs():
+    assert Template("a {{b}} {c}").render(c=1) == "a {b} 1"
+    with pytest.raises(ValueError):
+        Template("{value:>10}")
+
+
+def test_render_rows_streams_each_row():
+    rows = render_rows(Template("<li>{x}</li>"), [{"x": 1}, {"x": "<2>"}])
+    assert rows == "<li>1</li><li>&lt;2&gt;</li>"
+
+
+def test_digest_escapes_user_content_and_reuses_rendering():
+    email.render_followup_digest.cache.clear()
+    needs_followup = [{"company": "A&B <GmbH>", "position": "SWE", "status": "Applied", "days_stale": 8}]
+
+    with patch("app.core.email._send") as mock_send:
+        email.notify_followup_digest(None, "Alice", needs_followup, [], email="alice@example.com")
+        email.notify_followup_digest(None, "Alice", needs_followup, [], email="alice@example.com")
+
+    first, second = (call.args[3] for call in mock_send.call_args_list)
+    assert "A&amp;B &lt;GmbH&gt;" in first
+    assert first is second
+    assert email.render_followup_digest.cache.hits == 1
+
+
+def test_offer_omits_empty_optional_lines():
+    with patch("app.core.email._send") as mock_send:
+        email.notify_offer(None, "Alice", "Acme", "SWE", "Berlin", None, None, email="alice@example.com")
+    html = mock_send.call_args_list[0].args[3]
+    assert "Salary" not in html
+    assert "Notes" not in html
+
+
+def test_cache_key_handles_nested_keyword_arguments():
+    email.render_followup_digest.cache.clear()
+    hits = email.render_followup_digest.cache.hits
+    rows = [{"company": "Acme", "position": "SWE", "status": "Applied", "days_stale": 8, "tags": ["remote"]}]
+
+    first = email.render_followup_digest(user_name="Alice", needs_followup=rows, needs_decision=[])
+    second = email.render_followup_digest(user_name="Alice", needs_followup=rows, needs_decision=[])
+    other = email.render_followup_digest(user_name="Alice", needs_followup=rows, needs_decision=[{
+        "company": "Beta", "position": "Dev", "followed_up_days_ago": 4,
+    }])
+
+    assert first is second
+    assert "Needs Decision" in other and "Needs Decision" not in first
+    assert email.render_followup_digest.cache.hits == hits + 1
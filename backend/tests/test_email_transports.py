@@ -0,0 +1,138 @@
+import mailbox
+import smtplib
+from email import message_from_bytes
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core import email, email_transports, outbox
+from app.core.config import settings
+
+
+def message(subject="Hello", reply_to=None):
+    return {
+        "id": uuid4(), "recipients": ["a@example.com", "b@example.com"], "subject": subject,
+        "html": "<p>hi</p>", "reply_to": reply_to,
+    }
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    def use(name, sink=None):
+        monkeypatch.setattr(settings, "EMAIL_TRANSPORT", name)
+        if sink is not None:
+            monkeypatch.setattr(settings, "EMAIL_SINK_PATH", str(sink))
+        return email_transports.get_transport()
+
+    yield use
+    email_transports._transport = None
+
+
+def test_mbox_sink_appends_messages(tmp_path, transport):
+    path = tmp_path / "sent.mbox"
+    transport("mbox", path).send([message("One"), message("Two")])
+
+    box = mailbox.mbox(path)
+    assert [m["Subject"] for m in box] == ["One", "Two"]
+    assert box[0]["To"] == "a@example.com, b@example.com"
+    assert box[0].get_content_type() == "text/html"
+
+
+def test_file_sink_writes_one_eml_per_message(tmp_path, transport):
+    msg, to_mentor = message(), message(reply_to="alice@example.com")
+    transport("file", tmp_path / "eml").send([msg, to_mentor])
+
+    written = message_from_bytes((tmp_path / "eml" / f"{msg['id']}.eml").read_bytes())
+    assert written["Subject"] == "Hello"
+    assert written["Reply-To"] is None
+    written = message_from_bytes((tmp_path / "eml" / f"{to_mentor['id']}.eml").read_bytes())
+    assert written["Reply-To"] == "alice@example.com"
+
+
+class FakeSMTP:
+    connections = []
+
+    def __init__(self, host, port, timeout):
+        self.sent = []
+        self.closed = False
+        FakeSMTP.connections.append(self)
+
+    def send_message(self, mime):
+        if mime["Subject"] == "Refused":
+            raise smtplib.SMTPRecipientsRefused({"a@example.com": (550, b"no such user")})
+        if mime["Subject"] == "Drop":
+            raise smtplib.SMTPServerDisconnected("gone")
+        self.sent.append(mime["Subject"])
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def smtp(transport, monkeypatch):
+    FakeSMTP.connections = []
+    monkeypatch.setattr(email_transports.smtplib, "SMTP", FakeSMTP)
+    return transport("smtp")
+
+
+def test_smtp_sends_batch_over_one_connection(smtp):
+    assert smtp.send([message("One"), message("Two")]) == {}
+
+    assert len(FakeSMTP.connections) == 1
+    assert FakeSMTP.connections[0].sent == ["One", "Two"]
+    assert FakeSMTP.connections[0].closed
+
+
+def test_smtp_reports_failures_per_message(smtp):
+    messages = [message("One"), message("Refused"), message("Two"), message("Drop"), message("Three")]
+    errors = smtp.send(messages)
+
+    # Accepted messages aren't retried; after a disconnect nothing else was sent
+    assert FakeSMTP.connections[0].sent == ["One", "Two"]
+    assert set(errors) == {m["id"] for m in messages[1:2] + messages[3:]}
+    assert isinstance(errors[messages[1]["id"]], smtplib.SMTPRecipientsRefused)
+    assert isinstance(errors[messages[4]["id"]], smtplib.SMTPServerDisconnected)
+
+
+def test_unknown_transport_is_rejected(transport):
+    with pytest.raises(ValueError):
+        transport("pigeon")
+
+
+def test_notifications_flow_through_outbox_to_sink(db, tmp_path, transport, monkeypatch):
+    monkeypatch.setattr(outbox, "_new_session", sessionmaker(bind=db.get_bind()))
+    transport("file", tmp_path)
+
+    email.notify_milestone(db, "Alice", 25, email="alice@example.com")
+    db.commit()
+    assert outbox.queue_depth(db)["pending"] == 1  # no mentors configured
+
+    sent_before = outbox.stats.sent
+    outbox.flush()
+
+    assert len(list(tmp_path.glob("*.eml"))) == 1
+    snapshot = outbox.snapshot(db)
+    assert snapshot["queue"] == {"pending": 0, "sending": 0}
+    assert outbox.stats.sent == sent_before + 1
+    assert snapshot["send"]["count"] >= 1
+
+
+def test_mentors_only_hear_about_the_owner(db, tmp_path, transport, monkeypatch):
+    monkeypatch.setattr(outbox, "_new_session", sessionmaker(bind=db.get_bind()))
+    monkeypatch.setattr(settings, "USER_EMAIL", "owner@example.com")
+    monkeypatch.setattr(settings, "MENTOR_EMAILS", "mentor@example.com")
+    transport("file", tmp_path)
+
+    email.notify_milestone(db, "Bob", 25, email="bob@example.com")
+    email.notify_streak_broken(db, "Bob", 5, email="bob@example.com")
+    email.notify_milestone(db, "Owner", 25, email="Owner@example.com")
+    db.commit()
+    outbox.flush()
+
+    sent = [message_from_bytes(path.read_bytes()) for path in tmp_path.glob("*.eml")]
+    assert sorted(m["To"] for m in sent) == ["Owner@example.com", "bob@example.com", "mentor@example.com"]
+    assert [m["Reply-To"] for m in sent if m["To"] == "mentor@example.com"] == ["Owner@example.com"]
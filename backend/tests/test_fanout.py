@@ -0,0 +1,94 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import email, fanout, scheduler
+from app.db.base_class import Base
+from app.models.application import Application
+from app.models.user import User
+
+TODAY = date(2026, 4, 27)
+
+
+@pytest.fixture
+def factory(tmp_path, monkeypatch):
+    # Workers need their own connections, so use a file database rather than the shared in-memory one
+    engine = create_engine(f"sqlite:///{tmp_path / 'fanout.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(fanout, "_new_session", factory)
+    yield factory
+    engine.dispose()
+
+
+def add_users(factory, n):
+    db = factory()
+    users = [User(name=f"User {i}", email=f"user{i}@example.com", hashed_password="x") for i in range(n)]
+    db.add_all(users)
+    db.commit()
+    ids = [u.id for u in users]
+    db.close()
+    return ids
+
+
+def test_every_user_is_processed_across_batches(factory):
+    ids = add_users(factory, 23)
+    seen = []
+
+    report = fanout.run_for_all_users("test", lambda db, user: seen.append(user.id) or True, workers=3, batch_size=5)
+
+    assert sorted(seen) == sorted(ids)
+    assert (report.users, report.acted, report.failed) == (23, 23, 0)
+    assert fanout.reports["test"] is report
+    assert report.snapshot()["per_user"]["count"] == 23
+
+
+def test_one_failing_user_does_not_stop_the_run(factory):
+    add_users(factory, 6)
+
+    def step(db, user):
+        if user.name == "User 2":
+            raise RuntimeError("boom")
+        return user.name != "User 3"
+
+    report = fanout.run_for_all_users("test", step, workers=2, batch_size=4)
+
+    assert (report.users, report.acted, report.failed) == (6, 4, 1)
+
+
+def test_criteria_filter_users(factory):
+    db = factory()
+    db.add_all([
+        User(name="Streak", email="s@example.com", hashed_password="x", current_streak=5),
+        User(name="None", email="n@example.com", hashed_password="x", current_streak=0),
+    ])
+    db.commit()
+    db.close()
+
+    seen = []
+    fanout.run_for_all_users("test", lambda db, user: seen.append(user.name), User.current_streak > 1)
+
+    assert seen == ["Streak"]
+
+
+def test_followup_digest_goes_to_each_users_own_address(factory, monkeypatch):
+    ids = add_users(factory, 3)
+    db = factory()
+    stale = datetime.combine(TODAY - timedelta(days=10), datetime.min.time())
+    for user_id in ids[:2]:
+        db.add(Application(
+            user_id=user_id, company_name="Acme", position_title="SWE", location="Berlin",
+            applied_date=stale.date(), updated_at=stale, created_at=stale,
+        ))
+    db.commit()
+
+    sent = []
+    monkeypatch.setattr(email, "notify_followup_digest", lambda db, name, followup, decision, email: sent.append(email))
+
+    report = fanout.run_for_all_users("followup_digest", lambda s, user: scheduler._followup_digest(s, user, TODAY))
+
+    assert sorted(sent) == ["user0@example.com", "user1@example.com"]
+    assert (report.users, report.acted) == (3, 2)
+    db.close()
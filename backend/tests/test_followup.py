@@ -167,13 +167,15 @@ def test_notify_followup_digest_sends_email_to_user():
         mock_settings.USER_EMAIL = "user@example.com"
 
         notify_followup_digest(
+            None,
             "Alice",
             needs_followup=[{"company": "Acme", "position": "SWE", "status": "Applied", "days_stale": 8}],
             needs_decision=[],
+            email="user@example.com",
         )
 
         mock_send.assert_called_once()
-        to, subject, html = mock_send.call_args[0]
+        _, to, subject, html = mock_send.call_args[0]
         assert "user@example.com" in to
         assert "Acme" in html
         assert "Needs Followup" in html
@@ -188,12 +190,14 @@ def test_notify_followup_digest_includes_decision_section():
         mock_settings.USER_EMAIL = "user@example.com"
 
         notify_followup_digest(
+            None,
             "Alice",
             needs_followup=[],
             needs_decision=[{"company": "Beta", "position": "Dev", "followed_up_days_ago": 4}],
+            email="user@example.com",
         )
 
-        _, _, html = mock_send.call_args[0]
+        _, _, _, html = mock_send.call_args[0]
         assert "Beta" in html
         assert "Needs Decision" in html
 
@@ -209,15 +213,15 @@ def test_notify_weekly_summary_includes_followup_row():
         mock_settings.MENTOR_EMAILS = "mentor@example.com"
 
         notify_weekly_summary(
-            user_name="Alice", current_streak=5, longest_streak=10,
+            None, user_name="Alice", current_streak=5, longest_streak=10,
             level=2, level_name="Active Applicant", points=150,
             total_apps=20, apps_this_week=3, response_rate=30,
             interview_rate=10, active_apps=15,
-            followup_needed=2, decision_needed=1,
+            followup_needed=2, decision_needed=1, email="user@example.com",
         )
 
         mock_send.assert_called_once()
-        _, _, html = mock_send.call_args[0]
+        _, _, _, html = mock_send.call_args[0]
         assert "Followup needed" in html
         assert "2 pending" in html
         assert "1 need a decision" in html
@@ -232,12 +236,12 @@ def test_notify_weekly_summary_omits_followup_row_when_zero():
         mock_settings.MENTOR_EMAILS = "mentor@example.com"
 
         notify_weekly_summary(
-            user_name="Alice", current_streak=5, longest_streak=10,
+            None, user_name="Alice", current_streak=5, longest_streak=10,
             level=2, level_name="Active Applicant", points=150,
             total_apps=20, apps_this_week=3, response_rate=30,
             interview_rate=10, active_apps=15,
-            followup_needed=0, decision_needed=0,
+            followup_needed=0, decision_needed=0, email="user@example.com",
         )
 
-        _, _, html = mock_send.call_args[0]
+        _, _, _, html = mock_send.call_args[0]
         assert "Followup needed" not in html
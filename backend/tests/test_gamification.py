@@ -2,7 +2,12 @@ from datetime import date, datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from app.core.gamification import add_points
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.gamification import _level_for, add_points, add_points_bulk
+from app.core.working_days import OffDayCalendar
+from app.models.user import User
 
 # Fixed reference point: Wednesday 2026-04-29
 TODAY = datetime(2026, 4, 29, 10, 0, tzinfo=timezone.utc)
@@ -23,12 +28,29 @@ def make_user(current_streak=0, longest_streak=0, updated_at=None):
     )
 
 
+def fake_db(user, points):
+    """MagicMock session whose UPDATE ... RETURNING answers with the new total and level."""
+    total = user.points + points
+    level = _level_for(total)
+    db = MagicMock()
+    db.execute.return_value.one.return_value = SimpleNamespace(
+        points=total, level=level["level"], level_name=level["name"],
+    )
+    return db
+
+
+def plain_attributes():
+    # SimpleNamespace users have no ORM state to load the returned values into
+    return patch("app.core.gamification.set_committed_value", setattr)
+
+
 def run(user, today_dt=TODAY, off_days=None):
     mock_dt = MagicMock()
     mock_dt.now.return_value = today_dt
     with patch("app.core.gamification.datetime", mock_dt), \
-         patch("app.core.gamification.load_off_days", return_value=off_days or set()):
-        add_points(MagicMock(), user, points=10, reason="test")
+         patch("app.core.gamification.load_off_days", return_value=OffDayCalendar(off_days or set())), \
+         plain_attributes():
+        add_points(fake_db(user, 10), user, points=10, reason="test")
 
 
 # --- first activity ---
@@ -105,3 +127,81 @@ def test_longest_streak_updates_when_beaten():
     user = make_user(current_streak=5, longest_streak=5, updated_at=YESTERDAY)
     run(user)
     assert user.longest_streak == 6
+
+
+# --- points total ---
+
+def test_add_points_updates_running_total_without_reloading_history():
+    user = make_user(updated_at=YESTERDAY, current_streak=1)
+    user.points = 40
+    db = fake_db(user, 2)
+    with patch("app.core.gamification.load_off_days", return_value=OffDayCalendar(set())), plain_attributes():
+        add_points(db, user, points=2, reason="test")
+    assert user.points == 42
+    db.refresh.assert_not_called()
+
+
+def test_add_points_recomputes_level_from_total():
+    user = make_user(updated_at=YESTERDAY, current_streak=1)
+    user.points = 99
+    user.name = "Alice"
+    user.email = "alice@example.com"
+    with patch("app.core.gamification.load_off_days", return_value=OffDayCalendar(set())), \
+         patch("app.core.email.notify_level_up") as mock_notify, plain_attributes():
+        add_points(fake_db(user, 1), user, points=1, reason="test")
+    assert user.level == 2
+    mock_notify.assert_called_once()
+
+
+# --- stored total, against a real session ---
+
+@pytest.fixture
+def make_db_user(db):
+    def make(updated_at=None, current_streak=0, points=0):
+        user = User(name="Alice", email="alice@example.com", hashed_password="x",
+                    current_streak=current_streak, points=points)
+        db.add(user)
+        db.commit()
+        # Set after the insert, which stamps updated_at with the real clock
+        user.updated_at = updated_at
+        db.commit()
+        return user
+    return make
+
+
+def test_stored_total_survives_a_reload(db, make_db_user):
+    user = make_db_user(updated_at=YESTERDAY, current_streak=1, points=40)
+    with patch("app.core.gamification.load_off_days", return_value=OffDayCalendar(set())):
+        add_points(db, user, points=2, reason="test")
+    db.commit()
+    db.expire_all()
+    assert user.points == 42
+
+
+def test_level_up_is_notified_once(db, make_db_user):
+    user = make_db_user(updated_at=YESTERDAY, current_streak=1, points=99)
+    with patch("app.core.gamification.load_off_days", return_value=OffDayCalendar(set())), \
+         patch("app.core.email.notify_level_up") as mock_notify:
+        add_points(db, user, points=1, reason="test")
+        add_points(db, user, points=1, reason="test")
+    assert (user.level, user.level_name) == (2, "Active Applicant")
+    mock_notify.assert_called_once_with(db, "Alice", 2, "Active Applicant", 100, email=user.email)
+
+
+def test_concurrent_awards_are_not_lost(db, make_db_user):
+    user = make_db_user(updated_at=YESTERDAY, current_streak=1, points=40)
+    # A second request loaded the same user before this one committed
+    other_db = sessionmaker(bind=db.get_bind())()
+    stale = other_db.get(User, user.id)
+    assert stale.points == 40
+
+    with patch("app.core.gamification.load_off_days", return_value=OffDayCalendar(set())):
+        add_points(db, user, points=5, reason="first")
+        db.commit()
+        add_points_bulk(other_db, stale, [{"points": 3, "reason": "a"}, {"points": 2, "reason": "b"}])
+        assert stale.points == 50
+        other_db.commit()
+    other_db.close()
+
+    db.expire_all()
+    assert user.points == 50
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from passlib.context import CryptContext
+
+from app.api.deps import Database
+from app.api.v1.endpoints.login import login_access_token
+from app.core import security
+from app.models.user import User
+
+LAST_ACTIVE = datetime(2026, 4, 1, 9, 0)
+
+
+def make_user(db, hashed_password):
+    user = User(name="Alice", email="alice@example.com", hashed_password=hashed_password,
+                updated_at=LAST_ACTIVE)
+    db.add(user)
+    db.commit()
+    return user
+
+
+def login(db, password):
+    form = OAuth2PasswordRequestForm(username="alice@example.com", password=password)
+    return asyncio.run(login_access_token(db=Database(db), form_data=form))
+
+
+def test_login_rehashes_outdated_hash(db):
+    cheap = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=4).hash("s3cret")
+    user = make_user(db, cheap)
+
+    assert login(db, "s3cret")["token_type"] == "bearer"
+
+    db.expire_all()
+    assert user.hashed_password != cheap
+    assert not security.pwd_context.needs_update(user.hashed_password)
+    assert security.verify_password("s3cret", user.hashed_password)
+    # A login is not streak activity
+    assert user.updated_at == LAST_ACTIVE
+    assert security.login_latency.snapshot()["count"] >= 1
+
+
+def test_wrong_password_is_rejected(db):
+    make_user(db, security.get_password_hash("s3cret"))
+    with pytest.raises(HTTPException) as exc_info:
+        login(db, "wrong")
+    assert exc_info.value.status_code == 400
+
+
+def test_full_hashing_pool_answers_503(db, monkeypatch):
+    make_user(db, security.get_password_hash("s3cret"))
+    hasher = security._PasswordHasher(workers=1, queue=0)
+    monkeypatch.setattr(security, "password_hasher", hasher)
+
+    release = threading.Event()
+
+    async def occupy_and_login():
+        busy = asyncio.ensure_future(hasher.run(release.wait))
+        await asyncio.sleep(0)
+        try:
+            form = OAuth2PasswordRequestForm(username="alice@example.com", password="s3cret")
+            with pytest.raises(HTTPException) as exc_info:
+                await login_access_token(db=Database(db), form_data=form)
+            return exc_info.value
+        finally:
+            release.set()
+            await busy
+
+    error = asyncio.run(occupy_and_login())
+    assert error.status_code == 503
+    assert error.headers["Retry-After"] == "1"
+    assert hasher.snapshot()["rejected"] == 1
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from app.core import milestones
+from app.core.config import settings
+from app.models.user import User
+
+
+def make_user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x",
+                updated_at=datetime(2026, 4, 1, 9, 0))
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_each_milestone_fires_once(db):
+    user = make_user(db)
+    reached = []
+    for _ in range(10):
+        reached += milestones.record_applications(db, user.id, 1)
+    assert reached == [10]
+
+    # Dropping below and climbing back doesn't notify again
+    assert milestones.record_applications(db, user.id, -1) == []
+    assert milestones.record_applications(db, user.id, 1) == []
+    db.commit()
+
+    db.refresh(user)
+    assert user.application_count == 10
+    assert user.last_milestone == 10
+    assert user.updated_at == datetime(2026, 4, 1, 9, 0)
+
+
+def test_batch_can_cross_several_milestones(db):
+    user = make_user(db)
+    assert milestones.record_applications(db, user.id, 60) == [10, 25, 50]
+    assert milestones.record_applications(db, user.id, 40) == [100]
+
+
+def test_milestones_are_configurable(db, monkeypatch):
+    monkeypatch.setattr(settings, "APPLICATION_MILESTONES", "3, 1")
+    user = make_user(db)
+    assert milestones.record_applications(db, user.id, 2) == [1]
+    assert milestones.record_applications(db, user.id, 2) == [3]
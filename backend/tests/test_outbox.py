@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import email_transports, outbox
+from app.core.config import settings
+from app.db.base_class import Base
+from app.models.email_outbox import EmailOutbox
+
+
+@pytest.fixture
+def sent(db, monkeypatch):
+    """Route the outbox through the test database and capture Resend batch calls."""
+    monkeypatch.setattr(outbox, "_new_session", sessionmaker(bind=db.get_bind()))
+    calls = []
+    monkeypatch.setattr(email_transports.resend.Batch, "send", lambda params, options=None: calls.append(params))
+    return calls
+
+
+def test_queued_messages_go_out_in_one_batch(db, sent):
+    for i in range(3):
+        outbox.enqueue(db, ["a@example.com"], f"Subject {i}", "<p>hi</p>")
+    db.commit()
+
+    assert outbox.process_batch() == 3
+    assert len(sent) == 1
+    assert [m["subject"] for m in sent[0]] == ["Subject 0", "Subject 1", "Subject 2"]
+    assert {row.status for row in db.query(EmailOutbox)} == {"sent"}
+    assert outbox.process_batch() == 0
+
+
+def test_enqueue_joins_the_callers_transaction(db, sent, monkeypatch):
+    woken = []
+    monkeypatch.setattr(outbox._pool, "wake", lambda: woken.append(True))
+
+    outbox.enqueue(db, ["a@example.com"], "Rolled back", "<p>hi</p>")
+    db.rollback()
+    assert db.query(EmailOutbox).count() == 0
+    assert not woken
+
+    outbox.enqueue(db, ["a@example.com"], "Committed", "<p>hi</p>")
+    assert not woken
+    db.commit()
+    assert woken == [True]
+    assert [row.subject for row in db.query(EmailOutbox)] == ["Committed"]
+
+
+def test_failed_batch_is_retried_with_backoff(db, sent, monkeypatch):
+    def fail(params, options=None):
+        raise RuntimeError("resend down")
+
+    monkeypatch.setattr(email_transports.resend.Batch, "send", fail)
+    monkeypatch.setattr(email_transports.resend.Emails, "send", fail)
+    outbox.enqueue(db, ["a@example.com"], "Level up", "<p>hi</p>")
+    db.commit()
+    outbox.process_batch()
+
+    row = db.query(EmailOutbox).one()
+    assert row.status == "pending"
+    assert row.attempts == 1
+    assert "resend down" in row.last_error
+    assert row.next_attempt_at >= datetime.utcnow() + timedelta(seconds=settings.EMAIL_RETRY_BASE - 5)
+    # Not due yet
+    assert outbox.process_batch() == 0
+
+
+def test_one_bad_message_does_not_hold_back_the_batch(db, sent, monkeypatch):
+    def reject_batch(params, options=None):
+        raise RuntimeError("invalid `to` field")
+
+    def send_one(params, options=None):
+        if params["to"] == ["not-an-address"]:
+            raise RuntimeError("invalid `to` field")
+        sent.append([params])
+
+    monkeypatch.setattr(email_transports.resend.Batch, "send", reject_batch)
+    monkeypatch.setattr(email_transports.resend.Emails, "send", send_one)
+    outbox.enqueue(db, ["a@example.com"], "Good", "<p>hi</p>")
+    outbox.enqueue(db, ["not-an-address"], "Bad", "<p>hi</p>")
+    outbox.enqueue(db, ["b@example.com"], "Also good", "<p>hi</p>")
+    db.commit()
+
+    assert outbox.process_batch() == 3
+    db.expire_all()
+    statuses = {row.subject: row.status for row in db.query(EmailOutbox)}
+    assert statuses == {"Good": "sent", "Bad": "pending", "Also good": "sent"}
+    assert [batch[0]["subject"] for batch in sent] == ["Good", "Also good"]
+
+
+def test_gives_up_after_max_attempts(db, sent, monkeypatch):
+    def fail(params, options=None):
+        raise RuntimeError("bad address")
+
+    monkeypatch.setattr(email_transports.resend.Batch, "send", fail)
+    monkeypatch.setattr(settings, "EMAIL_MAX_ATTEMPTS", 2)
+    outbox.enqueue(db, ["a@example.com"], "Milestone", "<p>hi</p>")
+    db.commit()
+
+    for _ in range(2):
+        db.query(EmailOutbox).update({"next_attempt_at": datetime(2000, 1, 1)})
+        db.commit()
+        outbox.process_batch()
+
+    db.expire_all()
+    assert db.query(EmailOutbox).one().status == "failed"
+
+
+def test_expired_claim_is_picked_up_again(db, sent):
+    outbox.enqueue(db, ["a@example.com"], "Offer", "<p>hi</p>")
+    db.commit()
+    # A worker claimed it and died before settling
+    db.query(EmailOutbox).update({"status": "sending", "attempts": 1, "next_attempt_at": datetime(2000, 1, 1)})
+    db.commit()
+
+    assert outbox.process_batch() == 1
+    db.expire_all()
+    row = db.query(EmailOutbox).one()
+    assert row.status == "sent" and row.attempts == 2
+
+
+def test_stop_drains_queued_messages(tmp_path, monkeypatch):
+    # Workers need their own connections, so use a file database rather than the shared in-memory one
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(outbox, "_new_session", factory)
+    sent = []
+    monkeypatch.setattr(email_transports.resend.Batch, "send", lambda params, options=None: sent.append(params))
+
+    db = factory()
+    for i in range(5):
+        db.add(EmailOutbox(recipients=["a@example.com"], subject=f"S{i}", html="x"))
+    db.commit()
+
+    pool = outbox._WorkerPool()
+    pool.start(workers=2)
+    pool.stop(timeout=5)
+
+    assert {row.status for row in db.query(EmailOutbox)} == {"sent"}
+    assert sum(len(batch) for batch in sent) == 5
+    db.close()
+    engine.dispose()
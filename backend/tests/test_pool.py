@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.db.pool import InstrumentedQueuePool, PoolMetrics, instrument
+
+
+def _engine(tmp_path, pre_ping_idle, **kw):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        **kw,
+    )
+    metrics = PoolMetrics("test")
+    instrument(engine, metrics, pre_ping_idle)
+    return engine, metrics
+
+
+def test_checkouts_are_timed_and_saturation_reported(tmp_path):
+    engine, metrics = _engine(tmp_path, -1, pool_size=2, max_overflow=0)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        snapshot = metrics.snapshot()
+        assert snapshot["checked_out"] == 1
+        assert snapshot["saturation"] == 0.5
+    with engine.connect():
+        pass
+    snapshot = metrics.snapshot()
+    assert snapshot["checkout"]["count"] == 2
+    assert snapshot["checkout"]["p50_ms"] is not None
+    assert snapshot["checked_out"] == 0
+    assert snapshot["waits"] == 0
+
+
+def test_exhausted_pool_counts_wait_and_timeout(tmp_path):
+    engine, metrics = _engine(tmp_path, -1, pool_size=1, max_overflow=0, pool_timeout=0.01)
+    with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    assert metrics.waits == 1
+    assert metrics.timeouts == 1
+
+
+def test_pre_ping_skips_recently_used_connections(tmp_path):
+    engine, metrics = _engine(tmp_path, 3600, pool_size=1, max_overflow=0)
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    assert metrics.pings == 0
+
+
+def test_pre_ping_replaces_dead_idle_connection(tmp_path):
+    engine, metrics = _engine(tmp_path, 0, pool_size=1, max_overflow=0)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        raw = conn.connection.dbapi_connection
+    raw.close()  # the server drops the connection while it sits in the pool
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+    assert metrics.ping_failures == 1
+    assert metrics.pings >= 2
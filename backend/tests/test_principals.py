@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import deps
+from app.core import principals, security
+from app.core.gamification import add_points
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    principals.clear()
+    yield
+    principals.clear()
+
+
+def make_user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_principal_is_cached_per_subject(db, count_queries):
+    user = make_user(db)
+    token = security.create_access_token(user.id)
+    db.expire_all()
+
+    with count_queries() as first:
+        principal = asyncio.run(deps.get_current_principal(db=deps.Database(db), token=token))
+    with count_queries() as second:
+        cached = asyncio.run(deps.get_current_principal(db=deps.Database(db), token=token))
+        user_id = asyncio.run(deps.get_current_user_id(principal=cached))
+
+    assert principal.name == "Alice"
+    assert user_id == user.id
+    assert len(first) == 1
+    assert second == []
+
+
+def test_user_write_evicts_cached_principal(db):
+    user = make_user(db)
+    token = security.create_access_token(user.id)
+    asyncio.run(deps.get_current_principal(db=deps.Database(db), token=token))
+
+    user.name = "Alicia"
+    db.commit()
+
+    assert principals.get(user.id) is None
+    principal = asyncio.run(deps.get_current_principal(db=deps.Database(db), token=token))
+    assert principal.name == "Alicia"
+
+
+def test_points_award_evicts_cached_principal(db):
+    user = make_user(db)
+    token = security.create_access_token(user.id)
+    asyncio.run(deps.get_current_principal(db=deps.Database(db), token=token))
+
+    # Same-day award: the total changes through a Core UPDATE, the User row isn't dirty
+    add_points(db, user, points=5, reason="test")
+    add_points(db, user, points=5, reason="test")
+    db.commit()
+    asyncio.run(deps.get_current_principal(db=deps.Database(db), token=token))
+    add_points(db, user, points=5, reason="test")
+    db.commit()
+
+    principal = asyncio.run(deps.get_current_principal(db=deps.Database(db), token=token))
+    assert principal.points == 15
+
+
+def test_rolled_back_write_keeps_cached_principal(db):
+    user = make_user(db)
+    token = security.create_access_token(user.id)
+    asyncio.run(deps.get_current_principal(db=deps.Database(db), token=token))
+
+    user.name = "Alicia"
+    db.flush()
+    db.rollback()
+
+    assert principals.get(user.id).name == "Alice"
+
+
+def test_invalid_token_is_rejected(db):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(deps.get_current_principal(db=deps.Database(db), token="not-a-jwt"))
+    assert exc_info.value.status_code == 403
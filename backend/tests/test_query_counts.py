@@ -0,0 +1,76 @@
+import asyncio
+import json
+from datetime import date
+
+from fastapi import Response
+
+from app.api.deps import Database
+from app.api.v1.endpoints.applications import read_application, read_applications
+from app.api.v1.endpoints import share
+from app.api.v1.endpoints.share import ShareRequest, get_share_data
+from app.core.config import settings
+from app.models.application import Application, ApplicationHistory, ApplicationStatus
+from app.models.user import User
+
+LIST_DEFAULTS = dict(
+    cursor=None, limit=100, status=None, company=None, source=None, min_priority=None,
+    applied_from=None, applied_to=None, updated_from=None, updated_to=None, followup_class=None,
+)
+
+
+def seed(db, n_apps):
+    user = User(name="Anish", email="aneesh.nl@gmail.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    for i in range(n_apps):
+        app = Application(user_id=user.id, company_name=f"Company {i}", position_title="Engineer",
+                          location="Berlin", applied_date=date(2026, 4, 1), status=ApplicationStatus.REPLIED)
+        db.add(app)
+        db.flush()
+        db.add_all([
+            ApplicationHistory(application_id=app.id, old_status=ApplicationStatus.SHORTLISTED,
+                               new_status=ApplicationStatus.APPLIED),
+            ApplicationHistory(application_id=app.id, old_status=ApplicationStatus.APPLIED,
+                               new_status=ApplicationStatus.REPLIED),
+        ])
+    db.commit()
+    db.expire_all()
+    db.refresh(user)  # the request's user is already loaded by get_current_user
+    return user
+
+
+def render_list(db, user):
+    # Rows come back already validated against the response model, history included
+    return asyncio.run(read_applications(response=Response(), db=Database(db), current_user_id=user.id, **LIST_DEFAULTS))
+
+
+def test_list_query_count_is_independent_of_size(db, count_queries):
+    user = seed(db, 12)
+    with count_queries() as statements:
+        rendered = render_list(db, user)
+    assert len(rendered) == 12
+    assert all(len(a.history) == 2 for a in rendered)
+    assert len(statements) == 2  # applications + one batched history load
+
+
+def test_detail_loads_history_eagerly(db, count_queries):
+    user = seed(db, 1)
+    app_id = db.query(Application.id).scalar()
+    with count_queries() as statements:
+        rendered = asyncio.run(read_application(db=Database(db), id=app_id, current_user_id=user.id))
+    assert len(rendered.history) == 2
+    assert len(statements) == 2
+
+
+def test_share_query_count_is_independent_of_size(db, count_queries):
+    seed(db, 12)
+    share._payload_cache.clear()
+    with count_queries() as statements:
+        response = asyncio.run(get_share_data(
+            db=Database(db), body=ShareRequest(password=settings.SHARE_PASSWORD),
+            stream=False, format="json", accept_encoding=None, if_none_match=None,
+        ))
+    payload = json.loads(response.body)
+    assert len(payload["applications"]) == 12
+    assert all(len(a["history"]) == 2 for a in payload["applications"])
+    assert len(statements) == 5  # version, user, applications, history, contacts
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.deps import Database
+from app.api.v1.endpoints.search import search_everything
+from app.core import search
+from app.models.application import Application
+from app.models.network import NetworkContact
+from app.models.user import User
+
+
+@pytest.fixture
+def user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def records(db, user):
+    other = User(name="Bob", email="bob@example.com", hashed_password="x")
+    db.add(other)
+    db.flush()
+    db.add_all([
+        Application(user_id=user.id, company_name="Kotlin Labs", position_title="Android Engineer", location="Berlin"),
+        Application(user_id=user.id, company_name="Acme", position_title="Backend Engineer", location="Berlin",
+                    tech_stack="Kotlin, Ktor", notes="Referred by Jane"),
+        Application(user_id=user.id, company_name="Beta", position_title="Data Analyst", location="Berlin"),
+        Application(user_id=other.id, company_name="Kotlin Corp", position_title="Engineer", location="Berlin"),
+        NetworkContact(user_id=user.id, name="Jane Doe", company="Acme", notes="Met at KotlinConf"),
+    ])
+    db.commit()
+
+
+def run(db, user, q, kind=None, limit=10):
+    return asyncio.run(search_everything(db=Database(db), q=q, kind=kind, limit=limit, current_user_id=user.id))
+
+
+def test_prefix_terms_must_all_match(db, user, records):
+    assert sorted(hit["title"] for hit in run(db, user, "kot")) == ["Acme", "Jane Doe", "Kotlin Labs"]
+    assert sorted(hit["title"] for hit in run(db, user, "kot eng")) == ["Acme", "Kotlin Labs"]
+    assert [hit["title"] for hit in run(db, user, "jane", kind=["contact"])] == ["Jane Doe"]
+    assert run(db, user, " -- ") == []
+
+
+def test_postgres_matches_a_ranked_prefix_tsquery(monkeypatch, db, user):
+    assert search.prefix_query(search.words("Kot-lin  Eng")) == "kot:* & lin:* & eng:*"
+
+    monkeypatch.setattr(db.get_bind().dialect, "name", "postgresql")
+    query = search._query(db, search._SOURCES["application"], user.id, ["kot"], 5)
+    sql = str(query.statement.compile(dialect=postgresql.dialect()))
+    assert "application.search_vector @@ to_tsquery(CAST(" in sql
+    assert "ORDER BY ts_rank(application.search_vector, to_tsquery(" in sql
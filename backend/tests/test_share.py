@@ -0,0 +1,136 @@
+import asyncio
+import gzip
+import json
+import zlib
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.api.deps import Database
+from app.api.v1.endpoints import share
+from app.db import data_version  # noqa: F401 — flush hook
+from app.models.application import Application, ApplicationHistory, ApplicationStatus
+from app.models.network import NetworkContact
+from app.models.user import User
+
+
+@pytest.fixture
+def owner(db):
+    user = User(name="Anish", email="aneesh.nl@gmail.com", hashed_password="x", points=42)
+    db.add(user)
+    db.flush()
+    for i in range(5):
+        app = Application(user_id=user.id, company_name=f"Company {i}", position_title="Engineer",
+                          location="Berlin", applied_date=date(2026, 4, 1), status=ApplicationStatus.APPLIED)
+        db.add(app)
+        db.flush()
+        db.add(ApplicationHistory(application_id=app.id, old_status=ApplicationStatus.SHORTLISTED,
+                                  new_status=ApplicationStatus.APPLIED))
+    db.add(NetworkContact(user_id=user.id, name="Bob", company="Company 1"))
+    db.commit()
+    return user
+
+
+def stream(db, user, fmt, use_gzip=False):
+    with patch.object(share, "SessionLocal", sessionmaker(bind=db.get_bind())), \
+         patch.object(share, "STREAM_CHUNK_SIZE", 256):
+        chunks = list(share._stream_share(user.id, fmt, use_gzip))
+    body = b"".join(chunks)
+    return chunks, gzip.decompress(body) if use_gzip else body
+
+
+def by_id(document):
+    for key in ("applications", "contacts"):
+        document[key].sort(key=lambda item: item["id"])
+    return document
+
+
+def share_data(db, if_none_match=None):
+    request = share.ShareRequest(password=share.settings.SHARE_PASSWORD)
+    return asyncio.run(share.get_share_data(db=Database(db), body=request, stream=False, format="json",
+                                            accept_encoding=None, if_none_match=if_none_match))
+
+
+def payload(db):
+    return by_id(json.loads(share_data(db).body))
+
+
+def test_streamed_json_matches_buffered_payload(db, owner):
+    chunks, body = stream(db, owner, "json")
+    assert len(chunks) > 1
+    assert by_id(json.loads(body)) == payload(db)
+
+
+def test_streamed_ndjson_has_one_record_per_line(db, owner):
+    _, body = stream(db, owner, "ndjson")
+    records = [json.loads(line) for line in body.decode().splitlines()]
+    assert [r["type"] for r in records] == ["user"] + ["application"] * 5 + ["contact"]
+    assert records[0]["data"]["points"] == 42
+    assert records[1]["data"]["history"][0]["new_status"] == "Applied"
+
+
+def test_streamed_gzip_round_trips(db, owner):
+    _, body = stream(db, owner, "json", use_gzip=True)
+    assert by_id(json.loads(body)) == payload(db)
+
+
+def test_first_chunk_is_sent_before_the_rest_is_read(db, owner):
+    read = []
+
+    def pieces():
+        for piece in ("head", "a" * 10, "b" * 10):
+            read.append(piece)
+            yield piece
+
+    for use_gzip in (False, True):
+        read.clear()
+        chunks = share._chunked(pieces(), use_gzip)
+        first = next(chunks)
+        assert read == ["head"]
+        decompressor = zlib.decompressobj(wbits=31)
+        assert (decompressor.decompress(first) if use_gzip else first) == b"head"
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("deflate, gzip;q=0", False),
+    ("gzip; q=0.0", False),
+    ("GZIP;q=0.5", True),
+    ("*", True),
+    ("*;q=0", False),
+    ("gzip;q=0, *", False),
+    ("br, identity", False),
+])
+def test_accept_encoding_q_values(header, expected):
+    assert share._accepts_gzip(header) is expected
+
+
+# --- ETag / payload cache ---
+
+def test_etag_round_trip_returns_304_until_data_changes(db, owner):
+    share._payload_cache.clear()
+    first = share_data(db)
+    etag = first.headers["etag"]
+
+    assert share_data(db, if_none_match=etag).status_code == 304
+
+    db.add(NetworkContact(user_id=owner.id, name="Carol"))
+    db.commit()
+
+    changed = share_data(db, if_none_match=etag)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(json.loads(changed.body)["contacts"]) == 2
+
+
+def test_repeat_requests_are_served_from_cache(db, owner, count_queries):
+    share._payload_cache.clear()
+    first = share_data(db)
+    with count_queries() as statements:
+        second = share_data(db)
+    assert second.body == first.body
+    assert len(statements) == 1  # just the version lookup
@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.deps import Database
+from app.api.v1.endpoints.applications import delete_application, update_application_status
+from app.core import status_stats
+from app.models.application import Application, ApplicationHistory, ApplicationStatus
+from app.models.status_stats import StatusDwell, StatusTransition
+from app.models.user import User
+
+
+@pytest.fixture
+def user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def add_app(db, user, company, days_ago=0):
+    created = datetime.now() - timedelta(days=days_ago)
+    app = Application(
+        user_id=user.id, company_name=company, position_title="Engineer", location="Berlin",
+        status=ApplicationStatus.APPLIED, created_at=created, updated_at=created,
+    )
+    db.add(app)
+    db.commit()
+    return app
+
+
+def move(db, user, app, status):
+    asyncio.run(update_application_status(
+        db=Database(db), id=app.id, new_status=status, notes=None, current_user=user,
+    ))
+
+
+def snapshot(db):
+    transitions = {(t.old_status, t.new_status): t.count for t in db.query(StatusTransition) if t.count}
+    dwell = {(d.status, d.bucket): d.count for d in db.query(StatusDwell) if d.count}
+    return transitions, dwell
+
+
+def test_status_updates_keep_counts_equal_to_a_rebuild(db, user):
+    acme = add_app(db, user, "Acme", days_ago=10)
+    beta = add_app(db, user, "Beta", days_ago=2)
+    move(db, user, acme, ApplicationStatus.REPLIED)
+    move(db, user, acme, ApplicationStatus.PHONE_SCREEN)
+    move(db, user, beta, ApplicationStatus.REPLIED)
+    move(db, user, beta, ApplicationStatus.REJECTED)
+
+    maintained = snapshot(db)
+    transitions, dwell = maintained
+    assert transitions == {
+        (ApplicationStatus.APPLIED, ApplicationStatus.REPLIED): 2,
+        (ApplicationStatus.REPLIED, ApplicationStatus.PHONE_SCREEN): 1,
+        (ApplicationStatus.REPLIED, ApplicationStatus.REJECTED): 1,
+    }
+    # Acme sat in Applied for 10 days, Beta for 2; both left Replied within a day
+    assert dwell == {
+        (ApplicationStatus.APPLIED, 1): 1,
+        (ApplicationStatus.APPLIED, 3): 1,
+        (ApplicationStatus.REPLIED, 0): 2,
+    }
+
+    assert status_stats.rebuild(db) == 4
+    db.commit()
+    assert snapshot(db) == maintained
+
+
+def test_deleting_an_application_removes_its_transitions(db, user):
+    acme = add_app(db, user, "Acme")
+    beta = add_app(db, user, "Beta")
+    move(db, user, acme, ApplicationStatus.REPLIED)
+    move(db, user, beta, ApplicationStatus.REPLIED)
+
+    asyncio.run(delete_application(db=Database(db), id=acme.id, current_user_id=user.id))
+
+    transitions, dwell = snapshot(db)
+    assert transitions == {(ApplicationStatus.APPLIED, ApplicationStatus.REPLIED): 1}
+    assert dwell == {(ApplicationStatus.APPLIED, 0): 1}
+
+
+def test_rebuild_treats_missing_old_status_as_applied(db, user):
+    app = add_app(db, user, "Acme", days_ago=40)
+    db.add(ApplicationHistory(
+        application_id=app.id, old_status=None, new_status=ApplicationStatus.GHOSTED,
+        changed_at=datetime.now(),
+    ))
+    db.commit()
+
+    status_stats.rebuild(db, user.id)
+    db.commit()
+
+    assert status_stats.transition_counts(db, user.id) == [
+        (ApplicationStatus.APPLIED, ApplicationStatus.GHOSTED, 1)
+    ]
+    assert status_stats.dwell_histograms(db, user.id) == {"Applied": [0, 0, 0, 0, 0, 1, 0]}
@@ -0,0 +1,77 @@
+from datetime import date, datetime
+
+from app.core.streaks import compute_streaks, rebuild_all_streaks
+from app.core.working_days import OffDayCalendar
+from app.models.point_history import PointHistory
+from app.models.user import User
+
+# Wednesday
+TODAY = date(2026, 4, 29)
+
+
+def make_user(db, email, longest_streak=0, updated_at=datetime(2026, 1, 1, 9, 0)):
+    user = User(
+        name=email.split("@")[0], email=email, hashed_password="x",
+        current_streak=7, longest_streak=longest_streak, updated_at=updated_at,
+    )
+    db.add(user)
+    db.flush()
+    return user
+
+
+def log_activity(db, user, *days):
+    for d in days:
+        # Two records on the same day must count once
+        for hour in (9, 17):
+            db.add(PointHistory(user_id=user.id, points=1, reason="test",
+                                created_at=datetime(d.year, d.month, d.day, hour, 0)))
+    db.flush()
+
+
+# --- compute_streaks ---
+
+def test_no_activity_is_zero():
+    assert compute_streaks([], TODAY, OffDayCalendar(set())) == (0, 0)
+
+
+def test_streak_alive_through_weekend():
+    days = [date(2026, 4, 23), date(2026, 4, 24), date(2026, 4, 27), date(2026, 4, 28)]
+    assert compute_streaks(days, TODAY, OffDayCalendar(set())) == (4, 4)
+
+
+def test_streak_broken_by_missed_working_day():
+    days = [date(2026, 4, 20), date(2026, 4, 21), date(2026, 4, 22), date(2026, 4, 27)]
+    assert compute_streaks(days, TODAY, OffDayCalendar(set())) == (0, 3)
+
+
+# --- rebuild_all_streaks ---
+
+def test_rebuild_updates_every_user_in_batches(db):
+    alice = make_user(db, "alice@example.com")
+    bob = make_user(db, "bob@example.com", longest_streak=10)
+    carol = make_user(db, "carol@example.com", longest_streak=4)
+    log_activity(db, alice, date(2026, 4, 27), date(2026, 4, 28), date(2026, 4, 29))
+    log_activity(db, bob, date(2026, 4, 28))
+    db.commit()
+
+    recomputed, reset = rebuild_all_streaks(db, today=TODAY, batch_size=1)
+    db.commit()
+    db.expire_all()
+
+    assert (recomputed, reset) == (2, 1)
+    assert (alice.current_streak, alice.longest_streak) == (3, 3)
+    # Longest streak is never lowered by a rebuild
+    assert (bob.current_streak, bob.longest_streak) == (1, 10)
+    assert (carol.current_streak, carol.longest_streak) == (0, 0)
+
+
+def test_rebuild_does_not_touch_last_activity_marker(db):
+    user = make_user(db, "alice@example.com", updated_at=datetime(2026, 4, 28, 18, 0))
+    log_activity(db, user, date(2026, 4, 28))
+    db.commit()
+
+    rebuild_all_streaks(db, today=TODAY)
+    db.commit()
+    db.expire_all()
+
+    assert user.updated_at == datetime(2026, 4, 28, 18, 0)
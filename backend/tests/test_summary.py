@@ -0,0 +1,61 @@
+import random
+from datetime import date, datetime, timedelta
+
+from app.core.followup import needs_decision, needs_followup
+from app.core.summary import weekly_counts
+from app.models.application import Application, ApplicationStatus
+from app.models.user import User
+
+TODAY = date(2026, 4, 15)
+WEEK_START = TODAY - timedelta(days=7)
+
+
+def python_counts(apps):
+    """The per-row rules the weekly job used before aggregating in SQL."""
+    return {
+        "total": len(apps),
+        "this_week": sum(1 for a in apps if a.created_at and a.created_at.date() >= WEEK_START),
+        "responded": sum(1 for a in apps if a.status not in ("Applied", "Ghosted")),
+        "interviewed": sum(
+            1 for a in apps
+            if a.status in ("Phone Screen", "Technical Round 1", "Technical Round 2", "Final Round")
+        ),
+        "active": sum(1 for a in apps if a.status not in ("Rejected", "Ghosted", "Offer")),
+        "followup_needed": sum(1 for a in apps if needs_followup(a, TODAY)),
+        "decision_needed": sum(1 for a in apps if needs_decision(a, TODAY)),
+    }
+
+
+def test_aggregate_matches_per_row_rules(db, count_queries):
+    rng = random.Random(7)
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    other = User(name="Bob", email="bob@example.com", hashed_password="x")
+    db.add_all([user, other])
+    db.commit()
+
+    for i in range(300):
+        created = datetime.combine(TODAY - timedelta(days=rng.randint(0, 30)), datetime.min.time())
+        db.add(Application(
+            user_id=rng.choice([user.id, user.id, other.id]),
+            company_name=f"Company {i}", position_title="Engineer", location="Berlin",
+            status=rng.choice(list(ApplicationStatus)),
+            applied_date=created.date(),
+            created_at=created + timedelta(hours=rng.randint(0, 23)),
+            updated_at=created + timedelta(days=rng.randint(0, 10)),
+            followed_up_at=rng.choice([None, None, TODAY - timedelta(days=rng.randint(0, 6))]),
+        ))
+    db.commit()
+
+    apps = db.query(Application).filter(Application.user_id == user.id).all()
+    with count_queries() as statements:
+        counts = weekly_counts(db, user.id, WEEK_START, TODAY)
+
+    assert counts == python_counts(apps)
+    assert len(statements) == 1
+
+
+def test_no_applications(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    assert set(weekly_counts(db, user.id, WEEK_START, TODAY).values()) == {0}
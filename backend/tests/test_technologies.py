@@ -0,0 +1,100 @@
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi import Response
+
+from app.api.deps import Database
+from app.api.v1.endpoints.applications import (
+    create_application,
+    delete_application,
+    read_applications,
+    update_application,
+)
+from app.core import technologies
+from app.models.technology import ApplicationTechnology, Technology
+from app.models.user import User
+from app.schemas.application import ApplicationCreate, ApplicationUpdate
+
+
+@pytest.fixture
+def user(db):
+    user = User(name="Alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def create(db, user, company, tech_stack):
+    return asyncio.run(create_application(
+        db=Database(db),
+        application_in=ApplicationCreate(
+            company_name=company, position_title="Engineer", location="Berlin",
+            applied_date=date(2026, 4, 1), tech_stack=tech_stack,
+        ),
+        current_user=user,
+    ))
+
+
+def linked(db, application_id):
+    return sorted(
+        name for name, in db.query(Technology.name)
+        .join(ApplicationTechnology, ApplicationTechnology.technology_id == Technology.id)
+        .filter(ApplicationTechnology.application_id == application_id)
+    )
+
+
+def test_parse_splits_and_normalizes():
+    assert technologies.parse("Python, Django / Postgres & redis + K8s") == {
+        "python": "Python", "django": "Django", "postgres": "Postgres", "redis": "redis", "k8s": "K8s",
+    }
+    assert technologies.parse("  Spring   Boot ,spring boot, C") == {"spring boot": "Spring Boot"}
+    assert technologies.parse(None) == {}
+
+
+def test_parse_keeps_plus_inside_names():
+    assert technologies.parse("C++, C#") == {"c++": "C++", "c#": "C#"}
+    assert technologies.parse("C++ + Go/Notepad++") == {"c++": "C++", "go": "Go", "notepad++": "Notepad++"}
+
+
+def test_links_follow_create_update_and_delete(db, user):
+    app = create(db, user, "Acme", "Kotlin, Spring Boot")
+    assert linked(db, app.id) == ["Kotlin", "Spring Boot"]
+
+    asyncio.run(update_application(
+        db=Database(db), id=app.id, application_in=ApplicationUpdate(tech_stack="kotlin / Ktor"), current_user=user,
+    ))
+    assert linked(db, app.id) == ["Kotlin", "Ktor"]
+    # The dictionary keeps the first spelling and is shared across applications
+    assert db.query(Technology).filter(Technology.key == "kotlin").count() == 1
+
+    asyncio.run(delete_application(db=Database(db), id=app.id, current_user_id=user.id))
+    assert db.query(ApplicationTechnology).count() == 0
+
+
+def test_lookups_use_the_links(db, user):
+    create(db, user, "Acme", "Kotlin, Spring Boot, Postgres")
+    create(db, user, "Beta", "Kotlin & Ktor + Postgres")
+    create(db, user, "Gamma", "Python, Postgres")
+    create(db, user, "Delta", None)
+
+    listed = asyncio.run(read_applications(
+        response=Response(), cursor=None, limit=100, status=None, company=None, source=None,
+        min_priority=None, applied_from=None, applied_to=None, updated_from=None, updated_to=None,
+        followup_class=None, technology=" KOTLIN ", db=Database(db), current_user_id=user.id,
+    ))
+    assert sorted(a.company_name for a in listed) == ["Acme", "Beta"]
+
+    assert technologies.search(db, user.id, "o") == [
+        {"name": "Postgres", "applications": 3},
+        {"name": "Kotlin", "applications": 2},
+        {"name": "Ktor", "applications": 1},
+        {"name": "Python", "applications": 1},
+        {"name": "Spring Boot", "applications": 1},
+    ]
+    assert technologies.co_occurrence(db, user.id, "kotlin") == [
+        {"name": "Postgres", "applications": 2},
+        {"name": "Ktor", "applications": 1},
+        {"name": "Spring Boot", "applications": 1},
+    ]
+    assert technologies.co_occurrence(db, user.id, "Rust") == []
@@ -1,5 +1,8 @@
-from datetime import date
-from app.core.working_days import _is_off_day, streak_is_unbroken
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+from app.core.working_days import OffDayCalendar, _CalendarCache, berlin_today, streak_is_unbroken, streak_runs
 
 # Mondays in 2026 for easy reference
 MON = date(2026, 4, 27)
@@ -11,42 +14,152 @@ SAT = date(2026, 4, 25)
 SUN = date(2026, 4, 26)
 
 
-# --- _is_off_day ---
+# --- is_off_day ---
 
 def test_saturday_is_off():
-    assert _is_off_day(SAT, set()) is True
+    assert OffDayCalendar(set()).is_off_day(SAT) is True
 
 def test_sunday_is_off():
-    assert _is_off_day(SUN, set()) is True
+    assert OffDayCalendar(set()).is_off_day(SUN) is True
 
 def test_monday_is_working():
-    assert _is_off_day(MON, set()) is False
+    assert OffDayCalendar(set()).is_off_day(MON) is False
 
 def test_holiday_is_off():
-    assert _is_off_day(MON, {MON}) is True
+    assert OffDayCalendar({MON}).is_off_day(MON) is True
 
 
 # --- streak_is_unbroken ---
 
 def test_consecutive_days_unbroken():
-    assert streak_is_unbroken(TUE, WED, set()) is True
+    assert streak_is_unbroken(TUE, WED, OffDayCalendar(set())) is True
 
 def test_friday_to_monday_unbroken():
     # Saturday and Sunday are weekends — no working day missed
-    assert streak_is_unbroken(FRI, MON, set()) is True
+    assert streak_is_unbroken(FRI, MON, OffDayCalendar(set())) is True
 
 def test_two_weekday_gap_broken():
     # Monday → Wednesday: Tuesday is a working day in between
-    assert streak_is_unbroken(MON, WED, set()) is False
+    assert streak_is_unbroken(MON, WED, OffDayCalendar(set())) is False
 
 def test_holiday_fills_gap():
     # Monday → Wednesday: Tuesday is a holiday → unbroken
-    assert streak_is_unbroken(MON, WED, {TUE}) is True
+    assert streak_is_unbroken(MON, WED, OffDayCalendar({TUE})) is True
 
 def test_leave_fills_gap():
     # Thursday → Monday: Friday is a leave, Sat/Sun are weekend → unbroken
-    assert streak_is_unbroken(THU, MON, {FRI}) is True
+    assert streak_is_unbroken(THU, MON, OffDayCalendar({FRI})) is True
 
 def test_partial_holiday_still_broken():
     # Monday → Thursday: Tuesday is holiday, Wednesday is not → broken
-    assert streak_is_unbroken(MON, THU, {TUE}) is False
+    assert streak_is_unbroken(MON, THU, OffDayCalendar({TUE})) is False
+
+
+# --- OffDayCalendar ---
+
+def test_calendar_membership_matches_set():
+    days = {date(2024, 2, 29), date(2024, 12, 31), date(2026, 1, 1), TUE}
+    cal = OffDayCalendar(days)
+    assert len(cal) == 4
+    for d in days:
+        assert d in cal
+    assert date(2024, 3, 1) not in cal
+    assert date(2025, 1, 1) not in cal
+
+
+def test_calendar_counts_match_day_by_day_walk():
+    off = {date(2026, 4, 3), date(2026, 4, 6), date(2026, 5, 1), date(2026, 5, 2)}  # May 2 is a Saturday
+    cal = OffDayCalendar(off)
+    start = date(2026, 3, 25)
+    for span in range(0, 50):
+        for offset in range(0, 10):
+            a = start + timedelta(days=offset)
+            b = a + timedelta(days=span)
+            expected = sum(
+                1 for i in range(1, span)
+                if (a + timedelta(days=i)).weekday() < 5 and a + timedelta(days=i) not in off
+            )
+            assert cal.working_days_between(a, b) == expected
+
+
+def test_calendar_counts_outside_data_years():
+    cal = OffDayCalendar({date(2026, 12, 24)})
+    # Two full weeks in 2025 and 2027, both outside the indexed span
+    assert cal.working_days_between(date(2025, 3, 2), date(2025, 3, 16)) == 10
+    assert cal.working_days_between(date(2027, 3, 7), date(2027, 3, 21)) == 10
+    # Spanning the indexed year: 2026 has 261 weekdays, one of them off
+    assert cal.working_days_between(date(2025, 12, 31), date(2027, 1, 1)) == 260
+
+
+def test_is_off_day_covers_weekends_and_off_days():
+    cal = OffDayCalendar({MON})
+    assert cal.is_off_day(MON) is True
+    assert cal.is_off_day(SAT) is True
+    assert cal.is_off_day(TUE) is False
+
+
+def test_working_days_before_differences_count_ranges():
+    cal = OffDayCalendar({TUE})
+    # Mon 27 and Wed 29 are working days, Tue 28 is off
+    assert cal.working_days_before(THU) - cal.working_days_before(MON) == 2
+    assert cal.working_days_before(THU) - cal.working_days_before(MON) == cal.working_days_between(SUN, THU)
+    # Far outside the indexed year
+    assert cal.working_days_before(date(1, 1, 8)) == 5
+
+
+# --- _CalendarCache ---
+
+def test_cache_reuses_calendar_until_file_changes(tmp_path):
+    leaves = tmp_path / "leaves.json"
+    leaves.write_text(json.dumps(["2026-04-28"]))
+    cache = _CalendarCache([leaves, tmp_path / "missing.json"], stat_interval=0)
+
+    first = cache.get()
+    assert TUE in first
+    assert cache.get() is first
+
+    leaves.write_text(json.dumps([{"date": "2026-04-29", "enabled": True}]))
+    stat = leaves.stat()
+    os.utime(leaves, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = cache.get()
+    assert second is not first
+    assert WED in second
+    assert TUE not in second
+
+
+def test_cache_skips_stat_within_interval(tmp_path):
+    leaves = tmp_path / "leaves.json"
+    leaves.write_text("[]")
+    cache = _CalendarCache([leaves], stat_interval=3600)
+    first = cache.get()
+    leaves.write_text(json.dumps(["2026-04-28"]))
+    assert cache.get() is first
+
+
+# --- streak_runs ---
+
+def test_streak_runs_matches_pairwise_check():
+    off = OffDayCalendar({date(2026, 4, 3), date(2026, 4, 6)})
+    dates = [
+        date(2026, 3, 30), date(2026, 3, 31), date(2026, 4, 2), date(2026, 4, 7),
+        date(2026, 4, 8), date(2026, 4, 10), date(2026, 4, 13), date(2026, 4, 15),
+    ]
+    expected = [1]
+    for prev, cur in zip(dates, dates[1:]):
+        expected.append(expected[-1] + 1 if streak_is_unbroken(prev, cur, off) else 1)
+    assert streak_runs(dates, off) == expected
+    assert streak_runs(dates, off) == [1, 2, 1, 2, 3, 1, 2, 1]
+
+
+def test_streak_runs_empty():
+    assert streak_runs([], OffDayCalendar(set())) == []
+
+
+# --- berlin_today ---
+
+def test_berlin_today_rolls_over_before_utc():
+    late_utc = datetime(2026, 4, 29, 22, 30, tzinfo=timezone.utc)  # 00:30 on Thursday in Berlin
+    with patch("app.core.working_days.datetime") as mock_dt:
+        mock_dt.now.side_effect = late_utc.astimezone
+        assert berlin_today() == THU
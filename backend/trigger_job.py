@@ -6,8 +6,8 @@ Usage:
 
 Available jobs:
     daily-reminder    8 PM daily reminder
-    streak-check      Midnight streak check (notifies mentors)
-    weekly-summary    Sunday weekly summary to mentors
+    streak-check      Midnight streak check (notifies the owner's mentors)
+    weekly-summary    Sunday weekly summary to each user (and the owner's mentors)
     followup-digest   Morning followup digest (apps needing action)
     test-email        Send a sample followup digest with dummy data
 """
@@ -24,6 +24,12 @@ JOBS = {
 }
 
 
+def _flush_outbox():
+    # No API process may be running to drain the queue, so send from here
+    from app.core import outbox
+    outbox.flush()
+
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
@@ -32,8 +38,12 @@ def main():
     job_name = sys.argv[1]
 
     if job_name == "test-email":
+        from app.core.config import settings
         from app.core.email import notify_followup_digest
+        from app.db.session import SessionLocal
+        db = SessionLocal()
         notify_followup_digest(
+            db,
             user_name="Test User",
             needs_followup=[
                 {"company": "Acme Corp", "position": "Software Engineer", "status": "Applied", "days_stale": 10},
@@ -42,7 +52,11 @@ def main():
             needs_decision=[
                 {"company": "Gamma LLC", "position": "Full Stack Dev", "followed_up_days_ago": 4},
             ],
+            email=settings.USER_EMAIL,
         )
+        db.commit()
+        db.close()
+        _flush_outbox()
         print("Done.")
         return
 
@@ -55,6 +69,7 @@ def main():
     from app.core import scheduler as sched
     fn = getattr(sched, fn_name)
     fn()
+    _flush_outbox()
     print("Done.")
 
 
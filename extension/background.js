@@ -62,7 +62,7 @@ async function handleSaveJob(payload) {
   };
 
   try {
-    const resp = await fetch(`${stored.apiBaseUrl}/api/v1/applications/`, {
+    const resp = await fetch(`${stored.apiBaseUrl}/api/v1/applications/?check_similar=true`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -74,6 +74,11 @@ async function handleSaveJob(payload) {
     if (resp.status === 401) {
       return { success: false, error: 'token_expired' };
     }
+    if (resp.status === 409) {
+      // Already captured (same posting URL, or same company and title)
+      const { detail } = await resp.json();
+      return { success: false, error: 'duplicate', existing: detail.application };
+    }
     if (!resp.ok) {
       let detail = `HTTP ${resp.status}`;
       try { detail = (await resp.json()).detail || detail; } catch (_) {}
@@ -8,11 +8,17 @@ function extractLinkedIn() {
 
   if (!jobTitle) return null;
 
+  // Search and collection views show the selected job as ?currentJobId=…;
+  // store the job's own page so the URL identifies one posting
+  const url = new URL(window.location.href);
+  const jobId = url.searchParams.get('currentJobId') || (url.pathname.match(/\/jobs\/view\/(?:[^/]*-)?(\d+)/) || [])[1];
+  const jobUrl = jobId ? `${url.origin}/jobs/view/${jobId}/` : `${url.origin}${url.pathname}`;
+
   return {
     jobTitle,
     companyName,
     location: '',
-    jobUrl: window.location.href.split('?')[0],
+    jobUrl,
     easyApply: false,
     jobBoardSource: 'LinkedIn',
   };
@@ -89,6 +89,9 @@ $('jobForm').addEventListener('submit', async (e) => {
     showView('viewUnauthenticated');
   } else if (result.error === 'token_expired') {
     showError('Session expired. Please reconnect in Settings.');
+  } else if (result.error === 'duplicate') {
+    const existing = result.existing;
+    showError(`Already saved: ${existing.company_name} – ${existing.position_title} (${existing.status}).`);
   } else {
     showError(result.error || 'An error occurred. Please try again.');
   }
@@ -1,39 +1,22 @@
 import React, { useMemo } from 'react';
 import { TrendingUp, AlertTriangle } from 'lucide-react';
-import { JobApplication } from '../../types';
+import { AnalyticsSummary } from '../../types';
 
 interface ApplicationFunnelChartProps {
-  applications: JobApplication[];
+  summary: AnalyticsSummary;
 }
 
-const ApplicationFunnelChart: React.FC<ApplicationFunnelChartProps> = ({ applications }) => {
+const ApplicationFunnelChart: React.FC<ApplicationFunnelChartProps> = ({ summary }) => {
   const funnelData = useMemo(() => {
-    // Calculate comprehensive funnel data including drop-offs
-    const totalApplied = applications.length;
-
-    // Applications that received any response
-    const responded = applications.filter(app =>
-      !['Applied', 'Ghosted'].includes(app.status)
-    ).length;
-
-    // Applications that reached interview stages
-    const interviewed = applications.filter(app =>
-      ['Phone Screen', 'Technical Round 1', 'Technical Round 2', 'Final Round'].includes(app.status)
-    ).length;
-
-    // Applications that reached final rounds
-    const finalRound = applications.filter(app =>
-      app.status === 'Final Round'
-    ).length;
-
-    // Applications that received offers
-    const offers = applications.filter(app =>
-      app.status === 'Offer'
-    ).length;
-
-    // Calculate drop-offs at each stage
-    const ghosted = applications.filter(app => app.status === 'Ghosted').length;
-    const rejected = applications.filter(app => app.status === 'Rejected').length;
+    const {
+      total: totalApplied,
+      responded,
+      interviewed,
+      finalRound,
+      offers,
+      ghosted,
+      rejected,
+    } = summary;
 
     // Calculate rates
     const responseRate = totalApplied > 0 ? Math.round((responded / totalApplied) * 100) : 0;
@@ -85,7 +68,7 @@ const ApplicationFunnelChart: React.FC<ApplicationFunnelChartProps> = ({ applica
         totalDropOffs: ghosted + rejected
       }
     };
-  }, [applications]);
+  }, [summary]);
 
   const maxCount = Math.max(...funnelData.stages.map(s => s.count));
 
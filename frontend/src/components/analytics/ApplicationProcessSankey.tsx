@@ -1,9 +1,9 @@
 import React, { useMemo } from 'react';
 import { ResponsiveContainer, Sankey, Tooltip, Layer, Rectangle } from 'recharts';
-import { JobApplication } from '../../types';
+import { TransitionData } from '../../types';
 
 interface ApplicationProcessSankeyProps {
-    applications: JobApplication[];
+    transitions: TransitionData;
 }
 
 // Custom Link component for colored Sankey links
@@ -71,31 +71,15 @@ const CustomNode = (props: any) => {
     );
 };
 
-const ApplicationProcessSankey: React.FC<ApplicationProcessSankeyProps> = ({ applications }) => {
+const ApplicationProcessSankey: React.FC<ApplicationProcessSankeyProps> = ({ transitions }) => {
     const data = useMemo(() => {
         const nodesSet = new Set<string>();
-        const linksMap = new Map<string, number>();
-
-        applications.forEach(app => {
-            if (!app.history || app.history.length === 0) {
-                nodesSet.add('Applied');
-                return;
-            }
-
-            const sortedHistory = [...app.history].sort(
-                (a, b) => new Date(a.changedAt).getTime() - new Date(b.changedAt).getTime()
-            );
-
-            sortedHistory.forEach((record) => {
-                const source = record.oldStatus || 'Applied';
-                const target = record.newStatus;
-
-                nodesSet.add(source);
-                nodesSet.add(target);
-
-                const key = `${source}|${target}`;
-                linksMap.set(key, (linksMap.get(key) || 0) + 1);
-            });
+        if (transitions.untracked > 0) {
+            nodesSet.add('Applied');
+        }
+        transitions.links.forEach(link => {
+            nodesSet.add(link.source);
+            nodesSet.add(link.target);
         });
 
         const statusOrder: Record<string, number> = {
@@ -135,8 +119,7 @@ const ApplicationProcessSankey: React.FC<ApplicationProcessSankeyProps> = ({ app
             return '#94A3B8'; // Default slate
         };
 
-        const links = Array.from(linksMap.entries()).map(([key, value]) => {
-            const [sourceName, targetName] = key.split('|');
+        const links = transitions.links.map(({ source: sourceName, target: targetName, count: value }) => {
             const sourceIndex = nodes.findIndex(n => n.name === sourceName);
             const targetIndex = nodes.findIndex(n => n.name === targetName);
 
@@ -151,7 +134,7 @@ const ApplicationProcessSankey: React.FC<ApplicationProcessSankeyProps> = ({ app
         }).filter(link => link.source !== -1 && link.target !== -1);
 
         return { nodes, links };
-    }, [applications]);
+    }, [transitions]);
 
     if (data.nodes.length === 0 || data.links.length === 0) {
         return (
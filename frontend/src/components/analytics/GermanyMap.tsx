@@ -2,7 +2,7 @@ import React, { useMemo, useState, useEffect } from 'react';
 import { MapPin, Info, Loader2 } from 'lucide-react';
 import { MapContainer, TileLayer, Marker, Popup } from 'react-leaflet';
 import L from 'leaflet';
-import { JobApplication, ApplicationStatus } from '../../types';
+import { LocationEntry } from '../../types';
 import 'leaflet/dist/leaflet.css';
 
 // Fix for default markers in react-leaflet
@@ -14,13 +14,13 @@ L.Icon.Default.mergeOptions({
 });
 
 interface GermanyMapProps {
-  applications: JobApplication[];
+  locations: LocationEntry[];
 }
 
 interface LocationData {
   name: string;
   coordinates: [number, number];
-  applications: JobApplication[];
+  statusCounts: Record<string, number>;
   count: number;
   geocoded: boolean;
 }
@@ -104,14 +104,9 @@ const StatusMarker: React.FC<{
   location: LocationData;
 }> = ({ position, location }) => {
   // Get status color based on most common status
-  const getStatusColor = (applications: JobApplication[]) => {
-    const statusCounts = applications.reduce((acc, app) => {
-      acc[app.status] = (acc[app.status] || 0) + 1;
-      return acc;
-    }, {} as Record<ApplicationStatus, number>);
-
+  const getStatusColor = (statusCounts: Record<string, number>) => {
     const topStatus = Object.entries(statusCounts)
-      .sort(([,a], [,b]) => b - a)[0]?.[0] as ApplicationStatus;
+      .sort(([,a], [,b]) => b - a)[0]?.[0];
 
     switch (topStatus) {
       case 'Offer': return '#10B981'; // green
@@ -127,7 +122,7 @@ const StatusMarker: React.FC<{
     }
   };
 
-  const color = getStatusColor(location.applications);
+  const color = getStatusColor(location.statusCounts);
 
   // Create custom icon
   const customIcon = L.divIcon({
@@ -175,12 +170,7 @@ const StatusMarker: React.FC<{
             </div>
 
             {/* Status breakdown */}
-            {Object.entries(
-              location.applications.reduce((acc, app) => {
-                acc[app.status] = (acc[app.status] || 0) + 1;
-                return acc;
-              }, {} as Record<ApplicationStatus, number>)
-            ).map(([status, count]) => (
+            {Object.entries(location.statusCounts).map(([status, count]) => (
               <div key={status} className="flex justify-between text-xs">
                 <span className="text-gray-500">{status}:</span>
                 <span>{count}</span>
@@ -193,7 +183,7 @@ const StatusMarker: React.FC<{
   );
 };
 
-const GermanyMap: React.FC<GermanyMapProps> = ({ applications }) => {
+const GermanyMap: React.FC<GermanyMapProps> = ({ locations: entries }) => {
   const [locations, setLocations] = useState<LocationData[]>([]);
   const [loading, setLoading] = useState(true);
 
@@ -202,31 +192,20 @@ const GermanyMap: React.FC<GermanyMapProps> = ({ applications }) => {
     loadCachedCoordinates();
   }, []);
 
-  // Process applications and geocode locations
+  // Geocode the per-location counts
   useEffect(() => {
     const processLocations = async () => {
       setLoading(true);
 
-      // Group applications by location
-      const locationGroups = applications.reduce((acc, app) => {
-        const location = app.location.trim();
-        if (!acc[location]) {
-          acc[location] = [];
-        }
-        acc[location].push(app);
-        return acc;
-      }, {} as Record<string, JobApplication[]>);
-
-      // Geocode each location
-      const locationPromises = Object.entries(locationGroups).map(async ([locationName, apps]) => {
-        const coordinates = await geocodeLocation(locationName);
+      const locationPromises = entries.map(async (entry) => {
+        const coordinates = await geocodeLocation(entry.key);
 
         if (coordinates) {
           return {
-            name: locationName,
+            name: entry.key,
             coordinates,
-            applications: apps,
-            count: apps.length,
+            statusCounts: entry.statusCounts,
+            count: entry.applications,
             geocoded: true
           } as LocationData;
         }
@@ -242,21 +221,19 @@ const GermanyMap: React.FC<GermanyMapProps> = ({ applications }) => {
       setLoading(false);
     };
 
-    if (applications.length > 0) {
+    if (entries.length > 0) {
       processLocations();
     } else {
       setLocations([]);
       setLoading(false);
     }
-  }, [applications]);
+  }, [entries]);
 
   // Calculate statistics
   const stats = useMemo(() => {
     const totalCities = locations.length;
     const totalApplications = locations.reduce((sum, loc) => sum + loc.count, 0);
-    const citiesWithOffers = locations.filter(loc =>
-      loc.applications.some(app => app.status === 'Offer')
-    ).length;
+    const citiesWithOffers = locations.filter(loc => (loc.statusCounts['Offer'] || 0) > 0).length;
     const mostActiveCity = locations.reduce((max, loc) =>
       loc.count > max.count ? loc : max,
       locations[0] || { name: 'N/A', count: 0 }
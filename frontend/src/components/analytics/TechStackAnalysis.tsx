@@ -1,44 +1,19 @@
 import React, { useMemo } from 'react';
 import { BarChart3 } from 'lucide-react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
-import { JobApplication } from '../../types';
+import { TopEntry } from '../../types';
 
 interface TechStackAnalysisProps {
-  applications: JobApplication[];
+  technologies: TopEntry[];
 }
 
-const TechStackAnalysis: React.FC<TechStackAnalysisProps> = ({ applications }) => {
-  const techData = useMemo(() => {
-    const techMap = new Map<string, { count: number; offers: number }>();
-
-    applications.forEach(app => {
-      if (app.techStack) {
-        // Split tech stack by common separators and clean up
-        const techs = app.techStack.split(/[,/&+]+/).map(tech => tech.trim());
-
-        techs.forEach(tech => {
-          if (tech && tech.length > 1) { // Filter out empty/short strings
-            const existing = techMap.get(tech) || { count: 0, offers: 0 };
-            existing.count++;
-            if (app.status === 'Offer') {
-              existing.offers++;
-            }
-            techMap.set(tech, existing);
-          }
-        });
-      }
-    });
-
-    return Array.from(techMap.entries())
-      .map(([tech, data]) => ({
-        tech,
-        count: data.count,
-        offers: data.offers,
-        successRate: data.count > 0 ? Math.round((data.offers / data.count) * 100) : 0
-      }))
-      .sort((a, b) => b.count - a.count)
-      .slice(0, 12); // Top 12 technologies
-  }, [applications]);
+const TechStackAnalysis: React.FC<TechStackAnalysisProps> = ({ technologies }) => {
+  const techData = useMemo(() => technologies.map(entry => ({
+    tech: entry.key,
+    count: entry.applications,
+    offers: entry.offers,
+    successRate: entry.applications > 0 ? Math.round((entry.offers / entry.applications) * 100) : 0
+  })), [technologies]);
 
   const colors = [
     '#3B82F6', '#EF4444', '#10B981', '#F59E0B', '#8B5CF6',
@@ -1,6 +1,8 @@
-import React, { useState, useMemo } from 'react';
-import { ApplicationStatus } from '../types';
+import React, { useState, useMemo, useEffect } from 'react';
+import { AnalyticsSummary, IndustryEntry, LocationEntry, TimelineWeek, TopEntry, TransitionData } from '../types';
 import { useAppContext } from '../context/AppContext';
+import { analyticsService } from '../services/api';
+import { industries, locations, summarize, topTechnologies, transitions, weeklyTimeline } from '../utils/analytics';
 import {
   Filter,
   Download
@@ -14,45 +16,84 @@ import TechStackAnalysis from '../components/analytics/TechStackAnalysis';
 import GermanyMap from '../components/analytics/GermanyMap';
 import ApplicationProcessSankey from '../components/analytics/ApplicationProcessSankey';
 
+interface AnalyticsData {
+  summary: AnalyticsSummary;
+  transitions: TransitionData;
+  timeline: TimelineWeek[];
+  technologies: TopEntry[];
+  industries: IndustryEntry[];
+  locations: LocationEntry[];
+}
 
 const Analytics: React.FC = () => {
-  const { applications, loading } = useAppContext();
+  const { user, applications, loading, isMentorView } = useAppContext();
+  const dataVersion = user?.dataVersion;
   const [dateRange, setDateRange] = useState<'30d' | '90d' | '6m' | 'all'>('all');
+  const [serverData, setServerData] = useState<AnalyticsData | null>(null);
+  const [serverFailed, setServerFailed] = useState(false);
 
-  // Filter applications by date range
-  const filteredApplications = useMemo(() => {
-    if (dateRange === 'all') return applications;
+  // First applied date in range (YYYY-MM-DD), undefined for all time
+  const since = useMemo(() => {
+    if (dateRange === 'all') return undefined;
 
-    const now = new Date();
     const cutoffDate = new Date();
-
     switch (dateRange) {
       case '30d':
-        cutoffDate.setDate(now.getDate() - 30);
+        cutoffDate.setDate(cutoffDate.getDate() - 30);
         break;
       case '90d':
-        cutoffDate.setDate(now.getDate() - 90);
+        cutoffDate.setDate(cutoffDate.getDate() - 90);
         break;
       case '6m':
-        cutoffDate.setMonth(now.getMonth() - 6);
+        cutoffDate.setMonth(cutoffDate.getMonth() - 6);
         break;
     }
-
-    return applications.filter(app => new Date(app.createdAt) >= cutoffDate);
-  }, [applications, dateRange]);
+    return `${cutoffDate.getFullYear()}-${String(cutoffDate.getMonth() + 1).padStart(2, '0')}-${String(cutoffDate.getDate()).padStart(2, '0')}`;
+  }, [dateRange]);
+
+  // Aggregates come from the server; refetched when the user's data version changes
+  useEffect(() => {
+    if (isMentorView) return;
+    let cancelled = false;
+    Promise.all([
+      analyticsService.getSummary(since),
+      analyticsService.getTransitions(since),
+      analyticsService.getTimeline(),
+      analyticsService.getTop('tech', 12, since),
+      analyticsService.getIndustries(since),
+      analyticsService.getLocations(since),
+    ])
+      .then(([summary, transitions, timeline, technologies, industries, locations]) => {
+        if (cancelled) return;
+        setServerData({ summary, transitions, timeline, technologies, industries, locations });
+        setServerFailed(false);
+      })
+      .catch(() => {
+        if (!cancelled) setServerFailed(true);
+      });
+    return () => { cancelled = true; };
+  }, [dataVersion, since, isMentorView]);
+
+  // The shared mentor view has no API session, so it aggregates the loaded snapshot
+  const data = useMemo((): AnalyticsData | null => {
+    if (!isMentorView && !serverFailed) return serverData;
+    const inRange = since
+      ? applications.filter(app => app.appliedDate.split('T')[0] >= since)
+      : applications;
+    return {
+      summary: summarize(inRange),
+      transitions: transitions(inRange),
+      timeline: weeklyTimeline(applications),
+      technologies: topTechnologies(inRange),
+      industries: industries(inRange),
+      locations: locations(inRange),
+    };
+  }, [isMentorView, serverFailed, serverData, applications, since]);
 
   // Calculate key metrics
   const metrics = useMemo(() => {
-    const total = filteredApplications.length;
-    const responded = filteredApplications.filter(app =>
-      !['Applied', 'Ghosted'].includes(app.status)
-    ).length;
-    const interviewed = filteredApplications.filter(app =>
-      ['Phone Screen', 'Technical Round 1', 'Technical Round 2', 'Final Round'].includes(app.status)
-    ).length;
-    const rejected = filteredApplications.filter(app => app.status === 'Rejected').length;
-    const ghosted = filteredApplications.filter(app => app.status === 'Ghosted').length;
-    const easyApplied = filteredApplications.filter(app => app.easyApply).length;
+    if (!data) return null;
+    const { total, responded, interviewed, rejected, ghosted, easyApplied } = data.summary;
 
     return {
       total,
@@ -65,108 +106,31 @@ const Analytics: React.FC = () => {
       interviewRate: total > 0 ? Math.round((interviewed / total) * 100) : 0,
       easyApplyRate: total > 0 ? Math.round((easyApplied / total) * 100) : 0,
     };
-  }, [filteredApplications]);
+  }, [data]);
 
   // Status distribution data for pie chart
   const statusData = useMemo(() => {
-    const statusCounts = filteredApplications.reduce((acc, app) => {
-      acc[app.status] = (acc[app.status] || 0) + 1;
-      return acc;
-    }, {} as Record<ApplicationStatus, number>);
+    if (!data) return [];
+    const { statusCounts, total } = data.summary;
 
     return Object.entries(statusCounts).map(([status, count]) => ({
       name: status,
       value: count,
-      percentage: Math.round((count / filteredApplications.length) * 100)
+      percentage: total > 0 ? Math.round((count / total) * 100) : 0
     }));
-  }, [filteredApplications]);
+  }, [data]);
 
-
-  // Applications over time data - show last 6 months for better data visibility
+  // Applications per week over the last 26 weeks
   const timelineData = useMemo(() => {
-    const last6Months = Array.from({ length: 6 }, (_, i) => {
-      const date = new Date();
-      date.setMonth(date.getMonth() - (5 - i));
-      return {
-        year: date.getFullYear(),
-        month: date.getMonth(),
-        label: date.toLocaleDateString('en-US', { year: 'numeric', month: 'short' }),
-        startDate: new Date(date.getFullYear(), date.getMonth(), 1).toISOString().split('T')[0],
-        endDate: new Date(date.getFullYear(), date.getMonth() + 1, 0).toISOString().split('T')[0]
-      };
-    });
-
-    return last6Months.map(month => {
-      const monthApps = filteredApplications.filter(app => {
-        const appDate = app.createdAt.split('T')[0];
-        return appDate >= month.startDate && appDate <= month.endDate;
-      });
-      return {
-        date: month.label,
-        applications: monthApps.length,
-        responded: monthApps.filter(app => !['Applied', 'Ghosted'].includes(app.status)).length
-      };
-    });
-  }, [filteredApplications]);
-
-  // Industry analysis - more meaningful than individual companies
-  const industryData = useMemo(() => {
-    // Categorize companies by industry
-    const industryMap: Record<string, { companies: Set<string>, total: number, responded: number, offers: number }> = {};
-
-    filteredApplications.forEach(app => {
-      let industry = 'Other';
-
-      // Simple industry categorization based on company names
-      const company = app.companyName.toLowerCase();
-      if (company.includes('sap') || company.includes('siemens') || company.includes('bosch') || company.includes('continental') || company.includes('infineon')) {
-        industry = 'Industrial/Tech';
-      } else if (company.includes('bank') || company.includes('finance') || company.includes('kpmg') || company.includes('deloitte') || company.includes('n26') || company.includes('traderepublic')) {
-        industry = 'Finance/Fintech';
-      } else if (company.includes('telekom') || company.includes('telecom') || company.includes('deutsche telekom') || company.includes('t-systems')) {
-        industry = 'Telecommunications';
-      } else if (company.includes('bmw') || company.includes('vw') || company.includes('volkswagen') || company.includes('porsche') || company.includes('audi') || company.includes('zf') || company.includes('man')) {
-        industry = 'Automotive';
-      } else if (company.includes('zalando') || company.includes('henkel') || company.includes('basf') || company.includes('merck') || company.includes('edeka')) {
-        industry = 'Consumer/Chemical';
-      } else if (company.includes('startup') || company.includes('gorillas') || company.includes('tier') || company.includes('hellofresh') || company.includes('researchgate')) {
-        industry = 'E-commerce/Startup';
-      } else if (company.includes('healthcare') || company.includes('roche') || company.includes('fresenius') || company.includes('fraport')) {
-        industry = 'Healthcare/Logistics';
-      } else if (company.includes('lufthansa') || company.includes('dhl') || company.includes('flixbus')) {
-        industry = 'Transportation';
-      } else if (company.includes('consulting') || company.includes('accenture') || company.includes('capgemini')) {
-        industry = 'Consulting';
-      }
-
-      if (!industryMap[industry]) {
-        industryMap[industry] = { companies: new Set(), total: 0, responded: 0, offers: 0 };
-      }
-
-      industryMap[industry].companies.add(app.companyName);
-      industryMap[industry].total++;
-      if (!['Applied', 'Ghosted'].includes(app.status)) {
-        industryMap[industry].responded++;
-      }
-      if (app.status === 'Offer') {
-        industryMap[industry].offers++;
-      }
-    });
-
-    return Object.entries(industryMap)
-      .map(([industry, data]) => ({
-        industry,
-        companies: data.companies.size,
-        applications: data.total,
-        responded: data.responded,
-        offers: data.offers,
-        responseRate: data.total > 0 ? Math.round((data.responded / data.total) * 100) : 0,
-        offerRate: data.total > 0 ? Math.round((data.offers / data.total) * 100) : 0
-      }))
-      .sort((a, b) => b.applications - a.applications);
-  }, [filteredApplications]);
-
-  if (loading) {
+    if (!data) return [];
+    return data.timeline.map(week => ({
+      date: new Date(`${week.weekStart}T00:00:00`).toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
+      applications: week.applications,
+      responded: week.responded
+    }));
+  }, [data]);
+
+  if (loading || !data || !metrics) {
     return <div className="p-8 text-center text-gray-500">Loading analytics...</div>;
   }
 
@@ -206,7 +170,7 @@ const Analytics: React.FC = () => {
       <KeyMetricsCards metrics={metrics} />
 
       {/* Application Flow Sankey Chart */}
-      <ApplicationProcessSankey applications={filteredApplications} />
+      <ApplicationProcessSankey transitions={data.transitions} />
 
       {/* Charts Grid */}
       <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
@@ -217,24 +181,24 @@ const Analytics: React.FC = () => {
         <ApplicationsTimelineChart timelineData={timelineData} />
 
         {/* Industry Analysis */}
-        <TopCompaniesAnalysis companyData={industryData.map(ind => ({
-          company: ind.industry,
+        <TopCompaniesAnalysis companyData={data.industries.map(ind => ({
+          company: ind.key,
           applications: ind.applications,
           offers: ind.offers,
-          successRate: ind.responseRate
+          successRate: ind.applications > 0 ? Math.round((ind.responded / ind.applications) * 100) : 0
         }))} />
 
         {/* Application Funnel */}
-        <ApplicationFunnelChart applications={filteredApplications} />
+        <ApplicationFunnelChart summary={data.summary} />
       </div>
 
       {/* Tech Stack Analysis & Germany Map */}
       <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
         {/* Tech Stack Analysis */}
-        <TechStackAnalysis applications={filteredApplications} />
+        <TechStackAnalysis technologies={data.technologies} />
 
         {/* Germany Map */}
-        <GermanyMap applications={filteredApplications} />
+        <GermanyMap locations={data.locations} />
       </div>
     </div>
   );
@@ -44,7 +44,7 @@ const Applications: React.FC = () => {
       const detail = error?.response?.data?.detail;
       const message = Array.isArray(detail)
         ? detail.map((e: any) => `${e.loc?.slice(-1)[0]}: ${e.msg}`).join('; ')
-        : detail || "Failed to create application. Please try again.";
+        : detail?.message || detail || "Failed to create application. Please try again.";
       toast.error(message);
     }
   };
@@ -87,7 +87,7 @@ const Applications: React.FC = () => {
         const detail = error?.response?.data?.detail;
         const message = Array.isArray(detail)
           ? detail.map((e: any) => `${e.loc?.slice(-1)[0]}: ${e.msg}`).join('; ')
-          : detail || "Failed to update application. Please try again.";
+          : detail?.message || detail || "Failed to update application. Please try again.";
         toast.error(message);
       }
     }
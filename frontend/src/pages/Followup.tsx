@@ -1,8 +1,8 @@
-import React, { useMemo, useState } from 'react';
+import React, { useEffect, useMemo, useState } from 'react';
 import { Bell, Clock, AlertCircle, CheckCircle2, ChevronRight } from 'lucide-react';
 import toast from 'react-hot-toast';
 import { useAppContext } from '../context/AppContext';
-import { applicationService, userService } from '../services/api';
+import { applicationService, userService, FollowupQueue } from '../services/api';
 import { ApplicationStatus } from '../types';
 import { classifyApp, daysSince, NEXT_STAGE } from '../utils/followup';
 
@@ -21,12 +21,26 @@ const FollowupPage: React.FC = () => {
   const { applications, setApplications, setUser, isMentorView } = useAppContext();
   const [loadingIds, setLoadingIds] = useState<Set<string>>(new Set());
 
+  const [queue, setQueue] = useState<FollowupQueue | null>(null);
+
+  // The server returns only actionable applications; refetch whenever the loaded list changes
+  useEffect(() => {
+    if (isMentorView) return;
+    let cancelled = false;
+    applicationService.getFollowupQueue()
+      .then(result => { if (!cancelled) setQueue(result); })
+      .catch(() => { if (!cancelled) setQueue(null); });
+    return () => { cancelled = true; };
+  }, [applications, isMentorView]);
+
   const { needsFollowup, awaitingResponse, needsDecision } = useMemo(() => {
+    // The shared mentor view has no API session, so it classifies the loaded snapshot
+    if (!isMentorView && queue) return queue;
     const needsFollowup = applications.filter(a => classifyApp(a) === 'needs_followup');
     const awaitingResponse = applications.filter(a => classifyApp(a) === 'awaiting_response');
     const needsDecision = applications.filter(a => classifyApp(a) === 'needs_decision');
     return { needsFollowup, awaitingResponse, needsDecision };
-  }, [applications]);
+  }, [applications, isMentorView, queue]);
 
   const setLoading = (id: string, loading: boolean) => {
     setLoadingIds(prev => {
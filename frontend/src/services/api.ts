@@ -1,5 +1,17 @@
 import axios from 'axios';
-import { User, JobApplication, NetworkContact, ApplicationStatus } from '../types';
+import {
+    User,
+    JobApplication,
+    NetworkContact,
+    ApplicationStatus,
+    AnalyticsSummary,
+    TransitionData,
+    TimelineWeek,
+    TopEntry,
+    IndustryEntry,
+    LocationEntry,
+    SearchHit,
+} from '../types';
 
 const API_URL = '/api/v1';
 
@@ -35,6 +47,7 @@ const transformUser = (data: any): User => ({
     currentStreak: data.current_streak,
     longestStreak: data.longest_streak,
     createdAt: data.created_at,
+    dataVersion: data.data_version,
 });
 
 const transformApplication = (data: any): JobApplication => ({
@@ -127,15 +140,34 @@ export const userService = {
     },
 };
 
+export interface FollowupQueue {
+    needsFollowup: JobApplication[];
+    awaitingResponse: JobApplication[];
+    needsDecision: JobApplication[];
+}
+
 export const applicationService = {
     getAll: async (): Promise<JobApplication[]> => {
-        const response = await apiClient.get('/applications/');
-        return response.data.map(transformApplication);
+        // Follow the keyset cursor until the server stops returning one
+        const applications: JobApplication[] = [];
+        let cursor: string | undefined;
+        do {
+            const response = await apiClient.get('/applications/', {
+                params: { limit: 500, cursor },
+            });
+            applications.push(...response.data.map(transformApplication));
+            cursor = response.headers['x-next-cursor'] || undefined;
+        } while (cursor);
+        return applications;
     },
     create: async (applicationData: Partial<JobApplication>): Promise<JobApplication> => {
         const response = await apiClient.post('/applications/', toSnakeCase(applicationData));
         return transformApplication(response.data);
     },
+    bulkCreate: async (applications: Partial<JobApplication>[]): Promise<{ created: number; ids: string[] }> => {
+        const response = await apiClient.post('/applications/bulk', applications.map(toSnakeCase));
+        return response.data;
+    },
     update: async (id: string, applicationData: Partial<JobApplication>): Promise<JobApplication> => {
         const response = await apiClient.put(`/applications/${id}`, toSnakeCase(applicationData));
         return transformApplication(response.data);
@@ -147,6 +179,14 @@ export const applicationService = {
         });
         return transformApplication(response.data);
     },
+    getFollowupQueue: async (): Promise<FollowupQueue> => {
+        const response = await apiClient.get('/applications/followup');
+        return {
+            needsFollowup: response.data.needs_followup.map(transformApplication),
+            awaitingResponse: response.data.awaiting_response.map(transformApplication),
+            needsDecision: response.data.needs_decision.map(transformApplication),
+        };
+    },
     markFollowedUp: async (id: string): Promise<JobApplication> => {
         const response = await apiClient.post(`/applications/${id}/followup`);
         return transformApplication(response.data);
@@ -186,6 +226,58 @@ export const shareService = {
     },
 };
 
+export const analyticsService = {
+    getSummary: async (since?: string): Promise<AnalyticsSummary> => {
+        const { data } = await apiClient.get('/analytics/summary', { params: { since } });
+        return {
+            total: data.total,
+            responded: data.responded,
+            interviewed: data.interviewed,
+            finalRound: data.final_round,
+            offers: data.offers,
+            rejected: data.rejected,
+            ghosted: data.ghosted,
+            easyApplied: data.easy_applied,
+            statusCounts: data.status_counts,
+        };
+    },
+    getTransitions: async (since?: string): Promise<TransitionData> => {
+        const response = await apiClient.get('/analytics/transitions', { params: { since } });
+        return response.data;
+    },
+    getTimeline: async (weeks = 26): Promise<TimelineWeek[]> => {
+        const response = await apiClient.get('/analytics/timeline', { params: { weeks } });
+        return response.data.map((w: any) => ({
+            weekStart: w.week_start,
+            applications: w.applications,
+            responded: w.responded,
+        }));
+    },
+    getTop: async (dimension: 'company' | 'source' | 'location' | 'tech', limit = 10, since?: string): Promise<TopEntry[]> => {
+        const response = await apiClient.get('/analytics/top', { params: { dimension, limit, since } });
+        return response.data;
+    },
+    getIndustries: async (since?: string): Promise<IndustryEntry[]> => {
+        const response = await apiClient.get('/analytics/industries', { params: { since } });
+        return response.data;
+    },
+    getLocations: async (since?: string): Promise<LocationEntry[]> => {
+        const { data } = await apiClient.get('/analytics/locations', { params: { since } });
+        return data.map((l: any) => ({
+            key: l.key,
+            applications: l.applications,
+            statusCounts: l.status_counts,
+        }));
+    },
+};
+
+export const searchService = {
+    search: async (q: string, kind?: SearchHit['kind'], limit = 10): Promise<SearchHit[]> => {
+        const response = await apiClient.get('/search/', { params: { q, kind, limit } });
+        return response.data;
+    },
+};
+
 // Unified API export
 export const api = {
     getUser: userService.getCurrentUser,
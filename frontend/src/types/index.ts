@@ -11,6 +11,7 @@ export interface User {
   currentStreak: number;
   longestStreak: number;
   createdAt: string;
+  dataVersion?: number; // changes whenever the user's data does
 }
 
 export interface JobApplication {
@@ -102,4 +103,59 @@ export interface Activity {
   pointsEarned: number;
   applicationId?: string;
   createdAt: string;
-}
\ No newline at end of file
+}
+// --- Analytics aggregates (GET /analytics/*, or computed locally in the mentor view) ---
+
+export interface AnalyticsSummary {
+  total: number;
+  responded: number;
+  interviewed: number;
+  finalRound: number;
+  offers: number;
+  rejected: number;
+  ghosted: number;
+  easyApplied: number;
+  statusCounts: Record<string, number>;
+}
+
+export interface TransitionLink {
+  source: string;
+  target: string;
+  count: number;
+}
+
+export interface TransitionData {
+  links: TransitionLink[];
+  untracked: number;
+}
+
+export interface TimelineWeek {
+  weekStart: string;
+  applications: number;
+  responded: number;
+}
+
+export interface TopEntry {
+  key: string;
+  applications: number;
+  responded: number;
+  offers: number;
+}
+
+export interface IndustryEntry extends TopEntry {
+  companies: number;
+}
+
+export interface LocationEntry {
+  key: string;
+  applications: number;
+  statusCounts: Record<string, number>;
+}
+
+export interface SearchHit {
+  kind: 'application' | 'contact';
+  id: string;
+  title: string;
+  subtitle?: string;
+  rank: number;
+}
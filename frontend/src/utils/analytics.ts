@@ -0,0 +1,145 @@
+import {
+  AnalyticsSummary,
+  IndustryEntry,
+  JobApplication,
+  LocationEntry,
+  TimelineWeek,
+  TopEntry,
+  TransitionData,
+} from '../types';
+
+// Local equivalents of app/core/analytics.py, for the mentor view, which has
+// the full snapshot but no API session.
+
+const NO_RESPONSE = ['Applied', 'Ghosted'];
+const INTERVIEW = ['Phone Screen', 'Technical Round 1', 'Technical Round 2', 'Final Round'];
+
+// Same order and keywords as INDUSTRIES in app/core/analytics.py
+const INDUSTRIES: [string, string[]][] = [
+  ['Industrial/Tech', ['sap', 'siemens', 'bosch', 'continental', 'infineon']],
+  ['Finance/Fintech', ['bank', 'finance', 'kpmg', 'deloitte', 'n26', 'traderepublic']],
+  ['Telecommunications', ['telekom', 'telecom', 't-systems']],
+  ['Automotive', ['bmw', 'vw', 'volkswagen', 'porsche', 'audi', 'zf', 'man']],
+  ['Consumer/Chemical', ['zalando', 'henkel', 'basf', 'merck', 'edeka']],
+  ['E-commerce/Startup', ['startup', 'gorillas', 'tier', 'hellofresh', 'researchgate']],
+  ['Healthcare/Logistics', ['healthcare', 'roche', 'fresenius', 'fraport']],
+  ['Transportation', ['lufthansa', 'dhl', 'flixbus']],
+  ['Consulting', ['consulting', 'accenture', 'capgemini']],
+];
+
+const isoDate = (d: Date): string =>
+  `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}-${String(d.getDate()).padStart(2, '0')}`;
+
+export function summarize(applications: JobApplication[]): AnalyticsSummary {
+  const statusCounts: Record<string, number> = {};
+  applications.forEach(app => {
+    statusCounts[app.status] = (statusCounts[app.status] || 0) + 1;
+  });
+  const count = (statuses: string[]) => statuses.reduce((n, s) => n + (statusCounts[s] || 0), 0);
+  return {
+    total: applications.length,
+    responded: applications.filter(app => !NO_RESPONSE.includes(app.status)).length,
+    interviewed: count(INTERVIEW),
+    finalRound: statusCounts['Final Round'] || 0,
+    offers: statusCounts['Offer'] || 0,
+    rejected: statusCounts['Rejected'] || 0,
+    ghosted: statusCounts['Ghosted'] || 0,
+    easyApplied: applications.filter(app => app.easyApply).length,
+    statusCounts,
+  };
+}
+
+export function transitions(applications: JobApplication[]): TransitionData {
+  const counts = new Map<string, number>();
+  let untracked = 0;
+  applications.forEach(app => {
+    if (!app.history || app.history.length === 0) {
+      untracked++;
+      return;
+    }
+    app.history.forEach(record => {
+      const key = `${record.oldStatus || 'Applied'}|${record.newStatus}`;
+      counts.set(key, (counts.get(key) || 0) + 1);
+    });
+  });
+  const links = Array.from(counts.entries())
+    .map(([key, count]) => {
+      const [source, target] = key.split('|');
+      return { source, target, count };
+    })
+    .sort((a, b) => b.count - a.count);
+  return { links, untracked };
+}
+
+export function weeklyTimeline(applications: JobApplication[], weeks = 26): TimelineWeek[] {
+  const monday = new Date();
+  monday.setHours(0, 0, 0, 0);
+  monday.setDate(monday.getDate() - ((monday.getDay() + 6) % 7));
+
+  const buckets = new Map<string, TimelineWeek>();
+  for (let i = weeks - 1; i >= 0; i--) {
+    const start = new Date(monday);
+    start.setDate(monday.getDate() - i * 7);
+    buckets.set(isoDate(start), { weekStart: isoDate(start), applications: 0, responded: 0 });
+  }
+
+  applications.forEach(app => {
+    const applied = new Date(`${app.appliedDate.split('T')[0]}T00:00:00`);
+    applied.setDate(applied.getDate() - ((applied.getDay() + 6) % 7));
+    const bucket = buckets.get(isoDate(applied));
+    if (bucket) {
+      bucket.applications++;
+      if (!NO_RESPONSE.includes(app.status)) bucket.responded++;
+    }
+  });
+  return Array.from(buckets.values());
+}
+
+export function topTechnologies(applications: JobApplication[], limit = 12): TopEntry[] {
+  const totals = new Map<string, TopEntry>();
+  applications.forEach(app => {
+    if (!app.techStack) return;
+    const techs = new Set(app.techStack.split(/[,/&+]+/).map(tech => tech.trim()).filter(tech => tech.length > 1));
+    techs.forEach(tech => {
+      const entry = totals.get(tech) || { key: tech, applications: 0, responded: 0, offers: 0 };
+      entry.applications++;
+      if (!NO_RESPONSE.includes(app.status)) entry.responded++;
+      if (app.status === 'Offer') entry.offers++;
+      totals.set(tech, entry);
+    });
+  });
+  return Array.from(totals.values())
+    .sort((a, b) => b.applications - a.applications || a.key.localeCompare(b.key))
+    .slice(0, limit);
+}
+
+export function industries(applications: JobApplication[]): IndustryEntry[] {
+  const totals = new Map<string, IndustryEntry & { names: Set<string> }>();
+  applications.forEach(app => {
+    const company = app.companyName.toLowerCase();
+    const match = INDUSTRIES.find(([, keywords]) => keywords.some(keyword => company.includes(keyword)));
+    const key = match ? match[0] : 'Other';
+    const entry = totals.get(key) || { key, companies: 0, applications: 0, responded: 0, offers: 0, names: new Set<string>() };
+    entry.names.add(app.companyName);
+    entry.applications++;
+    if (!NO_RESPONSE.includes(app.status)) entry.responded++;
+    if (app.status === 'Offer') entry.offers++;
+    totals.set(key, entry);
+  });
+  return Array.from(totals.values())
+    .map(({ names, ...entry }) => ({ ...entry, companies: names.size }))
+    .sort((a, b) => b.applications - a.applications || a.key.localeCompare(b.key));
+}
+
+export function locations(applications: JobApplication[]): LocationEntry[] {
+  const totals = new Map<string, LocationEntry>();
+  applications.forEach(app => {
+    const key = app.location.trim();
+    const entry = totals.get(key) || { key, applications: 0, statusCounts: {} };
+    entry.applications++;
+    entry.statusCounts[app.status] = (entry.statusCounts[app.status] || 0) + 1;
+    totals.set(key, entry);
+  });
+  return Array.from(totals.values())
+    .sort((a, b) => b.applications - a.applications || a.key.localeCompare(b.key));
+}